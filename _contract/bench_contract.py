@@ -0,0 +1,233 @@
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import build_contract
+from dedupe import hoist_shared_schemas
+from ref_graph import REF_PREFIX, RefGraph
+
+CONTRACT_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(CONTRACT_DIR, ".bench")
+DEFAULT_SIZES = (100, 1000, 10000, 50000)
+
+
+def _rename_refs(node, suffix):
+    if isinstance(node, dict):
+        out = {}
+        for key, value in node.items():
+            if key == "$ref" and isinstance(value, str) and value.startswith(REF_PREFIX):
+                out[key] = value + suffix
+            else:
+                out[key] = _rename_refs(value, suffix)
+        return out
+    if isinstance(node, list):
+        return [_rename_refs(item, suffix) for item in node]
+    return node
+
+
+def synthesize(operations):
+    # repeats the real components/endpoints under numbered copies until there
+    # are `operations` endpoints; each copy has its own schemas and paths
+    schemas = build_contract.components["schemas"]
+    table = build_contract.endpoints
+    out_schemas = {}
+    out_endpoints = []
+    copy = 0
+    while len(out_endpoints) < operations:
+        suffix = f"_{copy}" if copy else ""
+        prefix = f"/s{copy}" if copy else ""
+        for name, schema in schemas.items():
+            out_schemas[name + suffix] = _rename_refs(schema, suffix)
+        for ep in table:
+            if len(out_endpoints) == operations:
+                break
+            ep = _rename_refs(ep, suffix)
+            ep["path"] = prefix + ep["path"]
+            if ep.get("aliases"):
+                ep["aliases"] = [prefix + alias for alias in ep["aliases"]]
+            out_endpoints.append(ep)
+        copy += 1
+    return out_schemas, out_endpoints
+
+
+def _stages(schemas, table):
+    # name -> callable(previous results) -> result, run in this order
+    def yaml_safe_dump(state):
+        import yaml
+
+        return yaml.safe_dump(state["openapi"], sort_keys=False, allow_unicode=True)
+
+    return [
+        ("dedupe", lambda state: hoist_shared_schemas(schemas, table)),
+        ("paths", lambda state: build_contract.build_openapi(*state["dedupe"])),
+        ("contractEndpoints", lambda state: [build_contract.build_contract_endpoint(ep) for ep in state["dedupe"][1]]),
+        ("refIndex", lambda state: RefGraph(state["dedupe"][0], state["contractEndpoints"]).index()),
+        ("jsonDump", lambda state: json.dumps(
+            {
+                "components": {"schemas": state["dedupe"][0]},
+                "endpoints": state["contractEndpoints"],
+                "refIndex": state["refIndex"],
+            },
+            ensure_ascii=False, indent=2,
+        )),
+        ("toYaml", lambda state: build_contract.to_yaml(state["openapi"])),
+        ("writeYaml", lambda state: build_contract.write_yaml(state["openapi"], io.StringIO())),
+        ("yamlSafeDump", yaml_safe_dump),
+    ]
+
+
+# stage -> stages whose results it reads
+NEEDS = {
+    "paths": ["dedupe"],
+    "contractEndpoints": ["dedupe"],
+    "refIndex": ["dedupe", "contractEndpoints"],
+    "jsonDump": ["dedupe", "contractEndpoints", "refIndex"],
+    "toYaml": ["paths"],
+    "writeYaml": ["paths"],
+    "yamlSafeDump": ["paths"],
+}
+
+
+def _required(names):
+    # names plus everything they read from, transitively
+    out = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name not in out:
+            out.add(name)
+            pending.extend(NEEDS.get(name, ()))
+    return out
+
+
+def _store(state, name, result):
+    state["openapi" if name == "paths" else name] = result
+
+
+def run_size(operations, repeat, skip):
+    schemas, table = synthesize(operations)
+    results = {}
+    all_stages = _stages(schemas, table)
+    # a skipped stage that a measured one reads from still runs, once and untimed
+    needed = _required(name for name, _ in all_stages if name not in skip)
+    stages = [(name, fn) for name, fn in all_stages if name in needed]
+
+    # timing pass without tracemalloc, best of `repeat`
+    state = {}
+    for name, fn in stages:
+        if name in skip:
+            _store(state, name, fn(state))
+            results[name] = {"skipped": "--skip (run untimed for later stages)"}
+            continue
+        best = None
+        try:
+            for _ in range(repeat):
+                gc.collect()
+                start = time.perf_counter()
+                result = fn(state)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+        except ImportError as exc:
+            results[name] = {"skipped": str(exc)}
+            continue
+        _store(state, name, result)
+        results[name] = {"seconds": round(best, 6)}
+        if isinstance(result, str):
+            results[name]["bytes"] = len(result.encode("utf-8"))
+
+    # memory pass: peak bytes allocated while each stage runs
+    state = {}
+    for name, fn in stages:
+        if name in skip:
+            _store(state, name, fn(state))
+            continue
+        if "skipped" in results[name]:
+            continue
+        gc.collect()
+        tracemalloc.start()
+        result = fn(state)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _store(state, name, result)
+        results[name]["peakBytes"] = peak
+    del state
+    return {"operations": len(table), "schemas": len(schemas), "stages": results}
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=CONTRACT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(previous, current):
+    # "<operations> <stage>" -> current/previous seconds ratio
+    ratios = {}
+    old = {run["operations"]: run["stages"] for run in previous["runs"]}
+    for run in current["runs"]:
+        for stage, result in run["stages"].items():
+            before = (old.get(run["operations"]) or {}).get(stage) or {}
+            if "seconds" in result and before.get("seconds"):
+                ratios[f"{run['operations']} {stage}"] = round(result["seconds"] / before["seconds"], 3)
+    return ratios
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark build_contract.py stages on synthesized specs")
+    parser.add_argument("--sizes", type=lambda s: [int(x) for x in s.split(",")], default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage; the fastest is kept")
+    parser.add_argument("--skip", action="append", default=[], help="stage to leave out, e.g. yamlSafeDump")
+    parser.add_argument("--output", help=f"results file (default: {RESULTS_DIR}/<commit>.json)")
+    parser.add_argument("--compare", help="earlier results file to print time ratios against")
+    args = parser.parse_args(argv)
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "createdAt": datetime.utcnow().isoformat() + "Z",
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "runs": [],
+    }
+    for operations in args.sizes:
+        run = run_size(operations, args.repeat, set(args.skip))
+        report["runs"].append(run)
+        line = ", ".join(
+            f"{name} {result['seconds']:.3f}s/{result['peakBytes'] / 1e6:.1f}MB"
+            for name, result in run["stages"].items()
+            if "seconds" in result
+        )
+        print(f"{run['operations']:>6} ops: {line}", file=sys.stderr)
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    report["maxRssBytes"] = maxrss if sys.platform == "darwin" else maxrss * 1024
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    print("Wrote", output, file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        json.dump(compare(previous, report), sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,37 +1,88 @@
+import argparse
+import cProfile
+import functools
+import hashlib
+import io
 import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
 from datetime import datetime
 
-try:
-    import yaml  # type: ignore
-except ImportError:  # pragma: no cover
-    yaml = None
+_encode_scalar = json.JSONEncoder(ensure_ascii=False).encode
 
-def to_yaml(data):
-    if yaml is not None:
-        return yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
-    # minimal fallback YAML emitter
-    def emit(obj, indent=0):
-        sp = '  ' * indent
-        if isinstance(obj, dict):
-            lines = []
-            for k, v in obj.items():
-                if isinstance(v, (dict, list)):
-                    lines.append(f"{sp}{k}:")
-                    lines.append(emit(v, indent + 1))
-                else:
-                    lines.append(f"{sp}{k}: {json.dumps(v, ensure_ascii=False)}")
-            return '\n'.join(lines)
-        if isinstance(obj, list):
-            lines = []
-            for item in obj:
-                if isinstance(item, (dict, list)):
-                    lines.append(f"{sp}-")
-                    lines.append(emit(item, indent + 1))
+
+class _EncodedStrings(dict):
+    def __missing__(self, key):
+        text = self[key] = _encode_scalar(key)
+        return text
+
+
+def write_yaml(data, f, chunk_size=4096):
+    # streaming YAML emitter: explicit stack instead of recursion, lines are
+    # buffered in small chunks and written straight to f. The output does not
+    # depend on whether PyYAML is installed.
+    if not isinstance(data, (dict, list)):
+        f.write(_encode_scalar(data))
+        return
+
+    encode = _encode_scalar
+    strings = _EncodedStrings()
+    out = []
+    append = out.append
+    # every line is buffered with a leading newline; the first one is dropped
+    skip = 1
+    if not data:
+        append("\n")
+    stack = [(iter(data.items()) if isinstance(data, dict) else iter(data), "", isinstance(data, dict))]
+    while stack:
+        if len(out) >= chunk_size:
+            f.write("".join(out)[skip:])
+            out.clear()
+            skip = 0
+        it, sp, is_map = stack[-1]
+        for entry in it:
+            if is_map:
+                k, v = entry
+                head = f"\n{sp}{k}:"
+            else:
+                v = entry
+                head = f"\n{sp}-"
+            if not isinstance(v, (dict, list)):
+                append(f"{head} {strings[v] if type(v) is str else encode(v)}")
+                continue
+            append(head)
+            if not v:
+                append("\n")
+                continue
+            child_sp = sp + "  "
+            if isinstance(v, dict):
+                for child in v.values():
+                    if isinstance(child, (dict, list)):
+                        stack.append((iter(v.items()), child_sp, True))
+                        break
                 else:
-                    lines.append(f"{sp}- {json.dumps(item, ensure_ascii=False)}")
-            return '\n'.join(lines)
-        return f"{sp}{json.dumps(obj, ensure_ascii=False)}"
-    return emit(data)
+                    # fast path for scalar-only mappings
+                    out.extend([
+                        f"\n{child_sp}{ck}: {strings[cv] if type(cv) is str else encode(cv)}"
+                        for ck, cv in v.items()
+                    ])
+                    continue
+            else:
+                stack.append((iter(v), child_sp, False))
+            break
+        else:
+            stack.pop()
+    f.write("".join(out)[skip:])
+
+
+def to_yaml(data):
+    buf = io.StringIO()
+    write_yaml(data, buf)
+    return buf.getvalue()
+
 
 components = {
     "schemas": {
@@ -132,6 +183,7 @@ components = {
                 "headline": {"type": "string"},
                 "bio": {"type": "string"},
                 "avatarUri": {"type": "string"},
+                "adminOverride": {"type": "boolean"},
             },
         },
         "UserSummary": {
@@ -510,12 +562,49 @@ endpoints = [
             "302": {"description": "Redirect to /docs"}
         },
     },
+    {
+        "path": "/{fallbackPath}",
+        "method": "post",
+        "summary": "Legacy sequential POST fallback",
+        "description": "Handles legacy mobile POST attempts that still probe multiple candidates (e.g., tryPostJsonSequential). Returns 410 until a canonical endpoint is agreed.",
+        "operationId": "legacyFallbackPost",
+        "tags": ["legacy"],
+        "public": False,
+        "parameters": [
+            {
+                "name": "fallbackPath",
+                "in": "path",
+                "required": True,
+                "description": "First path segment captured by the wildcard route; full requested path is echoed in the response body.",
+                "schema": {"type": "string"},
+            }
+        ],
+        "requestBody": {"required": False, "schema": {"type": "object", "additionalProperties": True}},
+        "responses": {
+            "410": {
+                "description": "Legacy path is no longer supported; client should switch to the canonical POST.",
+                "content": {
+                    "application/json": {
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "message": {"type": "string"},
+                                "requestedPath": {"type": "string"},
+                            },
+                        }
+                    }
+                },
+            },
+            "501": {"description": "Placeholder until legacy bridging logic is implemented."},
+        },
+    },
     {
         "path": "/health",
         "method": "get",
         "summary": "Health check",
         "tags": ["health"],
         "public": True,
+        "cache": {"ttl": 5, "staleWhileRevalidate": 0, "varyOnAuth": False},
         "responses": {
             "200": {
                 "description": "Service health",
@@ -529,6 +618,7 @@ endpoints = [
         "summary": "Email signup",
         "tags": ["auth"],
         "public": True,
+        "rateLimit": {"capacity": 5, "refillPerSec": 0.05, "key": "ip"},
         "aliases": ["/auth/signup", "/auth/register", "/auth/users/signup", "/auth/users/register"],
         "requestBody": {"schema": {"$ref": "#/components/schemas/AuthEmailSignupRequest"}},
         "responses": {
@@ -542,6 +632,7 @@ endpoints = [
         "summary": "Email login",
         "tags": ["auth"],
         "public": True,
+        "rateLimit": {"capacity": 10, "refillPerSec": 0.1, "key": "ip"},
         "aliases": ["/auth/login"],
         "requestBody": {"schema": {"$ref": "#/components/schemas/AuthEmailLoginRequest"}},
         "responses": {
@@ -566,6 +657,7 @@ endpoints = [
         "summary": "Request phone OTP",
         "tags": ["auth"],
         "public": True,
+        "rateLimit": {"capacity": 3, "refillPerSec": 0.0167, "key": "ip"},
         "requestBody": {"schema": {"$ref": "#/components/schemas/AuthPhoneRequestOtp"}},
         "responses": {
             "200": {"description": "OTP issued", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/AuthPhoneRequestOtpResponse"}}}},
@@ -578,6 +670,7 @@ endpoints = [
         "summary": "Verify phone OTP",
         "tags": ["auth"],
         "public": True,
+        "rateLimit": {"capacity": 5, "refillPerSec": 0.1, "key": "ip"},
         "requestBody": {"schema": {"$ref": "#/components/schemas/AuthPhoneVerifyRequest"}},
         "responses": {
             "200": {
@@ -749,6 +842,7 @@ endpoints = [
         "summary": "Create post",
         "tags": ["posts"],
         "public": False,
+        "rateLimit": {"capacity": 5, "refillPerSec": 0.1, "key": "user"},
         "requestBody": {"schema": {"$ref": "#/components/schemas/CreatePostRequest"}},
         "responses": {
             "201": {"description": "Created", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Post"}}}},
@@ -780,6 +874,7 @@ endpoints = [
         "summary": "List topics",
         "tags": ["topics"],
         "public": False,
+        "cache": {"ttl": 60, "staleWhileRevalidate": 300, "varyOnAuth": True},
         "responses": {
             "200": {"description": "Topics", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/Topic"}}}}},
         },
@@ -790,6 +885,7 @@ endpoints = [
         "summary": "Discover users",
         "tags": ["discover"],
         "public": False,
+        "rateLimit": {"capacity": 20, "refillPerSec": 2, "key": "user"},
         "responses": {
             "200": {"description": "Matches", "content": {"application/json": {"schema": {"type": "object", "properties": {"ok": {"type": "boolean"}, "data": {"type": "array", "items": {"$ref": "#/components/schemas/DiscoverUser"}}}}}}},
         },
@@ -800,6 +896,7 @@ endpoints = [
         "summary": "Send friend request",
         "tags": ["friendships"],
         "public": False,
+        "rateLimit": {"capacity": 10, "refillPerSec": 0.2, "key": "user"},
         "requestBody": {"schema": {"$ref": "#/components/schemas/FriendshipRequest"}},
         "responses": {
             "200": {"description": "Created", "content": {"application/json": {"schema": {"type": "object", "properties": {"ok": {"type": "boolean"}, "data": {"$ref": "#/components/schemas/Friendship"}}}}}},
@@ -861,6 +958,7 @@ endpoints = [
         "summary": "Send message",
         "tags": ["chats"],
         "public": False,
+        "rateLimit": {"capacity": 30, "refillPerSec": 2, "key": "user"},
         "requestBody": {"schema": {"$ref": "#/components/schemas/ChatMessageRequest"}},
         "responses": {
             "200": {"description": "Message", "content": {"application/json": {"schema": {"type": "object", "additionalProperties": True}}}},
@@ -897,6 +995,7 @@ endpoints = [
         "summary": "List point products",
         "tags": ["store"],
         "public": True,
+        "cache": {"ttl": 300, "staleWhileRevalidate": 600, "varyOnAuth": False},
         "responses": {
             "200": {"description": "Products", "content": {"application/json": {"schema": {"type": "object", "properties": {"items": {"type": "array", "items": {"$ref": "#/components/schemas/PointProduct"}}}}}}},
         },
@@ -907,6 +1006,7 @@ endpoints = [
         "summary": "Confirm purchase",
         "tags": ["store"],
         "public": False,
+        "rateLimit": {"capacity": 5, "refillPerSec": 0.5, "key": "user"},
         "requestBody": {"schema": {"$ref": "#/components/schemas/ConfirmPurchaseRequest"}},
         "responses": {
             "200": {"description": "Balance", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/ConfirmPurchaseResponse"}}}},
@@ -920,6 +1020,7 @@ endpoints = [
         "summary": "List gifts",
         "tags": ["gifts"],
         "public": True,
+        "cache": {"ttl": 300, "staleWhileRevalidate": 600, "varyOnAuth": False},
         "responses": {
             "200": {"description": "Gifts", "content": {"application/json": {"schema": {"type": "object", "properties": {"ok": {"type": "boolean"}, "data": {"type": "array", "items": {"$ref": "#/components/schemas/GiftItem"}}, "items": {"type": "array", "items": {"$ref": "#/components/schemas/GiftItem"}}}}}}},
         },
@@ -930,6 +1031,7 @@ endpoints = [
         "summary": "Get legal document",
         "tags": ["legal"],
         "public": True,
+        "cache": {"ttl": 3600, "staleWhileRevalidate": 86400, "varyOnAuth": False},
         "responses": {
             "200": {"description": "Document", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/LegalDocument"}}}},
             "404": {"description": "Not found"},
@@ -1043,6 +1145,7 @@ endpoints = [
         "summary": "Report content",
         "tags": ["community"],
         "public": False,
+        "rateLimit": {"capacity": 5, "refillPerSec": 0.05, "key": "user"},
         "requestBody": {"schema": {"$ref": "#/components/schemas/CommunityReport"}},
         "responses": {
             "200": {"description": "Reported", "content": {"application/json": {"schema": {"type": "object", "properties": {"ok": {"type": "boolean"}, "id": {"type": "string"}}}}}},
@@ -1065,6 +1168,7 @@ endpoints = [
         "summary": "Translate text",
         "tags": ["translate"],
         "public": False,
+        "rateLimit": {"capacity": 20, "refillPerSec": 1, "key": "user"},
         "requestBody": {"schema": {"$ref": "#/components/schemas/TranslateRequest"}},
         "responses": {
             "200": {"description": "Translated", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/TranslateResponse"}}}},
@@ -1142,7 +1246,7 @@ security_schemes = {
     }
 }
 
-openapi = {
+openapi_header = {
     "openapi": "3.1.0",
     "info": {
         "title": "tok-friends API",
@@ -1153,35 +1257,99 @@ openapi = {
         {"url": "https://api.tokfriends.app", "description": "Production (example)"},
         {"url": "http://localhost:4000", "description": "Local"},
     ],
-    "components": {
-        "schemas": components["schemas"],
-        "securitySchemes": security_schemes,
-    },
-    "paths": {},
 }
 
-contract_endpoints = []
-for ep in endpoints:
-    path_item = openapi["paths"].setdefault(ep["path"], {})
+CONTRACT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(CONTRACT_DIR)
+MANIFEST_PATH = os.path.join(CONTRACT_DIR, ".build-manifest.json")
+CONTRACT_JSON_PATH = os.path.join(CONTRACT_DIR, "api-contract.json")
+OPENAPI_YAML_PATH = os.path.join(CONTRACT_DIR, "openapi.yaml")
+CONTRACT_BIN_PATH = os.path.join(CONTRACT_DIR, "api-contract.bin")
+NGINX_CACHE_PATH = os.path.join(REPO_ROOT, "infra", "nginx-api-cache.conf")
+ARTIFACTS = {
+    "_contract/api-contract.json": CONTRACT_JSON_PATH,
+    "_contract/api-contract.bin": CONTRACT_BIN_PATH,
+    "_contract/openapi.yaml": OPENAPI_YAML_PATH,
+    "infra/nginx-api-cache.conf": NGINX_CACHE_PATH,
+}
+# modules whose code shapes the artifacts; editing any of them forces a rebuild
+GENERATOR_MODULES = [
+    "build_contract.py",
+    "dedupe.py",
+    "ref_graph.py",
+    "nginx_cache.py",
+    "contract_binary.py",
+    "extract_endpoints.py",
+]
+PHASES_PATH = os.path.join(CONTRACT_DIR, "build-phases.json")
+PROFILE_PATH = os.path.join(CONTRACT_DIR, "build-profile.prof")
+
+# Everything below is built on first use and cached, so importing this module
+# only costs the table literals above. Cached values are shared between
+# callers and must not be mutated.
+
+
+@functools.lru_cache(maxsize=None)
+def _controller_endpoints():
+    from extract_endpoints import extract_endpoints, merge_endpoints
+
+    extracted, _ = extract_endpoints(REPO_ROOT)
+    return merge_endpoints(extracted, endpoints)
+
+
+def _source_endpoints(from_controllers=False):
+    return _controller_endpoints()[0] if from_controllers else endpoints
+
+
+@functools.lru_cache(maxsize=None)
+def _normalized(from_controllers=False):
+    # inline shapes repeated across operations become shared component $refs
+    from dedupe import hoist_shared_schemas
+
+    schemas, table = hoist_shared_schemas(components["schemas"], _source_endpoints(from_controllers))
+    return {**components, "schemas": schemas}, table
+
+
+def get_components(from_controllers=False):
+    return _normalized(from_controllers)[0]
+
+
+def get_endpoints(from_controllers=False):
+    return _normalized(from_controllers)[1]
+
+
+def iter_endpoints(from_controllers=False):
+    return iter(get_endpoints(from_controllers))
+
+
+def build_operation(ep):
     op = {
         "summary": ep.get("summary"),
         "tags": ep.get("tags"),
         "responses": ep.get("responses", {}),
     }
+    for key in ("description", "operationId", "parameters"):
+        if key in ep:
+            op[key] = ep[key]
     if not ep.get("public", False):
         op["security"] = [{"bearerAuth": []}]
     if "requestBody" in ep:
         schema = ep["requestBody"].get("schema", {"type": "object"})
         op["requestBody"] = {
-            "required": True,
+            "required": ep["requestBody"].get("required", True),
             "content": {"application/json": {"schema": schema}},
         }
     if "aliases" in ep:
         op["description"] = (op.get("description") or "") + f" Aliases: {', '.join(ep['aliases'])}."
-    method = ep["method"].lower()
-    path_item[method] = op
+    if "cache" in ep:
+        op["x-cache"] = ep["cache"]
+    if "rateLimit" in ep:
+        op["x-rate-limit"] = ep["rateLimit"]
+    return op
 
-    contract_endpoints.append({
+
+def build_contract_endpoint(ep):
+    out = {
         "path": ep["path"],
         "method": ep["method"].upper(),
         "summary": ep.get("summary"),
@@ -1190,27 +1358,328 @@ for ep in endpoints:
         "aliases": ep.get("aliases", []),
         "requestSchema": ep.get("requestBody", {}).get("schema"),
         "responses": ep.get("responses"),
-    })
-
-metadata = {
-    "generatedAt": datetime.utcnow().isoformat() + "Z",
-    "endpointCount": len(contract_endpoints),
-    "authentication": {
-        "default": "bearer",
-        "publicEndpoints": [ep["path"] for ep in contract_endpoints if ep["public"]],
-    },
-}
+    }
+    if "cache" in ep:
+        out["cache"] = ep["cache"]
+    if "rateLimit" in ep:
+        out["rateLimit"] = ep["rateLimit"]
+    return out
 
-api_contract = {
-    "metadata": metadata,
-    "components": components,
-    "endpoints": contract_endpoints,
-}
 
-with open("_contract/api-contract.json", "w", encoding="utf-8") as f:
-    json.dump(api_contract, f, ensure_ascii=False, indent=2)
+def build_paths(table):
+    paths = {}
+    for ep in table:
+        path_item = paths.setdefault(ep["path"], {})
+        path_item[ep["method"].lower()] = build_operation(ep)
+    return paths
+
+
+def build_openapi(schemas, table):
+    openapi = dict(openapi_header)
+    openapi["components"] = {
+        "schemas": schemas,
+        "securitySchemes": security_schemes,
+    }
+    openapi["paths"] = build_paths(table)
+    return openapi
+
+
+@functools.lru_cache(maxsize=None)
+def get_openapi(from_controllers=False):
+    return build_openapi(get_components(from_controllers)["schemas"], get_endpoints(from_controllers))
+
+
+@functools.lru_cache(maxsize=None)
+def get_contract_endpoints(from_controllers=False):
+    return [build_contract_endpoint(ep) for ep in iter_endpoints(from_controllers)]
+
+
+@functools.lru_cache(maxsize=None)
+def get_ref_graph(from_controllers=False):
+    from ref_graph import RefGraph
+
+    return RefGraph(get_components(from_controllers)["schemas"], get_contract_endpoints(from_controllers))
+
+
+def get_metadata(generated_at=None, from_controllers=False):
+    contract_endpoints = get_contract_endpoints(from_controllers)
+    return {
+        "generatedAt": generated_at or datetime.utcnow().isoformat() + "Z",
+        "endpointCount": len(contract_endpoints),
+        "authentication": {
+            "default": "bearer",
+            "publicEndpoints": [ep["path"] for ep in contract_endpoints if ep["public"]],
+        },
+    }
+
+
+def get_api_contract(generated_at=None, from_controllers=False):
+    return {
+        "metadata": get_metadata(generated_at, from_controllers),
+        "components": get_components(from_controllers),
+        "endpoints": get_contract_endpoints(from_controllers),
+        # consumers can look up what one endpoint needs without re-walking the document
+        "refIndex": get_ref_graph(from_controllers).index(),
+    }
+
+
+def load_contract(path=None):
+    # the emitted artifact when a path is given, otherwise the in-memory tables
+    if path:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return {"components": get_components(), "endpoints": get_contract_endpoints()}
+
+
+def canonical_hash(obj):
+    data = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def file_hash(path):
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def code_hash():
+    h = hashlib.sha256()
+    for name in GENERATOR_MODULES:
+        with open(os.path.join(CONTRACT_DIR, name), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def changed_keys(previous, current):
+    previous = previous or {}
+    return sorted(k for k in set(previous) | set(current) if previous.get(k) != current.get(k))
+
+
+def item_hashes(contract):
+    # per-schema and per-path digests, computed from contract endpoints so the
+    # committed api-contract.json yields the same keys when there is no manifest
+    paths = {}
+    for ep in contract["endpoints"]:
+        paths.setdefault(ep["path"], []).append(ep)
+    return {
+        "schemas": {name: canonical_hash(schema) for name, schema in contract["components"]["schemas"].items()},
+        "paths": {path: canonical_hash(eps) for path, eps in paths.items()},
+    }
+
+
+def build_manifest(from_controllers=False):
+    contract = {"components": get_components(from_controllers), "endpoints": get_contract_endpoints(from_controllers)}
+    return {
+        "version": 3,
+        "code": code_hash(),
+        "components": canonical_hash(components),
+        "endpoints": canonical_hash(_source_endpoints(from_controllers)),
+        "header": canonical_hash([openapi_header, security_schemes]),
+        **item_hashes(contract),
+    }
+
+
+def keep_generated_at(api_contract, committed):
+    # a contract identical to the committed one keeps its generatedAt, so a
+    # rebuild on a fresh checkout (no manifest) leaves api-contract.json as is
+    if not committed:
+        return api_contract
+    stamp = (committed.get("metadata") or {}).get("generatedAt")
+    candidate = dict(api_contract, metadata=dict(api_contract["metadata"], generatedAt=stamp))
+    return candidate if candidate == committed else api_contract
+
+
+class PhaseRecorder:
+    # wall time, tracemalloc peak and output size per build phase; when
+    # disabled, run() is a plain call
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.phases = {}
+        self.calls = {}
+        if enabled:
+            tracemalloc.start()
+
+    def run(self, name, fn, *args, artifact=None):
+        if not self.enabled:
+            return fn(*args)
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        phase = {"seconds": round(elapsed, 6), "peakBytes": peak - baseline}
+        if artifact is not None:
+            phase["bytes"] = os.path.getsize(artifact)
+        self.phases[name] = phase
+        # cached accessors are re-run through their uncached function when profiled
+        self.calls[name] = (getattr(fn, "__wrapped__", fn), args)
+        return result
+
+    def slowest(self):
+        return max(self.phases, key=lambda name: self.phases[name]["seconds"], default=None)
+
+    def profile(self, name, path):
+        fn, args = self.calls[name]
+        tracemalloc.stop()
+        profiler = cProfile.Profile()
+        profiler.runcall(fn, *args)
+        profiler.dump_stats(path)
+        return pstats.Stats(profiler, stream=sys.stderr)
+
+    def write(self, path, **extra):
+        data = {"phases": self.phases, "slowest": self.slowest(), **extra}
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+
+def write_json(data, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def write_yaml_file(data, path):
+    with open(path, "w", encoding="utf-8") as f:
+        write_yaml(data, f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate _contract/api-contract.json, api-contract.bin, openapi.yaml and infra/nginx-api-cache.conf")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="skip emission when the hashed components/endpoints match the build manifest",
+    )
+    parser.add_argument(
+        "--from-controllers",
+        action="store_true",
+        help="take paths, methods, aliases and public flags from the NestJS controllers; the table only supplies docs and schemas",
+    )
+    parser.add_argument(
+        "--publish",
+        nargs="?",
+        const="_contract/dist",
+        metavar="DIR",
+        help="also write canonical minified JSON and the YAML with .gz/.br/.zst siblings for nginx gzip_static",
+    )
+    parser.add_argument(
+        "--encoders",
+        nargs="?",
+        const="_contract/schema_encoders.py",
+        metavar="PATH",
+        help="also write a module with one compiled JSON encoder per component schema",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help=f"record time, tracemalloc peak and output size per phase in {os.path.basename(PHASES_PATH)}",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"with --timings, also re-run the slowest phase under cProfile into {os.path.basename(PROFILE_PATH)}",
+    )
+    args = parser.parse_args(argv)
+
+    fc = args.from_controllers
+    phases = PhaseRecorder(args.timings or args.profile)
+    if fc:
+        _, stale, undocumented = phases.run("controllers", _controller_endpoints)
+        for ep in undocumented:
+            print("Undocumented (no schemas in table):", ep["method"].upper(), ep["path"], f"({ep['source']})")
+        for ep in stale:
+            print("Stale table entry (no controller route):", ep["method"].upper(), ep["path"])
+
+    phases.run("openapi", get_openapi, fc)
+    phases.run("contractEndpoints", get_contract_endpoints, fc)
+    phases.run("refGraph", get_ref_graph, fc)
+    manifest = phases.run("manifest", build_manifest, fc)
+    previous = load_json(MANIFEST_PATH) if args.incremental else None
+    unchanged = (
+        previous is not None
+        and all(previous.get(k) == manifest[k] for k in ("version", "code", "components", "endpoints", "header"))
+        and set(previous.get("artifacts") or {}) == set(ARTIFACTS)
+        and all(file_hash(ARTIFACTS[name]) == digest for name, digest in previous["artifacts"].items())
+    )
+    endpoint_count = len(get_contract_endpoints(fc))
+    if unchanged:
+        print("Contract unchanged for", endpoint_count, "endpoints; skipped emission")
+    else:
+        committed = load_json(CONTRACT_JSON_PATH)
+        api_contract = keep_generated_at(phases.run("apiContract", get_api_contract, None, fc), committed)
+        phases.run("json", write_json, api_contract, CONTRACT_JSON_PATH, artifact=CONTRACT_JSON_PATH)
+
+        # random-access form for sidecars and test workers that only need a few operations
+        from contract_binary import write_contract
+
+        phases.run("binary", write_contract, api_contract, CONTRACT_BIN_PATH, artifact=CONTRACT_BIN_PATH)
+        phases.run("yaml", write_yaml_file, get_openapi(fc), OPENAPI_YAML_PATH, artifact=OPENAPI_YAML_PATH)
+
+        # proxy_cache locations for the operations with cache hints
+        from nginx_cache import write_nginx_cache
+
+        phases.run("nginxCache", write_nginx_cache, api_contract, NGINX_CACHE_PATH, artifact=NGINX_CACHE_PATH)
+
+        if args.publish:
+            from publish import canonical_contract, publish
+
+            with open(OPENAPI_YAML_PATH, "rb") as f:
+                files = {"api-contract.json": canonical_contract(api_contract), "openapi.yaml": f.read()}
+            out_dir = os.path.join(REPO_ROOT, args.publish)
+            for name, sizes in phases.run("publish", publish, files, out_dir).items():
+                print(f"Published {name}:", ", ".join(f"{ext or 'raw'} {size}" for ext, size in sizes.items()))
+
+        if args.incremental:
+            manifest["generatedAt"] = api_contract["metadata"]["generatedAt"]
+            manifest["artifacts"] = {name: file_hash(path) for name, path in ARTIFACTS.items()}
+            # consumers re-run only what is listed here instead of everything
+            # downstream of the spec; without a manifest the committed contract
+            # is the baseline
+            baseline = previous or (item_hashes(committed) if committed else {})
+            manifest["changed"] = {
+                "schemas": changed_keys(baseline.get("schemas"), manifest["schemas"]),
+                "paths": changed_keys(baseline.get("paths"), manifest["paths"]),
+            }
+            tmp_path = MANIFEST_PATH + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, MANIFEST_PATH)
+        print("Generated contract for", endpoint_count, "endpoints")
+
+    if args.encoders:
+        # rewritten only when the generated source changes, so it also runs on skipped builds
+        from json_encoders import write_module
+
+        path = os.path.join(REPO_ROOT, args.encoders)
+        if phases.run("encoders", write_module, get_components(fc)["schemas"], path):
+            print("Wrote", os.path.relpath(path))
+
+    if phases.enabled:
+        slowest = phases.slowest()
+        if args.profile:
+            phases.profile(slowest, PROFILE_PATH).sort_stats("cumulative").print_stats(25)
+        phases.write(
+            PHASES_PATH,
+            generatedAt=datetime.utcnow().isoformat() + "Z",
+            endpointCount=endpoint_count,
+            skipped=unchanged,
+            profile=os.path.basename(PROFILE_PATH) if args.profile else None,
+        )
+        print(f"Phase timings in {os.path.relpath(PHASES_PATH)} (slowest: {slowest})")
+    return 0
 
-with open("_contract/openapi.yaml", "w", encoding="utf-8") as f:
-    f.write(to_yaml(openapi))
 
-print("Generated contract for", len(contract_endpoints), "endpoints")
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,657 @@
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from ref_graph import REF_PREFIX
+
+CONTRACT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(CONTRACT_DIR)
+
+# target -> output directory (relative to the repo root) and renderer name
+TARGETS = {
+    "typescript": "apps/admin/src/lib/generated",
+    "dart": "apps/mobile/lib/api/generated",
+}
+HEADER = "Generated by _contract/codegen.py from _contract/build_contract.py. Do not edit."
+
+_PARAM = re.compile(r"\{(\w+)\}")
+_DART_RESERVED = {
+    "abstract", "as", "assert", "async", "await", "break", "case", "catch", "class", "const", "continue",
+    "default", "do", "dynamic", "else", "enum", "export", "extends", "external", "factory", "false", "final",
+    "finally", "for", "get", "if", "implements", "import", "in", "is", "library", "new", "null", "operator",
+    "part", "required", "rethrow", "return", "set", "static", "super", "switch", "this", "throw", "true", "try",
+    "typedef", "var", "void", "while", "with", "yield",
+}
+
+
+def _pascal(name):
+    return "".join(part[:1].upper() + part[1:] for part in re.split(r"[^A-Za-z0-9]+", name) if part)
+
+
+def _camel(name):
+    pascal = _pascal(name)
+    return pascal[:1].lower() + pascal[1:]
+
+
+def _ref_name(schema):
+    ref = schema.get("$ref") if isinstance(schema, dict) else None
+    return ref[len(REF_PREFIX):] if isinstance(ref, str) and ref.startswith(REF_PREFIX) else None
+
+
+def _types(schema):
+    # (non-null types, nullable)
+    types = schema.get("type")
+    if types is None:
+        return [], False
+    types = [types] if isinstance(types, str) else list(types)
+    nullable = "null" in types or bool(schema.get("nullable"))
+    return [t for t in types if t != "null"], nullable
+
+
+def operation_name(ep, taken):
+    parts = [ep["method"].lower()]
+    for segment in ep["path"].strip("/").split("/"):
+        match = _PARAM.fullmatch(segment)
+        parts.append("By" + _pascal(match.group(1)) if match else _pascal(segment))
+    name = parts[0] + "".join(parts[1:]) if ep["path"] != "/" else parts[0] + "Root"
+    base, n = name, 2
+    while name in taken:
+        name = f"{base}{n}"
+        n += 1
+    taken.add(name)
+    return name
+
+
+def success_response(ep):
+    # (status, json schema or None) of the lowest 2xx response
+    statuses = sorted(s for s in ep.get("responses") or {} if str(s).startswith("2"))
+    if not statuses:
+        return None, None
+    response = ep["responses"][statuses[0]]
+    return statuses[0], ((response.get("content") or {}).get("application/json") or {}).get("schema")
+
+
+# TypeScript
+
+
+def ts_type(schema, indent=""):
+    if not isinstance(schema, dict) or not schema:
+        return "unknown"
+    name = _ref_name(schema)
+    if name:
+        return name
+    if "enum" in schema:
+        return " | ".join(_ts_literal(v) for v in schema["enum"])
+    for key, joiner in (("oneOf", " | "), ("anyOf", " | "), ("allOf", " & ")):
+        if schema.get(key):
+            return joiner.join(f"({ts_type(s, indent)})" if " " in ts_type(s, indent) else ts_type(s, indent) for s in schema[key])
+    types, nullable = _types(schema)
+    if not types:
+        types = ["object"] if "properties" in schema else []
+    rendered = " | ".join(_ts_single(t, schema, indent) for t in types) or "unknown"
+    return rendered + " | null" if nullable else rendered
+
+
+def _ts_literal(value):
+    if isinstance(value, str):
+        return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+    return "null" if value is None else str(value).lower() if isinstance(value, bool) else str(value)
+
+
+def _ts_key(name):
+    return name if re.fullmatch(r"[A-Za-z_$][\w$]*", name) else _ts_literal(name)
+
+
+def _ts_single(kind, schema, indent):
+    if kind == "string":
+        return "string"
+    if kind in ("integer", "number"):
+        return "number"
+    if kind == "boolean":
+        return "boolean"
+    if kind == "array":
+        item = ts_type(schema.get("items"), indent)
+        return f"({item})[]" if " " in item else f"{item}[]"
+    if kind == "object":
+        props = schema.get("properties")
+        if not props:
+            return "Record<string, unknown>"
+        return _ts_object(schema, indent)
+    return "unknown"
+
+
+def _ts_object(schema, indent):
+    required = set(schema.get("required") or ())
+    inner = indent + "  "
+    lines = ["{"]
+    for key, prop in schema["properties"].items():
+        optional = "" if key in required else "?"
+        lines.append(f"{inner}{_ts_key(key)}{optional}: {ts_type(prop, inner)};")
+    if schema.get("additionalProperties") is True:
+        lines.append(f"{inner}[key: string]: unknown;")
+    lines.append(indent + "}")
+    return "\n".join(lines)
+
+
+def render_typescript(schemas, endpoints):
+    models = [f"// {HEADER}", ""]
+    for name, schema in schemas.items():
+        types, nullable = _types(schema)
+        if schema.get("properties") and types in ([], ["object"]) and not nullable and "oneOf" not in schema:
+            models.append(f"export interface {name} {_ts_object(schema, '')}")
+        else:
+            models.append(f"export type {name} = {ts_type(schema)};")
+        models.append("")
+
+    taken = set()
+    used = set()
+    functions = []
+    for ep in endpoints:
+        name = operation_name(ep, taken)
+        params = _PARAM.findall(ep["path"])
+        args = [f"{_camel(p)}: string | number" for p in params]
+        request = ep.get("requestSchema")
+        if request:
+            args.append(f"body: {ts_type(request, '    ')}")
+        if ep["method"] == "GET":
+            args.append("query?: Query")
+        _, response = success_response(ep)
+        result = ts_type(response, "    ") if response is not None else "void"
+        for schema in (request, response):
+            used.update(re.findall(r"\b[A-Z]\w*\b", ts_type(schema)) if schema else ())
+        path = _PARAM.sub(lambda m: "${encodeURIComponent(String(" + _camel(m.group(1)) + "))}", ep["path"])
+        auth = "false" if ep.get("public") else "true"
+        if ep["method"] == "GET":
+            call = f"get(`{path}`, {auth}, query)"
+        else:
+            collection = ep["path"].split("/{", 1)[0]
+            call = f"request('{ep['method']}', `{path}`, {'body' if request else 'undefined'}, {auth}, '{collection}')"
+        summary = f"    /** {ep['summary']} */\n" if ep.get("summary") else ""
+        functions.append(
+            f"{summary}    {name}: ({', '.join(args)}): Promise<{result}> =>\n"
+            f"      {call},"
+        )
+    used &= set(schemas)
+
+    client = [f"// {HEADER}", ""]
+    if used:
+        client.append("import type {")
+        client.extend(f"  {name}," for name in sorted(used))
+        client.append("} from './models';")
+        client.append("")
+    client.append(_TS_RUNTIME)
+    client.append("  return {")
+    client.append("    batch,")
+    client.append("    invalidate,")
+    client.extend(functions)
+    client.append("  };")
+    client.append("}")
+    client.append("")
+    client.append("export type ApiClient = ReturnType<typeof createApiClient>;")
+    client.append("")
+    return {"models.ts": "\n".join(models), "client.ts": "\n".join(client)}
+
+
+_TS_RUNTIME = """export type Query = Record<string, string | number | boolean | null | undefined>;
+
+export interface ApiClientOptions {
+  baseUrl: string;
+  getToken?: () => string | null | Promise<string | null>;
+  fetch?: typeof fetch;
+  /** GET responses kept for If-None-Match revalidation (default 100). */
+  cacheSize?: number;
+}
+
+export class ApiError extends Error {
+  constructor(public status: number, public body: unknown, message: string) {
+    super(message);
+  }
+}
+
+interface CacheEntry {
+  etag: string;
+  data: unknown;
+}
+
+interface QueuedGet {
+  url: string;
+  auth: boolean;
+  token: string | null | undefined;
+  resolve: (value: unknown) => void;
+  reject: (reason: unknown) => void;
+}
+
+export function createApiClient(options: ApiClientOptions) {
+  const baseUrl = options.baseUrl.replace(/\\/+$/, '');
+  const doFetch = options.fetch ?? fetch;
+  const cacheSize = options.cacheSize ?? 100;
+
+  // every GET goes through here: identical in-flight reads share one promise,
+  // reads issued in the same tick are dispatched together, and responses with
+  // an ETag are revalidated with If-None-Match instead of refetched
+  const inflight = new Map<string, Promise<unknown>>();
+  const cache = new Map<string, CacheEntry>();
+  let queue: QueuedGet[] = [];
+  let lastToken: string | null | undefined;
+
+  function buildUrl(path: string, query?: Query): string {
+    let url = baseUrl + path;
+    if (query) {
+      const params = new URLSearchParams();
+      for (const key of Object.keys(query).sort()) {
+        const value = query[key];
+        if (value !== undefined && value !== null) params.set(key, String(value));
+      }
+      const qs = params.toString();
+      if (qs) url += `?${qs}`;
+    }
+    return url;
+  }
+
+  async function tokenFor(auth: boolean): Promise<string | null | undefined> {
+    if (!auth) return undefined;
+    const token = (await options.getToken?.()) ?? null;
+    if (token !== lastToken) {
+      // another user's cached responses must not be served, and reads still
+      // in flight under the old token must not be shared with new callers
+      cache.clear();
+      inflight.clear();
+      lastToken = token;
+    }
+    return token;
+  }
+
+  function headersFor(token: string | null | undefined, body: boolean): Record<string, string> {
+    const headers: Record<string, string> = { Accept: 'application/json' };
+    if (body) headers['Content-Type'] = 'application/json';
+    if (token) headers['Authorization'] = `Bearer ${token}`;
+    return headers;
+  }
+
+  async function readBody(res: Response): Promise<unknown> {
+    if (res.status === 204) return undefined;
+    const data = await res.json().catch(() => undefined);
+    if (!res.ok) {
+      const message = (data && ((data as any).message || (data as any).error)) || `HTTP ${res.status}`;
+      throw new ApiError(res.status, data, String(message));
+    }
+    return data;
+  }
+
+  function remember(url: string, entry: CacheEntry) {
+    cache.delete(url);
+    cache.set(url, entry);
+    while (cache.size > cacheSize) cache.delete(cache.keys().next().value as string);
+  }
+
+  async function fetchGet(url: string, auth: boolean, token: string | null | undefined): Promise<unknown> {
+    const headers = headersFor(token, false);
+    const cached = cache.get(url);
+    if (cached) headers['If-None-Match'] = cached.etag;
+    const res = await doFetch(url, { method: 'GET', headers, cache: 'no-store' });
+    // the token changed while this was in flight: the caller still gets its
+    // answer, but it must not land in the next user's cache
+    const stale = () => auth && token !== lastToken;
+    if (res.status === 304 && cached) {
+      if (!stale()) remember(url, cached);
+      return cached.data;
+    }
+    const data = await readBody(res);
+    if (stale()) return data;
+    const etag = res.headers.get('ETag');
+    if (etag) remember(url, { etag, data });
+    else cache.delete(url);
+    return data;
+  }
+
+  function flush() {
+    const batch = queue;
+    queue = [];
+    for (const item of batch) fetchGet(item.url, item.auth, item.token).then(item.resolve, item.reject);
+  }
+
+  async function get<T>(path: string, auth: boolean, query?: Query): Promise<T> {
+    const url = buildUrl(path, query);
+    // the token is read before the in-flight lookup, so a switch drops reads
+    // started for the previous user instead of sharing them
+    const token = await tokenFor(auth);
+    const pending = inflight.get(url);
+    if (pending) return pending as Promise<T>;
+    const promise = new Promise<unknown>((resolve, reject) => {
+      if (queue.length === 0) queueMicrotask(flush);
+      queue.push({ url, auth, token, resolve, reject });
+    });
+    inflight.set(url, promise);
+    const done = () => {
+      if (inflight.get(url) === promise) inflight.delete(url);
+    };
+    promise.then(done, done);
+    return promise as Promise<T>;
+  }
+
+  function invalidate(pathPrefix = '') {
+    const prefix = baseUrl + pathPrefix;
+    // whole segments only: /posts covers /posts/1 and /posts?page=2, not /postsX
+    for (const url of Array.from(cache.keys())) {
+      if (url === prefix || url.startsWith(prefix + '/') || url.startsWith(prefix + '?')) cache.delete(url);
+    }
+  }
+
+  async function request<T>(method: string, path: string, body: unknown, auth: boolean, collection: string): Promise<T> {
+    const res = await doFetch(baseUrl + path, {
+      method,
+      headers: headersFor(await tokenFor(auth), body !== undefined),
+      body: body === undefined ? undefined : JSON.stringify(body),
+    });
+    const data = await readBody(res);
+    // a write makes cached reads of the same collection stale
+    invalidate(collection);
+    return data as T;
+  }
+
+  /** Issues several reads in the same tick; they share the batch's round of requests. */
+  function batch<T extends readonly unknown[]>(reads: readonly [...{ [K in keyof T]: () => Promise<T[K]> }]): Promise<T> {
+    return Promise.all(reads.map((read) => read())) as unknown as Promise<T>;
+  }
+"""
+
+
+# Dart
+
+
+class _DartModels:
+    # maps schemas to Dart types, collecting classes for inline objects as it goes
+    def __init__(self, schemas):
+        self.schemas = schemas
+        self.classes = {}
+        self.order = []
+
+    def _resolve(self, schema):
+        seen = set()
+        while _ref_name(schema) and _ref_name(schema) not in seen:
+            seen.add(_ref_name(schema))
+            target = self.schemas.get(_ref_name(schema))
+            if target is None or self._is_class(target):
+                break
+            schema = target
+        return schema
+
+    def _is_class(self, schema):
+        types, _ = _types(schema)
+        return bool(schema.get("properties")) and types in ([], ["object"])
+
+    def add_class(self, name, schema):
+        if name not in self.classes:
+            self.classes[name] = None
+            self.classes[name] = self._render_class(name, schema)
+            self.order.append(name)
+        return name
+
+    def type_of(self, schema, hint):
+        # (dart type without nullability, nullable)
+        if not isinstance(schema, dict) or not schema:
+            return "dynamic", False
+        name = _ref_name(schema)
+        if name:
+            target = self.schemas.get(name)
+            if target is not None and self._is_class(target):
+                return self.add_class(name, target), False
+            resolved = self._resolve(schema)
+            return ("dynamic", False) if _ref_name(resolved) else self.type_of(resolved, name)
+        if "enum" in schema:
+            values = schema["enum"]
+            if all(isinstance(v, str) for v in values):
+                return "String", None in values
+            return "dynamic", False
+        if schema.get("oneOf") or schema.get("anyOf") or schema.get("allOf"):
+            return "dynamic", False
+        types, nullable = _types(schema)
+        if not types and "properties" in schema:
+            types = ["object"]
+        if len(types) != 1:
+            return "dynamic", False
+        kind = types[0]
+        if kind == "string":
+            return "String", nullable
+        if kind == "integer":
+            return "int", nullable
+        if kind == "number":
+            return "num", nullable
+        if kind == "boolean":
+            return "bool", nullable
+        if kind == "array":
+            item, item_nullable = self.type_of(schema.get("items"), hint + "Item")
+            return f"List<{item}{'?' if item_nullable and item != 'dynamic' else ''}>", nullable
+        if kind == "object" and schema.get("properties"):
+            return self.add_class(_pascal(hint), schema), nullable
+        return "Map<String, dynamic>", nullable
+
+    def from_json(self, expr, schema, hint):
+        dart, nullable = self.type_of(schema, hint)
+        return self._convert(expr, dart, nullable)
+
+    def _convert(self, expr, dart, nullable):
+        if dart == "dynamic":
+            return expr
+        if dart.startswith("List<"):
+            item = dart[5:-1]
+            item_nullable = item.endswith("?")
+            item = item.rstrip("?")
+            value = f"({expr} as List<dynamic>).map((e) => {self._convert('e', item, item_nullable)}).toList()"
+        elif dart == "Map<String, dynamic>":
+            value = f"{expr} as Map<String, dynamic>"
+        elif dart == "num":
+            value = f"{expr} as num"
+        elif dart in ("String", "int", "bool"):
+            return f"{expr} as {dart}{'?' if nullable else ''}"
+        else:
+            value = f"{dart}.fromJson({expr} as Map<String, dynamic>)"
+        return f"{expr} == null ? null : {value}" if nullable else value
+
+    def to_json(self, expr, dart, nullable):
+        q = "?" if nullable else ""
+        if dart.startswith("List<"):
+            item = dart[5:-1].rstrip("?")
+            if item in self.classes:
+                return f"{expr}{q}.map((e) => e{'?' if dart[5:-1].endswith('?') else ''}.toJson()).toList()"
+            return expr
+        if dart in self.classes:
+            return f"{expr}{q}.toJson()"
+        return expr
+
+    def _render_class(self, name, schema):
+        required = set(schema.get("required") or ())
+        fields = []
+        for key, prop in schema["properties"].items():
+            field = _camel(key) or "value"
+            if field in _DART_RESERVED or field[0].isdigit():
+                field += "Value"
+            dart, nullable = self.type_of(prop, name + _pascal(key))
+            nullable = nullable or key not in required
+            fields.append((key, field, dart, nullable and dart != "dynamic"))
+        lines = [f"class {name} {{"]
+        args = ", ".join(f"{'' if n else 'required '}this.{f}" for _, f, _, n in fields)
+        lines.append(f"  const {name}({{{args}}});" if fields else f"  const {name}();")
+        lines.append("")
+        for key, field, dart, nullable in fields:
+            lines.append(f"  final {dart}{'?' if nullable else ''} {field};")
+        lines.append("")
+        lines.append(f"  factory {name}.fromJson(Map<String, dynamic> json) => {name}(")
+        for key, field, dart, nullable in fields:
+            lines.append(f"        {field}: {self._convert(_dart_string(key, 'json'), dart, nullable)},")
+        lines.append("      );")
+        lines.append("")
+        lines.append("  Map<String, dynamic> toJson() => {")
+        for key, field, dart, nullable in fields:
+            value = self.to_json(field, dart, nullable)
+            if nullable:
+                lines.append(f"        if ({field} != null) {_dart_literal(key)}: {value},")
+            else:
+                lines.append(f"        {_dart_literal(key)}: {value},")
+        lines.append("      };")
+        lines.append("}")
+        return "\n".join(lines)
+
+
+def _dart_literal(value):
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'").replace("$", "\\$") + "'"
+
+
+def _dart_string(key, var):
+    return f"{var}[{_dart_literal(key)}]"
+
+
+def render_dart(schemas, endpoints):
+    models = _DartModels(schemas)
+    for name, schema in schemas.items():
+        if models._is_class(schema):
+            models.add_class(name, schema)
+
+    taken = set()
+    methods = []
+    for ep in endpoints:
+        name = operation_name(ep, taken)
+        op_class = _pascal(name)
+        params = [(p, _camel(p)) for p in _PARAM.findall(ep["path"])]
+        args = [f"String {var}" for _, var in params]
+        request = ep.get("requestSchema")
+        body_expr = None
+        if request:
+            dart, nullable = models.type_of(request, op_class + "Request")
+            args.append(f"{dart}{'?' if nullable else ''} body")
+            body_expr = models.to_json("body", dart, nullable)
+        if ep["method"] == "GET":
+            args.append("{Map<String, dynamic>? query}")
+        _, response = success_response(ep)
+        if response is not None:
+            result, nullable = models.type_of(response, op_class + "Response")
+            result += "?" if nullable and result != "dynamic" else ""
+        else:
+            result, nullable = "void", False
+        path = _PARAM.sub(lambda m: "${Uri.encodeComponent(" + _camel(m.group(1)) + ")}", ep["path"])
+        lines = []
+        if ep.get("summary"):
+            lines.append(f"  /// {ep['summary']}")
+        lines.append(f"  Future<{result}> {name}({', '.join(args)}) async {{")
+        call = [_dart_literal(path).replace("\\$", "$"), f"method: '{ep['method']}'", f"auth: {'false' if ep.get('public') else 'true'}"]
+        if body_expr:
+            call.append(f"data: {body_expr}")
+        if ep["method"] == "GET":
+            call.append("query: query")
+        if result == "void":
+            lines.append(f"    await _request({', '.join(call)});")
+        else:
+            lines.append(f"    final data = await _request({', '.join(call)});")
+            if result == "dynamic":
+                lines.append("    return data;")
+            else:
+                lines.append(f"    return {models._convert('data', result.rstrip('?'), result.endswith('?'))};")
+        lines.append("  }")
+        methods.append("\n".join(lines))
+
+    model_text = [f"// {HEADER}", "// ignore_for_file: prefer_const_constructors, unnecessary_this", ""]
+    for name in models.order:
+        model_text.append(models.classes[name])
+        model_text.append("")
+    client_text = [f"// {HEADER}", "", "import 'package:dio/dio.dart';", "", "import 'models.dart';", "", _DART_RUNTIME]
+    client_text.append("\n\n".join(methods))
+    client_text.append("}")
+    client_text.append("")
+    return {"models.dart": "\n".join(model_text), "client.dart": "\n".join(client_text)}
+
+
+_DART_RUNTIME = """class TokApiClient {
+  TokApiClient(this._dio, {this.tokenProvider});
+
+  final Dio _dio;
+  final Future<String?> Function()? tokenProvider;
+
+  Future<dynamic> _request(
+    String path, {
+    required String method,
+    required bool auth,
+    Object? data,
+    Map<String, dynamic>? query,
+  }) async {
+    final headers = <String, dynamic>{};
+    if (auth && tokenProvider != null) {
+      final token = await tokenProvider!();
+      if (token != null) headers['Authorization'] = 'Bearer $token';
+    }
+    final res = await _dio.request<dynamic>(
+      path,
+      data: data,
+      queryParameters: query,
+      options: Options(method: method, headers: headers),
+    );
+    return res.data;
+  }
+"""
+
+RENDERERS = {"typescript": render_typescript, "dart": render_dart}
+
+
+def render_target(target, schemas, endpoints):
+    # runs in a worker process; returns file name -> text
+    return RENDERERS[target](schemas, endpoints)
+
+
+def write_text_if_changed(path, text):
+    # unchanged files are left alone so watchers and bundlers do not rebuild
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return True
+
+
+def generate(targets, schemas, endpoints, root=REPO_ROOT, jobs=None):
+    # target -> {"written": [...], "unchanged": [...]}; each target renders in its own process
+    results = {}
+    if len(targets) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=min(len(targets), jobs or len(targets))) as pool:
+            futures = {t: pool.submit(render_target, t, schemas, endpoints) for t in targets}
+            rendered = {t: future.result() for t, future in futures.items()}
+    else:
+        rendered = {t: render_target(t, schemas, endpoints) for t in targets}
+    for target in targets:
+        out_dir = os.path.join(root, TARGETS[target])
+        summary = results[target] = {"written": [], "unchanged": []}
+        for name, text in rendered[target].items():
+            path = os.path.join(out_dir, name)
+            rel = os.path.relpath(path, root)
+            summary["written" if write_text_if_changed(path, text) else "unchanged"].append(rel)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate typed TypeScript and Dart API clients from the contract")
+    parser.add_argument("--only", choices=sorted(TARGETS), action="append")
+    parser.add_argument("--root", default=REPO_ROOT)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per target)")
+    parser.add_argument("--contract", help="emitted api-contract.json to read instead of build_contract.py")
+    args = parser.parse_args(argv)
+
+    from build_contract import load_contract
+
+    contract = load_contract(args.contract)
+    targets = args.only or sorted(TARGETS)
+    results = generate(targets, contract["components"]["schemas"], contract["endpoints"], args.root, args.jobs)
+    for target, summary in results.items():
+        print(f"{target}: {len(summary['written'])} written, {len(summary['unchanged'])} unchanged")
+        for path in summary["written"]:
+            print("  wrote", path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,338 @@
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+
+from ref_graph import operation_key
+
+MAGIC = b"TFCB"
+VERSION = 2
+
+# little-endian throughout:
+#   header   magic, version, string/schema/endpoint/section counts and table offsets
+#   strings  (offset, length) pairs into a UTF-8 blob; every string is stored once
+#   indexes  (string id, value offset) per schema, endpoint ("METHOD /path") and
+#            other top-level section (metadata, refIndex), each sorted by the
+#            key string so a single lookup can binary-search it
+#   values   tagged and length-prefixed, strings and dict keys as string ids
+_HEADER = struct.Struct("<4sHHIIIIIIII")
+_PAIR = struct.Struct("<II")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+_NULL, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT = range(8)
+
+
+class _Writer:
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+        self.values = bytearray()
+
+    def intern(self, s):
+        sid = self.ids.get(s)
+        if sid is None:
+            sid = self.ids[s] = len(self.strings)
+            self.strings.append(s.encode("utf-8"))
+        return sid
+
+    def value(self, obj):
+        start = len(self.values)
+        out = self.values
+        stack = [obj]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, str):
+                out.append(_STR)
+                out += _U32.pack(self.intern(obj))
+            elif isinstance(obj, dict):
+                out.append(_DICT)
+                out += _U32.pack(len(obj))
+                # keys are written as they come off the stack, ahead of their value
+                for key, item in reversed(list(obj.items())):
+                    stack.append(item)
+                    stack.append(_Key(key))
+            elif isinstance(obj, _Key):
+                out += _U32.pack(self.intern(obj.name))
+            elif isinstance(obj, list):
+                out.append(_LIST)
+                out += _U32.pack(len(obj))
+                stack.extend(reversed(obj))
+            elif obj is None:
+                out.append(_NULL)
+            elif obj is True:
+                out.append(_TRUE)
+            elif obj is False:
+                out.append(_FALSE)
+            elif isinstance(obj, int):
+                out.append(_INT)
+                out += _I64.pack(obj)
+            elif isinstance(obj, float):
+                out.append(_FLOAT)
+                out += _F64.pack(obj)
+            else:
+                raise TypeError(f"cannot encode {type(obj).__name__}")
+        return start
+
+    def index(self, items):
+        entries = sorted((key, self.value(obj)) for key, obj in items)
+        return [(self.intern(key), off) for key, off in entries]
+
+
+class _Key:
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+def encode_contract(contract):
+    writer = _Writer()
+    schemas = writer.index(contract["components"]["schemas"].items())
+    endpoints = writer.index((operation_key(ep), ep) for ep in contract["endpoints"])
+    # the remaining components (securitySchemes, ...) travel as one section
+    rest = {k: v for k, v in contract["components"].items() if k != "schemas"}
+    sections = writer.index(
+        [(k, v) for k, v in contract.items() if k not in ("components", "endpoints")] + [("components", rest)]
+    )
+
+    string_table = bytearray()
+    blob = bytearray()
+    for data in writer.strings:
+        string_table += _PAIR.pack(len(blob), len(data))
+        blob += data
+
+    offset = _HEADER.size
+    string_off = offset
+    offset += len(string_table)
+    blob_off = offset
+    offset += len(blob)
+    tables = []
+    for entries in (schemas, endpoints, sections):
+        tables.append(offset)
+        offset += len(entries) * _PAIR.size
+    values_off = offset
+
+    parts = [
+        _HEADER.pack(
+            MAGIC, VERSION, 0,
+            len(writer.strings), string_off, blob_off,
+            len(schemas), len(endpoints), len(sections),
+            tables[0], values_off,
+        ),
+        string_table,
+        blob,
+    ]
+    for entries in (schemas, endpoints, sections):
+        parts.append(b"".join(_PAIR.pack(sid, values_off + off) for sid, off in entries))
+    parts.append(writer.values)
+    return b"".join(parts)
+
+
+def write_contract(contract, path):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(encode_contract(contract))
+    os.replace(tmp_path, path)
+
+
+class ContractReader:
+    # maps the file and decodes only the entries that are asked for; decoded
+    # values are cached and shared between callers, so do not mutate them
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic, version, _, string_count, self._string_off, self._blob_off,
+            schema_count, endpoint_count, section_count, table_off, _,
+        ) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{path}: not a version {VERSION} binary contract")
+        self._strings = [None] * string_count
+        self._tables = {}
+        for name, count in (("schemas", schema_count), ("endpoints", endpoint_count), ("sections", section_count)):
+            self._tables[name] = (table_off, count)
+            table_off += count * _PAIR.size
+        self._offsets = {}
+        self._cache = {}
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _string(self, sid):
+        s = self._strings[sid]
+        if s is None:
+            off, length = _PAIR.unpack_from(self._mm, self._string_off + sid * _PAIR.size)
+            start = self._blob_off + off
+            s = self._strings[sid] = str(self._mm[start:start + length], "utf-8")
+        return s
+
+    def _table(self, name):
+        # key -> value offset; only the fixed-size index is read, not the values
+        offsets = self._offsets.get(name)
+        if offsets is None:
+            start, count = self._tables[name]
+            offsets = self._offsets[name] = {
+                self._string(sid): off for sid, off in struct.iter_unpack("<II", self._mm[start:start + count * _PAIR.size])
+            }
+        return offsets
+
+    def _find(self, name, key):
+        # value offset of one key; until the whole index has been read, a binary
+        # search decodes only the keys it visits
+        offsets = self._offsets.get(name)
+        if offsets is not None:
+            return offsets.get(key)
+        start, count = self._tables[name]
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            sid, off = _PAIR.unpack_from(self._mm, start + mid * _PAIR.size)
+            probe = self._string(sid)
+            if probe == key:
+                return off
+            if probe < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def _decode(self, pos):
+        mm = self._mm
+        string = self._string
+        # each frame: [container, remaining items, pending dict key]
+        root = []
+        stack = [[root, 1, None]]
+        while stack:
+            frame = stack[-1]
+            if frame[1] == 0:
+                stack.pop()
+                continue
+            frame[1] -= 1
+            container = frame[0]
+            if isinstance(container, dict):
+                key = string(_U32.unpack_from(mm, pos)[0])
+                pos += 4
+            tag = mm[pos]
+            pos += 1
+            if tag == _STR:
+                value = string(_U32.unpack_from(mm, pos)[0])
+                pos += 4
+            elif tag == _DICT or tag == _LIST:
+                count = _U32.unpack_from(mm, pos)[0]
+                pos += 4
+                value = {} if tag == _DICT else []
+                stack.append([value, count, None])
+            elif tag == _NULL:
+                value = None
+            elif tag == _TRUE:
+                value = True
+            elif tag == _FALSE:
+                value = False
+            elif tag == _INT:
+                value = _I64.unpack_from(mm, pos)[0]
+                pos += 8
+            elif tag == _FLOAT:
+                value = _F64.unpack_from(mm, pos)[0]
+                pos += 8
+            else:
+                raise ValueError(f"bad tag {tag} at offset {pos - 1}")
+            if isinstance(container, dict):
+                container[key] = value
+            else:
+                container.append(value)
+        return root[0]
+
+    def _get(self, name, key):
+        cache_key = (name, key)
+        if cache_key not in self._cache:
+            off = self._find(name, key)
+            self._cache[cache_key] = None if off is None else self._decode(off)
+        return self._cache[cache_key]
+
+    def operation_keys(self):
+        return list(self._table("endpoints"))
+
+    def schema_names(self):
+        return list(self._table("schemas"))
+
+    def endpoint(self, key):
+        return self._get("endpoints", key)
+
+    def find(self, method, path):
+        return self._get("endpoints", f"{method.upper()} {path}")
+
+    def schema(self, name):
+        return self._get("schemas", name)
+
+    def section(self, name):
+        return self._get("sections", name)
+
+    @property
+    def metadata(self):
+        return self.section("metadata")
+
+    def iter_endpoints(self):
+        for key in self._table("endpoints"):
+            yield self.endpoint(key)
+
+    def to_contract(self):
+        # the full JSON-shaped contract; keys come back sorted, values are equal
+        components = dict(self.section("components") or {})
+        components["schemas"] = {name: self.schema(name) for name in self.schema_names()}
+        contract = {name: self.section(name) for name in self._table("sections") if name != "components"}
+        contract["components"] = components
+        contract["endpoints"] = list(self.iter_endpoints())
+        return contract
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Encode or inspect the binary contract artifact")
+    sub = parser.add_subparsers(dest="command", required=True)
+    encode = sub.add_parser("encode", help="write a binary contract from api-contract.json or build_contract.py")
+    encode.add_argument("output")
+    encode.add_argument("--contract", help="emitted api-contract.json to read instead of build_contract.py")
+    show = sub.add_parser("show", help="print one endpoint or schema, or list the operations")
+    show.add_argument("input")
+    show.add_argument("key", nargs="?", help='"METHOD /path" or a schema name')
+    args = parser.parse_args(argv)
+
+    if args.command == "encode":
+        if args.contract:
+            with open(args.contract, encoding="utf-8") as f:
+                contract = json.load(f)
+        else:
+            from build_contract import get_api_contract
+
+            contract = get_api_contract()
+        write_contract(contract, args.output)
+        print(f"Wrote {args.output} ({os.path.getsize(args.output)} bytes)")
+        return 0
+
+    with ContractReader(args.input) as reader:
+        if args.key is None:
+            result = reader.operation_keys()
+        else:
+            result = reader.endpoint(args.key)
+            if result is None:
+                result = reader.schema(args.key)
+            if result is None:
+                print(f"{args.key}: not found", file=sys.stderr)
+                return 1
+        json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
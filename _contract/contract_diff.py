@@ -0,0 +1,314 @@
+import argparse
+import json
+import re
+import sys
+
+from ref_graph import REF_PREFIX, iter_refs
+
+REQUEST = "request"
+RESPONSE = "response"
+
+# kind -> directions in which the change breaks existing clients; a request
+# schema may not start rejecting what clients send, a response schema may not
+# start returning what clients do not expect
+_BREAKS = {
+    "required-added": {REQUEST},
+    "required-removed": {RESPONSE},
+    "type-narrowed": {REQUEST},
+    "type-widened": {RESPONSE},
+    "type-changed": {REQUEST, RESPONSE},
+    "enum-narrowed": {REQUEST},
+    "enum-widened": {RESPONSE},
+    "property-added": set(),
+    "property-removed": {RESPONSE},
+    "ref-changed": {REQUEST, RESPONSE},
+    "format-changed": {REQUEST, RESPONSE},
+    "composition-changed": {REQUEST, RESPONSE},
+}
+_TYPES = ("string", "number", "integer", "boolean", "object", "array", "null")
+# build_contract.build_operation appends " Aliases: /a, /b." to the description
+_ALIASES = re.compile(r"Aliases: (.+)\.\s*$")
+
+
+def _json_schema(content):
+    return ((content or {}).get("application/json") or {}).get("schema")
+
+
+def _aliases(description):
+    m = _ALIASES.search(description or "")
+    return [alias.strip() for alias in m.group(1).split(",")] if m else []
+
+
+def _from_openapi(doc):
+    operations = {}
+    global_security = doc.get("security")
+    for path, item in (doc.get("paths") or {}).items():
+        for method, op in item.items():
+            if method.startswith("x-") or not isinstance(op, dict) or method == "parameters":
+                continue
+            security = op.get("security", global_security)
+            operations[(method.upper(), path)] = {
+                "public": not security,
+                "aliases": _aliases(op.get("description")),
+                "request": _json_schema((op.get("requestBody") or {}).get("content")),
+                # YAML loads unquoted status codes as ints
+                "responses": {str(status): r for status, r in (op.get("responses") or {}).items()},
+            }
+    return operations, (doc.get("components") or {}).get("schemas") or {}
+
+
+def _from_contract(contract):
+    operations = {}
+    for ep in contract["endpoints"]:
+        operations[(ep["method"].upper(), ep["path"])] = {
+            "public": ep.get("public", False),
+            "aliases": ep.get("aliases") or [],
+            "request": ep.get("requestSchema"),
+            "responses": ep.get("responses") or {},
+        }
+    return operations, contract["components"]["schemas"]
+
+
+def normalize(doc):
+    # api-contract.json and openapi.yaml -> ({(METHOD, path): operation}, schemas)
+    if "endpoints" in doc:
+        return _from_contract(doc)
+    return _from_openapi(doc)
+
+
+def load_spec(path=None):
+    if path is None:
+        from build_contract import load_contract
+
+        return load_contract()
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml
+
+            return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        return json.load(f)
+
+
+def _directions(operations, schemas):
+    # component name -> {"request", "response"} it is reachable from
+    roots = {REQUEST: set(), RESPONSE: set()}
+    for op in operations.values():
+        roots[REQUEST].update(iter_refs(op["request"]))
+        roots[RESPONSE].update(iter_refs(op["responses"]))
+    used = {}
+    for direction, names in roots.items():
+        stack = list(names)
+        seen = set()
+        while stack:
+            name = stack.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            used.setdefault(name, set()).add(direction)
+            stack.extend(iter_refs(schemas.get(name)))
+    return used
+
+
+def _type_set(schema):
+    types = schema.get("type")
+    if types is None:
+        return None
+    types = {types} if isinstance(types, str) else set(types)
+    if schema.get("nullable"):
+        types.add("null")
+    return types
+
+
+def _covers(types, value):
+    return value in types or (value == "integer" and "number" in types)
+
+
+def _compare_values(old, new, kind, location, emit):
+    narrowed = any(not _covers(new, v) for v in old)
+    widened = any(not _covers(old, v) for v in new)
+    detail = f"{sorted(old)} -> {sorted(new)}"
+    if kind == "type" and narrowed and widened:
+        emit("type-changed", location, detail)
+        return
+    if narrowed:
+        emit(f"{kind}-narrowed", location, detail)
+    if widened:
+        emit(f"{kind}-widened", location, detail)
+
+
+def _resolve(schema, schemas, seen):
+    while isinstance(schema, dict) and isinstance(schema.get("$ref"), str) and schemas is not None:
+        ref = schema["$ref"]
+        if not ref.startswith(REF_PREFIX) or ref in seen or ref[len(REF_PREFIX):] not in schemas:
+            break
+        seen = seen | {ref}
+        schema = schemas[ref[len(REF_PREFIX):]]
+    return schema, seen
+
+
+def compare_schema(old, new, location, emit, old_schemas=None, new_schemas=None):
+    # walks two schemas side by side; a $ref shared by both sides is not followed
+    # because each component is compared once on its own, but a shape moved
+    # between inline and a component is compared by content
+    stack = [(old, new, location, frozenset())]
+    while stack:
+        old, new, location, seen = stack.pop()
+        if not isinstance(old, dict) or not isinstance(new, dict):
+            if old != new:
+                emit("type-changed", location, "schema replaced")
+            continue
+        old_ref, new_ref = old.get("$ref"), new.get("$ref")
+        if old_ref == new_ref and old_ref is not None:
+            continue
+        if old_ref or new_ref:
+            resolved_old, old_seen = _resolve(old, old_schemas, seen)
+            resolved_new, new_seen = _resolve(new, new_schemas, seen)
+            if resolved_old.get("$ref") or resolved_new.get("$ref"):
+                # unresolvable, or a recursive schema came back around
+                emit("ref-changed", location, f"{old_ref or 'inline'} -> {new_ref or 'inline'}")
+            elif resolved_old != resolved_new:
+                stack.append((resolved_old, resolved_new, location, old_seen | new_seen))
+            continue
+
+        old_types, new_types = _type_set(old), _type_set(new)
+        if old_types != new_types:
+            _compare_values(old_types or set(_TYPES), new_types or set(_TYPES), "type", location, emit)
+        if "enum" in old or "enum" in new:
+            if old.get("enum") != new.get("enum"):
+                if "enum" not in new:
+                    emit("enum-widened", location, "enum removed")
+                elif "enum" not in old:
+                    emit("enum-narrowed", location, "enum added")
+                else:
+                    _compare_values(
+                        {json.dumps(v) for v in old["enum"]}, {json.dumps(v) for v in new["enum"]}, "enum", location, emit
+                    )
+        if old.get("format") != new.get("format"):
+            emit("format-changed", location, f"{old.get('format')} -> {new.get('format')}")
+
+        old_required, new_required = set(old.get("required") or ()), set(new.get("required") or ())
+        for name in sorted(new_required - old_required):
+            emit("required-added", location, name)
+        for name in sorted(old_required - new_required):
+            emit("required-removed", location, name)
+
+        old_props, new_props = old.get("properties") or {}, new.get("properties") or {}
+        for name in old_props.keys() - new_props.keys():
+            emit("property-removed", location, name)
+        for name in new_props.keys() - old_props.keys():
+            emit("property-added", location, name)
+        for name in old_props.keys() & new_props.keys():
+            if old_props[name] != new_props[name]:
+                stack.append((old_props[name], new_props[name], f"{location}.properties.{name}", seen))
+
+        if "items" in old or "items" in new:
+            if old.get("items") != new.get("items"):
+                stack.append((old.get("items") or {}, new.get("items") or {}, f"{location}.items", seen))
+        if old.get("additionalProperties") != new.get("additionalProperties"):
+            stack.append((
+                old.get("additionalProperties", True), new.get("additionalProperties", True),
+                f"{location}.additionalProperties", seen,
+            ))
+        for key in ("allOf", "anyOf", "oneOf", "not"):
+            if old.get(key) != new.get(key):
+                emit("composition-changed", location, key)
+
+
+def _is_success(status):
+    return str(status).startswith("2")
+
+
+def diff(old_doc, new_doc):
+    old_ops, old_schemas = normalize(old_doc)
+    new_ops, new_schemas = normalize(new_doc)
+    changes = []
+
+    def add(kind, location, detail, breaking):
+        changes.append({"kind": kind, "breaking": breaking, "location": location, "detail": detail})
+
+    for key in old_ops.keys() - new_ops.keys():
+        add("operation-removed", f"{key[0]} {key[1]}", None, True)
+    for key in new_ops.keys() - old_ops.keys():
+        add("operation-added", f"{key[0]} {key[1]}", None, False)
+
+    for key in old_ops.keys() & new_ops.keys():
+        old, new = old_ops[key], new_ops[key]
+        if old == new:
+            continue
+        op = f"{key[0]} {key[1]}"
+        if old["public"] and not new["public"]:
+            add("security-added", op, "now requires bearer auth", True)
+        elif new["public"] and not old["public"]:
+            add("security-removed", op, "no longer requires auth", False)
+        for alias in sorted(set(old["aliases"]) - set(new["aliases"])):
+            add("alias-removed", op, alias, True)
+        for alias in sorted(set(new["aliases"]) - set(old["aliases"])):
+            add("alias-added", op, alias, False)
+
+        def emit_for(direction):
+            return lambda kind, location, detail: add(kind, location, detail, direction in _BREAKS[kind])
+
+        if old["request"] is None and new["request"] is not None:
+            add("request-body-added", op, None, True)
+        elif old["request"] is not None and new["request"] is None:
+            add("request-body-removed", op, None, False)
+        elif old["request"] != new["request"]:
+            compare_schema(old["request"], new["request"], f"{op} request", emit_for(REQUEST), old_schemas, new_schemas)
+
+        old_responses, new_responses = old["responses"], new["responses"]
+        for status in sorted(old_responses.keys() - new_responses.keys()):
+            add("response-removed", f"{op} {status}", None, _is_success(status))
+        for status in sorted(new_responses.keys() - old_responses.keys()):
+            add("response-added", f"{op} {status}", None, False)
+        for status in sorted(old_responses.keys() & new_responses.keys()):
+            old_schema = _json_schema(old_responses[status].get("content"))
+            new_schema = _json_schema(new_responses[status].get("content"))
+            if old_schema != new_schema:
+                compare_schema(old_schema or {}, new_schema or {}, f"{op} {status}", emit_for(RESPONSE), old_schemas, new_schemas)
+
+    removed = old_schemas.keys() - new_schemas.keys()
+    changed = [name for name in old_schemas.keys() & new_schemas.keys() if old_schemas[name] != new_schemas[name]]
+    if removed or changed:
+        old_used = _directions(old_ops, old_schemas)
+        new_used = _directions(new_ops, new_schemas)
+    for name in removed:
+        add("schema-removed", REF_PREFIX + name, None, bool(new_used.get(name)))
+    for name in new_schemas.keys() - old_schemas.keys():
+        add("schema-added", REF_PREFIX + name, None, False)
+    for name in changed:
+        directions = old_used.get(name, set()) | new_used.get(name, set())
+
+        def emit(kind, location, detail):
+            add(kind, location, detail, bool(_BREAKS[kind] & directions))
+
+        compare_schema(old_schemas[name], new_schemas[name], REF_PREFIX + name, emit, old_schemas, new_schemas)
+
+    changes.sort(key=lambda c: (not c["breaking"], c["location"], c["kind"]))
+    breaking = sum(c["breaking"] for c in changes)
+    return {
+        "summary": {
+            "operations": {"old": len(old_ops), "new": len(new_ops)},
+            "breaking": breaking,
+            "nonBreaking": len(changes) - breaking,
+        },
+        "changes": changes,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Diff two contract versions and classify breaking changes")
+    parser.add_argument("old", help="previous api-contract.json or openapi.yaml")
+    parser.add_argument("new", nargs="?", help="new api-contract.json or openapi.yaml (default: build_contract.py)")
+    parser.add_argument("--fail-on-breaking", action="store_true", help="exit with status 1 when anything breaks")
+    args = parser.parse_args(argv)
+
+    report = diff(load_spec(args.old), load_spec(args.new))
+    json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    summary = report["summary"]
+    print(f"{summary['breaking']} breaking, {summary['nonBreaking']} non-breaking changes", file=sys.stderr)
+    return 1 if args.fail_on_breaking and summary["breaking"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+import argparse
+import hashlib
+import json
+import re
+import sys
+
+from ref_graph import REF_PREFIX
+
+# shapes seen at least this often in operations are hoisted into components
+MIN_OCCURRENCES = 2
+
+
+def _is_compound(schema):
+    # scalars like {"type": "boolean"} stay inline; a $ref costs as much as they do
+    return isinstance(schema, dict) and "$ref" not in schema and ("properties" in schema or "items" in schema)
+
+
+def structural_hashes(root, hashes):
+    # post-order: a node's digest is built from its children's digests, so every
+    # subschema is hashed once no matter how deep it sits; hashes maps id(node)
+    stack = [(root, False)]
+    while stack:
+        node, ready = stack.pop()
+        if id(node) in hashes:
+            continue
+        if isinstance(node, dict):
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            hashes[id(node)] = json.dumps(node)
+            continue
+        if not ready:
+            stack.append((node, True))
+            stack.extend((child, False) for child in children if id(child) not in hashes)
+            continue
+        if isinstance(node, dict):
+            parts = [json.dumps(key) + ":" + hashes[id(value)] for key, value in sorted(node.items())]
+            text = "{" + ",".join(parts) + "}"
+        else:
+            text = "[" + ",".join(hashes[id(item)] for item in node) + "]"
+        # long subtrees collapse to a fixed-size digest so parents stay cheap to hash
+        hashes[id(node)] = text if len(text) <= 64 else "#" + hashlib.sha1(text.encode("utf-8")).hexdigest()
+    return hashes[id(root)]
+
+
+def _walk_schemas(node, visit):
+    # calls visit(schema) on every compound subschema, outermost first; a truthy
+    # return stops the walk from descending into that schema
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if _is_compound(node) and visit(node):
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _operation_roots(ep):
+    roots = []
+    body = ep.get("requestBody")
+    if body and "schema" in body:
+        roots.append(body["schema"])
+    for response in (ep.get("responses") or {}).values():
+        schema = ((response.get("content") or {}).get("application/json") or {}).get("schema")
+        if schema is not None:
+            roots.append(schema)
+    return roots
+
+
+def _pascal(name):
+    return "".join(part[:1].upper() + part[1:] for part in re.split(r"[^A-Za-z0-9]+", name) if part)
+
+
+def suggest_name(schema):
+    items = schema.get("items")
+    if isinstance(items, dict):
+        if "$ref" in items:
+            return items["$ref"][len(REF_PREFIX):] + "List"
+        return suggest_name(items) + "List" if _is_compound(items) else _pascal(str(items.get("type", "Item"))) + "List"
+    props = schema.get("properties") or {}
+    data = props.get("data")
+    if set(props) == {"ok", "data"} and isinstance(data, dict):
+        if "$ref" in data:
+            return data["$ref"][len(REF_PREFIX):] + "Envelope"
+        if _is_compound(data):
+            return suggest_name(data) + "Envelope"
+    return "Inline" + "".join(_pascal(key) for key in props)[:48] or "InlineObject"
+
+
+def hoist_shared_schemas(schemas, table, min_occurrences=MIN_OCCURRENCES):
+    # returns (schemas, table) where inline shapes are replaced by $refs: to an
+    # identical existing component when there is one, otherwise to a new
+    # component named after the shape once it occurs min_occurrences times
+    # (counted per occurrence, so two fields of one operation are enough);
+    # inputs are not mutated
+    hashes = {}
+    existing = {}
+    for name, schema in schemas.items():
+        existing.setdefault(structural_hashes(schema, hashes), name)
+
+    counts = {}
+
+    def count(node):
+        digest = structural_hashes(node, hashes)
+        counts[digest] = counts.get(digest, 0) + 1
+        return False
+
+    for ep in table:
+        for root in _operation_roots(ep):
+            _walk_schemas(root, count)
+
+    names = {}
+    taken = set(schemas)
+    out_schemas = dict(schemas)
+
+    def target(node, within):
+        digest = hashes[id(node)]
+        if digest in existing:
+            return existing[digest]
+        # inside a new component, a shape only seen as part of it appears once
+        # after hoisting, so it needs occurrences of its own
+        if counts.get(digest, 0) < min_occurrences or counts.get(digest, 0) <= within:
+            return None
+        name = names.get(digest)
+        if name is None:
+            base = name = suggest_name(node)
+            n = 2
+            while name in taken:
+                name = f"{base}{n}"
+                n += 1
+            taken.add(name)
+            names[digest] = name
+            # shapes nested inside the new component that repeat elsewhere become $refs too
+            out_schemas[name] = {key: rewrite(value, counts[digest]) for key, value in node.items()}
+        return name
+
+    def rewrite(node, within=0):
+        if isinstance(node, dict):
+            if _is_compound(node):
+                name = target(node, within)
+                if name is not None:
+                    return {"$ref": REF_PREFIX + name}
+            return {key: rewrite(value, within) for key, value in node.items()}
+        if isinstance(node, list):
+            return [rewrite(item, within) for item in node]
+        return node
+
+    out_table = []
+    for ep in table:
+        roots = _operation_roots(ep)
+        if not roots:
+            out_table.append(ep)
+            continue
+        ep = dict(ep)
+        if "requestBody" in ep and "schema" in ep["requestBody"]:
+            ep["requestBody"] = {**ep["requestBody"], "schema": rewrite(ep["requestBody"]["schema"])}
+        responses = {}
+        for status, response in (ep.get("responses") or {}).items():
+            content = response.get("content") or {}
+            if "schema" in (content.get("application/json") or {}):
+                json_content = content["application/json"]
+                response = {
+                    **response,
+                    "content": {**content, "application/json": {**json_content, "schema": rewrite(json_content["schema"])}},
+                }
+            responses[status] = response
+        ep["responses"] = responses
+        out_table.append(ep)
+    return out_schemas, out_table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show which inline schemas build_contract.py hoists into components")
+    parser.add_argument("--min-occurrences", type=int, default=MIN_OCCURRENCES)
+    args = parser.parse_args(argv)
+
+    import build_contract
+
+    schemas, table = build_contract.components["schemas"], build_contract.endpoints
+    out_schemas, out_table = hoist_shared_schemas(schemas, table, args.min_occurrences)
+    before = len(json.dumps(table, separators=(",", ":")))
+    after = len(json.dumps(out_table, separators=(",", ":")))
+    added = sorted(set(out_schemas) - set(schemas))
+    json.dump({name: out_schemas[name] for name in added}, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    print(f"{len(added)} shared schemas hoisted; inline operation schemas {before} -> {after} bytes", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from file_cache import FileCache, read_if_changed
+
+CONTRACT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(CONTRACT_DIR)
+CACHE_PATH = os.path.join(CONTRACT_DIR, ".controller-cache.json")
+CONTROLLER_ROOT = "services/api/src/modules"
+CONTROLLER_PATTERN = "**/*.controller.ts"
+
+HTTP_DECORATORS = {"Get": "get", "Post": "post", "Put": "put", "Patch": "patch", "Delete": "delete"}
+
+_STRIP = re.compile(
+    r"(\"(?:\\.|[^\"\\\n])*\"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)|//[^\n]*|/\*.*?\*/",
+    re.DOTALL,
+)
+_TOKEN = re.compile(r"@(\w+)\s*(\()?|\bclass\s+(\w+)|\b(?:async\s+)?(\w+)\s*\(")
+_STRING = re.compile(r"'((?:\\.|[^'\\])*)'|\"((?:\\.|[^\"\\])*)\"|`((?:\\.|[^`\\])*)`")
+_SUMMARY = re.compile(r"\bsummary\s*:\s*(?:'((?:\\.|[^'\\])*)'|\"((?:\\.|[^\"\\])*)\")")
+_PARAM_NAME = re.compile(r"\bname\s*:\s*['\"](\w+)['\"]")
+
+
+def _strip_comments(text):
+    # keep strings, blank out comments while preserving line numbers
+    return _STRIP.sub(lambda m: m.group(1) or re.sub(r"[^\n]", " ", m.group(0)), text)
+
+
+def _balanced(text, pos):
+    # returns the end index just past the ")" matching the "(" before pos
+    depth = 1
+    quote = None
+    while pos < len(text) and depth:
+        c = text[pos]
+        if quote:
+            if c == "\\":
+                pos += 1
+            elif c == quote:
+                quote = None
+        elif c in "'\"`":
+            quote = c
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        pos += 1
+    return pos
+
+
+def _strings(args):
+    return [next(g for g in m.groups() if g is not None) for m in _STRING.finditer(args)]
+
+
+def _join(prefix, route):
+    parts = [p for p in (prefix.strip("/"), route.strip("/")) if p]
+    return "/" + "/".join(parts)
+
+
+def _to_contract_path(path, wildcard):
+    segments = []
+    for segment in path.split("/"):
+        if segment.startswith(":"):
+            segment = "{" + segment[1:].rstrip("?") + "}"
+        elif segment == "*":
+            segment = "{" + wildcard + "}"
+        segments.append(segment)
+    return "/".join(segments) or "/"
+
+
+def parse_controller(text, filename):
+    text = _strip_comments(text)
+    endpoints = []
+    pending = []
+    controller = None
+    pos = 0
+    while True:
+        m = _TOKEN.search(text, pos)
+        if m is None:
+            break
+        decorator, opened, class_name, call = m.groups()
+        if decorator:
+            end = _balanced(text, m.end()) if opened else m.end()
+            pending.append((decorator, text[m.end():end - 1] if opened else "", m.start()))
+            pos = end
+            continue
+        if class_name:
+            names = {d for d, _, _ in pending}
+            if "Controller" in names:
+                args = next(a for d, a, _ in pending if d == "Controller")
+                prefixes = _strings(args) or [""]
+                tags = [t for d, a, _ in pending if d == "ApiTags" for t in _strings(a)]
+                controller = {"prefix": prefixes[0], "tags": tags, "public": "Public" in names}
+            else:
+                controller = None
+            pending = []
+            pos = m.end()
+            continue
+        # a member: only interesting when it carries an HTTP method decorator
+        routes = [(d, a, start) for d, a, start in pending if d in HTTP_DECORATORS]
+        if controller is not None and routes:
+            names = {d for d, _, _ in pending}
+            summary = None
+            for d, a, _ in pending:
+                if d == "ApiOperation":
+                    found = _SUMMARY.search(a)
+                    if found:
+                        summary = found.group(1) or found.group(2)
+            wildcard = "path"
+            for d, a, _ in pending:
+                if d == "ApiParam":
+                    found = _PARAM_NAME.search(a)
+                    if found:
+                        wildcard = found.group(1)
+            for d, a, start in routes:
+                paths = [
+                    _to_contract_path(_join(controller["prefix"], route), wildcard)
+                    for route in (_strings(a) or [""])
+                ]
+                endpoint = {
+                    "path": paths[0],
+                    "method": HTTP_DECORATORS[d],
+                    "summary": summary,
+                    "tags": controller["tags"],
+                    "public": controller["public"] or "Public" in names,
+                    "handler": call,
+                    "source": f"{filename}:{text.count(chr(10), 0, start) + 1}",
+                }
+                if len(paths) > 1:
+                    endpoint["aliases"] = paths[1:]
+                endpoints.append(endpoint)
+        pending = []
+        # skip the parameter list so @Body()/@Param() are not taken as method decorators
+        pos = _balanced(text, m.end())
+    return endpoints
+
+
+def _parse_job(path, known_hash):
+    digest, text = read_if_changed(path, known_hash)
+    return path, digest, None if text is None else parse_controller(text, path)
+
+
+def extract_endpoints(root=REPO_ROOT, jobs=None, cache_path=CACHE_PATH, use_cache=True):
+    base = Path(root) / CONTROLLER_ROOT
+    files = sorted(p.relative_to(root).as_posix() for p in base.glob(CONTROLLER_PATTERN) if p.is_file())
+    cache = FileCache(cache_path, [__file__])
+    if use_cache:
+        cache.load()
+    results, scanned = cache.scan("controllers", root, files, _parse_job, jobs)
+    if use_cache:
+        cache.save()
+    endpoints = []
+    for rel in files:
+        for ep in results[rel]:
+            ep = dict(ep)
+            ep["source"] = rel + ep["source"][ep["source"].rindex(":"):]
+            endpoints.append(ep)
+    return endpoints, scanned
+
+
+def _key(ep):
+    return ep["method"].lower(), ep["path"]
+
+
+def merge_endpoints(extracted, table):
+    # routing facts (path, method, public, aliases) come from the controllers;
+    # summaries, tags, schemas and cache/rate-limit hints from the hand-written table where it has them
+    documented = {}
+    for ep in table:
+        documented[_key(ep)] = ep
+        for alias in ep.get("aliases") or ():
+            documented.setdefault((ep["method"].lower(), alias), ep)
+    merged = []
+    undocumented = []
+    seen = set()
+    for ep in extracted:
+        doc = documented.get(_key(ep))
+        if doc is None:
+            for alias in ep.get("aliases") or ():
+                doc = documented.get((ep["method"], alias))
+                if doc is not None:
+                    break
+        out = {
+            "path": ep["path"],
+            "method": ep["method"],
+            "summary": (doc or {}).get("summary") or ep["summary"] or ep["handler"],
+            "tags": (doc or {}).get("tags") or ep["tags"] or [ep["path"].strip("/").split("/")[0] or "root"],
+            "public": ep["public"],
+        }
+        if ep.get("aliases"):
+            out["aliases"] = ep["aliases"]
+        if doc is not None:
+            seen.add(id(doc))
+            if "requestBody" in doc:
+                out["requestBody"] = doc["requestBody"]
+            for hint in ("cache", "rateLimit"):
+                if hint in doc:
+                    out[hint] = doc[hint]
+            out["responses"] = doc.get("responses", {})
+        else:
+            out["responses"] = {"200": {"description": "OK"}}
+            undocumented.append(ep)
+        merged.append(out)
+    stale = [ep for ep in table if id(ep) not in seen]
+    return merged, stale, undocumented
+
+
+def drift(extracted, table):
+    merged, stale, undocumented = merge_endpoints(extracted, table)
+    by_key = {_key(ep): ep for ep in table}
+    report = {
+        "undocumented": [f"{ep['method'].upper()} {ep['path']} ({ep['source']})" for ep in undocumented],
+        "stale": [f"{ep['method'].upper()} {ep['path']}" for ep in stale],
+        "changed": [],
+    }
+    for ep in merged:
+        doc = by_key.get(_key(ep))
+        if doc is None:
+            continue
+        for field in ("public", "aliases"):
+            ours = ep.get(field) or ([] if field == "aliases" else False)
+            theirs = doc.get(field) or ([] if field == "aliases" else False)
+            if ours != theirs:
+                report["changed"].append(f"{ep['method'].upper()} {ep['path']}: {field} {theirs!r} -> {ours!r}")
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract the endpoints table from NestJS controller decorators")
+    parser.add_argument("--root", default=REPO_ROOT)
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--drift", action="store_true", help="compare against the endpoints table instead of printing them")
+    parser.add_argument("--contract", help="compare against this api-contract.json instead of build_contract.py")
+    args = parser.parse_args(argv)
+
+    extracted, scanned = extract_endpoints(args.root, args.jobs, use_cache=not args.no_cache)
+    if args.drift:
+        from build_contract import load_contract
+
+        table = load_contract(args.contract)["endpoints"]
+        result = drift(extracted, table)
+    else:
+        result = extracted
+    json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    print(f"{len(extracted)} operations ({scanned} controller files parsed)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# below this many files the process pool costs more than it saves
+PARALLEL_THRESHOLD = 16
+
+
+def _digest_files(paths):
+    h = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+class FileCache:
+    # per-file results keyed by path, reused while mtime/size or the content
+    # hash match; invalidated whenever the code that produced them changes
+    def __init__(self, path, code_files, version=1):
+        self.path = path
+        self.version = version
+        self.code = _digest_files(code_files)
+        self.sections = {}
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return self
+        if data.get("version") == self.version and data.get("code") == self.code:
+            self.sections = data.get("sections", {})
+        return self
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.version, "code": self.code, "sections": self.sections}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def scan(self, section, root, files, job, jobs=None):
+        # job(path, known_sha256) -> (path, sha256, result or None when unchanged);
+        # it must be a module-level function so worker processes can import it
+        cache = self.sections.setdefault(section, {})
+        results = {}
+        pending = []
+        for rel in files:
+            st = os.stat(os.path.join(root, rel))
+            entry = cache.get(rel)
+            if entry and entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                results[rel] = entry["result"]
+                continue
+            pending.append((rel, st, entry))
+
+        work = [(os.path.join(root, rel), entry["sha256"] if entry else None) for rel, _, entry in pending]
+        if len(work) >= PARALLEL_THRESHOLD and jobs != 1:
+            workers = jobs or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(_run_job, [job] * len(work), work, chunksize=max(1, len(work) // (workers * 4))))
+        else:
+            outcomes = [job(*item) for item in work]
+
+        for (rel, st, entry), (_, digest, result) in zip(pending, outcomes):
+            if result is None:
+                # touched but unchanged content
+                result = entry["result"]
+            results[rel] = result
+            cache[rel] = {"mtime": st.st_mtime_ns, "size": st.st_size, "sha256": digest, "result": result}
+        for stale in set(cache) - set(files):
+            del cache[stale]
+        return results, len(pending)
+
+
+def _run_job(job, item):
+    return job(*item)
+
+
+def read_if_changed(path, known_hash):
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == known_hash:
+        return digest, None
+    return digest, data.decode("utf-8", errors="replace")
@@ -0,0 +1,462 @@
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from extract_endpoints import CONTROLLER_ROOT, _strip_comments, extract_endpoints
+from ref_graph import operation_key
+
+CONTRACT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(CONTRACT_DIR)
+SCHEMA_PATH = os.path.join(REPO_ROOT, "services", "api", "prisma", "schema.prisma")
+
+SCALARS = {"String", "Int", "BigInt", "Float", "Decimal", "Boolean", "DateTime", "Json", "Bytes"}
+_MODEL = re.compile(r"^(model|enum)\s+(\w+)\s*\{")
+_FIELD = re.compile(r"^(\w+)\s+(\w+)(\[\])?(\?)?(.*)$")
+_BLOCK_ATTR = re.compile(r"^@@(index|unique|id|map)\s*\((.*)\)\s*$")
+_LIST = re.compile(r"\[([^\]]*)\]")
+_MAP = re.compile(r"@map\(\s*\"([^\"]+)\"")
+_RELATION_FIELDS = re.compile(r"@relation\([^)]*fields:\s*\[([^\]]*)\]")
+
+_PRISMA_CALL = re.compile(
+    r"\bprisma\.(\w+)\.(findMany|findFirst|findFirstOrThrow|findUnique|findUniqueOrThrow|count|aggregate|groupBy"
+    r"|updateMany|deleteMany|update|delete|upsert)\s*\("
+)
+_SERVICE_CALL = re.compile(r"\bthis\.(\w+)\.(\w+)\s*\(")
+_HELPER_CALL = re.compile(r"\bthis\.(\w+)\s*\(")
+_KEY = re.compile(r"\b(\w+)\s*(?::|(?<![=!<>])=(?![=>]))\s*")
+# keys whose values name fields without filtering or sorting on them
+SKIP_KEYS = {"select", "include", "data", "create", "update", "_count", "cursor", "take", "skip", "distinct"}
+_VAR_RANGE = re.compile(r"\b(\w+)\.(gte|lte|gt|lt)\s*=(?!=)")
+_SORT_VALUE = re.compile(r"""['"](?:asc|desc)['"]|\bSortOrder\.""")
+
+LIKE_OPS = {"contains", "endsWith"}
+RANGE_OPS = {"gt", "gte", "lt", "lte"}
+
+
+def parse_schema(text):
+    # one pass over the lines: model -> {"fields", "relations", "indexes", "table"};
+    # @id/@unique on a field and @@id/@@unique/@@index all count as indexes
+    models = {}
+    enums = set(re.findall(r"^\s*enum\s+(\w+)", text, re.M))
+    model = None
+    for raw in text.splitlines():
+        line = raw.split("//", 1)[0].strip()
+        if not line:
+            continue
+        if model is None:
+            m = _MODEL.match(line)
+            if m:
+                if m.group(1) == "enum":
+                    model = {}
+                else:
+                    model = models[m.group(2)] = {
+                        "fields": {}, "relations": {}, "indexes": [], "table": m.group(2), "foreignKeys": [],
+                    }
+            continue
+        if line.startswith("}"):
+            model = None
+            continue
+        if model == {} or line.startswith("///"):
+            continue
+        m = _BLOCK_ATTR.match(line)
+        if m:
+            kind, args = m.groups()
+            if kind == "map":
+                model["table"] = args.strip().strip('"')
+                continue
+            fields = _LIST.search(args)
+            cols = [c.split("(", 1)[0].strip() for c in fields.group(1).split(",")] if fields else []
+            model["indexes"].append({"fields": cols, "kind": kind, "type": "Gin" if "type: Gin" in args else "BTree"})
+            continue
+        m = _FIELD.match(line)
+        if m is None:
+            continue
+        name, ftype, is_list, optional, rest = m.groups()
+        relation = _RELATION_FIELDS.search(rest)
+        if ftype not in SCALARS and ftype not in enums:
+            model["relations"][name] = ftype
+            if relation:
+                model["foreignKeys"].append([c.strip() for c in relation.group(1).split(",")])
+            continue
+        column = _MAP.search(rest)
+        model["fields"][name] = {
+            "type": ftype,
+            "list": bool(is_list),
+            "optional": bool(optional),
+            "column": column.group(1) if column else name,
+        }
+        if "@id" in rest or "@unique" in rest:
+            model["indexes"].append({"fields": [name], "kind": "id" if "@id" in rest else "unique", "type": "BTree"})
+    return models
+
+
+def _block_end(text, pos):
+    # index just past the bracket closing the one at pos
+    pairs = {"{": "}", "[": "]", "(": ")"}
+    opener, closer = text[pos], pairs[text[pos]]
+    depth = 0
+    quote = None
+    while pos < len(text):
+        c = text[pos]
+        if quote:
+            if c == "\\":
+                pos += 1
+            elif c == quote:
+                quote = None
+        elif c in "'\"`":
+            quote = c
+        elif c == opener:
+            depth += 1
+        elif c == closer:
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        pos += 1
+    return pos
+
+
+def scan_fields(text, model_name, models, usage, disjunct=False):
+    # usage: model -> field -> set of ops ("eq", "range", "sort", "like", "prefix", "has"),
+    # with "or:" prefixed for fields only reachable through OR
+    model = models[model_name]
+    pos = 0
+    while True:
+        m = _KEY.search(text, pos)
+        if m is None:
+            break
+        key, pos = m.group(1), m.end()
+        value_start = pos
+        if key in SKIP_KEYS:
+            pos = _value_end(text, pos, ",;}])")
+            continue
+        opens = value_start < len(text) and text[value_start] in "{["
+        if key in ("OR", "AND", "NOT") and opens:
+            end = _block_end(text, value_start)
+            scan_fields(text[value_start + 1:end - 1], model_name, models, usage, disjunct or key != "AND")
+            pos = end
+            continue
+        if key in model["relations"] and opens:
+            end = _block_end(text, value_start)
+            target = model["relations"][key]
+            if target in models:
+                scan_fields(text[value_start + 1:end - 1], target, models, usage, disjunct)
+            pos = end
+            continue
+        if key not in model["fields"]:
+            continue
+        if opens:
+            end = _block_end(text, value_start)
+            inner = text[value_start:end]
+            ops = set(re.findall(r"\b(\w+)\s*:", inner))
+            if ops & LIKE_OPS or ("startsWith" in ops and "insensitive" in inner):
+                op = "like"
+            elif "startsWith" in ops:
+                op = "prefix"
+            elif ops & RANGE_OPS:
+                op = "range"
+            elif "has" in ops or "hasSome" in ops or "hasEvery" in ops:
+                op = "has"
+            elif _SORT_VALUE.search(inner):
+                op = "sort"
+            else:
+                op = "eq"
+            pos = end
+        else:
+            op = "sort" if _SORT_VALUE.match(text, value_start) else "eq"
+        usage.setdefault(model_name, {}).setdefault(key, set()).add(("or:" if disjunct else "") + op)
+
+    # where.dob = dob; dob.lte = ... -> a range on dob
+    for var, _ in _VAR_RANGE.findall(text):
+        fields = usage.get(model_name, {})
+        if var in fields:
+            fields[var] = {("or:" if op.startswith("or:") else "") + "range" for op in fields[var]}
+    return usage
+
+
+def _method_body(text, name, start=0):
+    # body of the first `name(...) {` definition at or after start, or None
+    for m in re.finditer(r"^[ \t]*(?:(?:public|private|protected|static|async)\s+)*" + re.escape(name) + r"\s*\(", text[start:], re.M):
+        params_end = _block_end(text, start + m.end() - 1)
+        brace = text.find("{", params_end)
+        # the signature may carry a return type; the body is the first { after it
+        if brace == -1 or ";" in text[params_end:brace]:
+            continue
+        return text[brace:_block_end(text, brace)]
+    return None
+
+
+class SourceIndex:
+    # stripped TypeScript under the controller root, by module directory
+    def __init__(self, root=REPO_ROOT):
+        self.root = Path(root)
+        self.texts = {}
+
+    def text(self, rel):
+        if rel not in self.texts:
+            self.texts[rel] = _strip_comments((self.root / rel).read_text(encoding="utf-8"))
+        return self.texts[rel]
+
+    def module_files(self, rel):
+        # services first, so `this.users.search()` finds UsersService before another controller
+        base = (self.root / rel).parent
+        files = sorted(p.relative_to(self.root).as_posix() for p in base.glob("*.ts"))
+        return sorted(files, key=lambda f: not f.endswith(".service.ts"))
+
+
+def _model_name(accessor, models):
+    name = accessor[:1].upper() + accessor[1:]
+    return name if name in models else None
+
+
+def _with_helpers(text, body, depth=1):
+    # the body plus same-file helpers it calls (this.resolveOrder(...)), one level deep
+    parts = [body]
+    if depth:
+        for helper in dict.fromkeys(_HELPER_CALL.findall(body)):
+            found = _method_body(text, helper)
+            if found and found != body:
+                parts.append(_with_helpers(text, found, depth - 1))
+    return "\n".join(parts)
+
+
+def _value_end(text, pos, stops=";}])"):
+    # end of the expression starting at pos: the first stop character outside brackets and strings
+    while pos < len(text):
+        c = text[pos]
+        if c in "{[(":
+            pos = _block_end(text, pos)
+            continue
+        if c in "'\"`":
+            end = pos + 1
+            while end < len(text) and text[end] != c:
+                end += 2 if text[end] == "\\" else 1
+            pos = end + 1
+            continue
+        if c in stops:
+            return pos
+        pos += 1
+    return pos
+
+
+def _statements(scope, names, depth=2):
+    # (variable, statement) for statements that build the named variables:
+    # declarations, `where.x = ...` and `or.push(...)`; variables they read
+    # are followed `depth` more levels
+    found = []
+    seen = set()
+    while names and depth >= 0:
+        alternatives = "|".join(map(re.escape, names))
+        pattern = re.compile(
+            r"\b(?:const|let|var)\s+(%s)\b|(?<![.\w])(%s)(?:\.\w+)*\s*(?:=(?![=>])|\.push\s*\()"
+            % (alternatives, alternatives)
+        )
+        more = set()
+        for m in pattern.finditer(scope):
+            if m.start() in seen:
+                continue
+            seen.add(m.start())
+            statement = scope[m.start():_value_end(scope, m.end())]
+            found.append((m.group(1) or m.group(2), statement))
+            rhs = statement.split("=", 1)[1] if "=" in statement else statement
+            more.update(re.findall(r"(?<![.\w])([A-Za-z_]\w*)\b(?!\s*:)", rhs))
+        names = more - names
+        depth -= 1
+    return found
+
+
+def calls_in(body, scope_text, models):
+    # [(model, action, usage)] for each prisma call in body; calls that pass a
+    # variable (`where,` / `orderBy`) also scan the statements that build it
+    found = []
+    for m in _PRISMA_CALL.finditer(body):
+        model = _model_name(m.group(1), models)
+        if model is None:
+            continue
+        args_end = _block_end(body, m.end() - 1)
+        args = body[m.end():args_end - 1]
+        names = set(re.findall(r"\b(?:where|orderBy)\s*:\s*([A-Za-z_]\w*)\b(?!\s*[.(])", args))
+        names.update(re.findall(r"\b(where|orderBy)\b(?!\s*:)", args))
+        statements = _statements(scope_text, names) if names else []
+        # `where.OR = or` makes everything pushed onto `or` a disjunct
+        joined = "\n".join(statement for _, statement in statements)
+        or_vars = set(re.findall(r"\b(?:OR|NOT)\s*(?::|=(?!=))\s*([A-Za-z_]\w*)\b(?!\s*[.(:])", joined))
+        usage = scan_fields(
+            args + "\n" + "\n".join(st for var, st in statements if var not in or_vars), model, models, {}
+        )
+        scan_fields("\n".join(st for var, st in statements if var in or_vars), model, models, usage, True)
+        found.append((model, m.group(2), usage))
+    return found
+
+
+def trace_endpoint(ep, sources, models):
+    # prisma calls reachable from a controller handler: in the handler itself,
+    # its same-file helpers and the service methods it calls in the same module
+    rel, line = ep["source"].rsplit(":", 1)
+    text = sources.text(rel)
+    offset = sum(len(row) + 1 for row in text.split("\n")[:int(line) - 1])
+    body = _method_body(text, ep["handler"], offset)
+    if body is None:
+        return []
+    calls = calls_in(body, _with_helpers(text, body), models)
+    for _, method in dict.fromkeys(_SERVICE_CALL.findall(body)):
+        for other in sources.module_files(rel):
+            if other == rel:
+                continue
+            other_text = sources.text(other)
+            service_body = _method_body(other_text, method)
+            if service_body:
+                calls.extend(calls_in(service_body, _with_helpers(other_text, service_body), models))
+                break
+    return calls
+
+
+def _covered(cols, indexes):
+    # an existing btree index whose leading columns are cols
+    return any(idx["type"] == "BTree" and idx["fields"][:len(cols)] == cols for idx in indexes)
+
+
+def candidates(model, usage):
+    # equality, then sort, then range (ESR); OR-ed and pattern filters get their
+    # own indexes; equality on an @id/@unique column is already a point lookup
+    unique = {idx["fields"][0] for idx in model["indexes"] if idx["kind"] != "index" and len(idx["fields"]) == 1}
+    eq = sorted(f for f, ops in usage.items() if "eq" in ops and f not in unique)
+    sort = sorted(f for f, ops in usage.items() if "sort" in ops)
+    ranges = sorted(f for f, ops in usage.items() if "range" in ops and f not in sort)
+    out = []
+    for s in sort or [None]:
+        cols = eq + ([s] if s else []) + ranges[:1]
+        if cols:
+            out.append(("btree", cols))
+    for f, ops in sorted(usage.items()):
+        if "like" in ops or "or:like" in ops:
+            out.append(("trgm", [f]))
+        if "has" in ops or "or:has" in ops:
+            out.append(("gin", [f]))
+        if "prefix" in ops or ({"or:eq", "or:prefix", "or:range"} & ops and not ops & {"eq", "range", "prefix"}):
+            out.append(("btree", [f]))
+    return out
+
+
+def _sql(model, kind, cols):
+    table = model["table"]
+    columns = [model["fields"][c]["column"] for c in cols]
+    name = f"{table}_{'_'.join(columns)}_{'trgm_' if kind == 'trgm' else ''}idx"
+    if kind == "trgm":
+        using = f' USING gin ("{columns[0]}" gin_trgm_ops)'
+    elif kind == "gin":
+        using = f' USING gin ("{columns[0]}")'
+    else:
+        using = " (" + ", ".join(f'"{c}"' for c in columns) + ")"
+    return f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON "{table}"{using};'
+
+
+def _prisma(kind, cols):
+    if kind == "trgm":
+        return f'@@index([{cols[0]}(ops: raw("gin_trgm_ops"))], type: Gin)'
+    if kind == "gin":
+        return f"@@index([{cols[0]}], type: Gin)"
+    return f"@@index([{', '.join(cols)}])"
+
+
+def advise(endpoints, models, sources):
+    report = {"endpoints": {}, "models": {}, "foreignKeys": []}
+    wanted = {}
+    for ep in endpoints:
+        key = operation_key(ep)
+        entries = []
+        for model_name, action, usage in trace_endpoint(ep, sources, models):
+            for name, fields in usage.items():
+                entries.append({
+                    "model": name,
+                    "action": action if name == model_name else f"{action} via {model_name}",
+                    "fields": {f: sorted(ops) for f, ops in sorted(fields.items())},
+                })
+                if action.startswith(("find", "count", "aggregate", "groupBy", "update", "delete")):
+                    for kind, cols in candidates(models[name], fields):
+                        wanted.setdefault((name, kind, tuple(cols)), []).append(key)
+        if entries:
+            report["endpoints"][key] = {"source": ep["source"], "queries": entries}
+
+    suggested = {}
+    for (name, kind, cols), keys in wanted.items():
+        model = models[name]
+        if kind == "btree" and _covered(list(cols), model["indexes"]):
+            continue
+        if kind == "gin" and any(idx["type"] == "Gin" and idx["fields"] == list(cols) for idx in model["indexes"]):
+            continue
+        suggested[(name, kind, cols)] = set(keys)
+    # a btree on a leading prefix of another suggestion is served by that one;
+    # longest first, so chains of prefixes fold into the widest index
+    for name, kind, cols in sorted(suggested, key=lambda k: -len(k[2])):
+        if kind != "btree":
+            continue
+        wider = next(
+            (k for k in suggested if k[0] == name and k[1] == "btree" and len(k[2]) > len(cols) and k[2][: len(cols)] == cols),
+            None,
+        )
+        if wider is not None:
+            suggested[wider] |= suggested.pop((name, kind, cols))
+
+    for (name, kind, cols), keys in sorted(suggested.items()):
+        model = models[name]
+        cols = list(cols)
+        entry = report["models"].setdefault(name, {
+            "existing": [idx["fields"] for idx in model["indexes"]],
+            "missing": [],
+        })
+        entry["missing"].append({
+            "kind": {"btree": "composite" if len(cols) > 1 else "btree", "trgm": "trigram", "gin": "gin"}[kind],
+            "fields": cols,
+            "endpoints": sorted(set(keys)),
+            "prisma": _prisma(kind, cols),
+            "sql": _sql(model, kind, cols),
+        })
+
+    if any(m["kind"] == "trigram" for entry in report["models"].values() for m in entry["missing"]):
+        report["requires"] = [
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm;",
+            'generator client { previewFeatures = ["postgresqlExtensions"] }',
+            "datasource db { extensions = [pg_trgm] }",
+        ]
+
+    # Prisma does not create indexes for relation scalars on PostgreSQL
+    for name, model in sorted(models.items()):
+        for cols in model["foreignKeys"]:
+            if not _covered(cols, model["indexes"]):
+                report["foreignKeys"].append({"model": name, "fields": cols, "prisma": _prisma("btree", cols)})
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suggest Prisma indexes for the filters and sorts behind contract operations")
+    parser.add_argument("--schema", default=SCHEMA_PATH, help="schema.prisma to read")
+    parser.add_argument("--root", default=REPO_ROOT, help=f"repository root holding {CONTROLLER_ROOT}")
+    parser.add_argument("--only", action="append", default=[], help="operation key to report, e.g. 'GET /discover'")
+    parser.add_argument("--fail-on-missing", action="store_true", help="exit 1 when an index is missing")
+    args = parser.parse_args(argv)
+
+    with open(args.schema, encoding="utf-8") as f:
+        models = parse_schema(f.read())
+    endpoints, _ = extract_endpoints(args.root)
+    if args.only:
+        endpoints = [ep for ep in endpoints if operation_key(ep) in set(args.only)]
+    report = advise(endpoints, models, SourceIndex(args.root))
+    json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    missing = [m for entry in report["models"].values() for m in entry["missing"]]
+    for name, entry in report["models"].items():
+        for item in entry["missing"]:
+            print(f"{name}: {item['prisma']}  <- {', '.join(item['endpoints'])}", file=sys.stderr)
+    print(
+        f"{len(report['endpoints'])} operations query Prisma; {len(missing)} missing indexes, "
+        f"{len(report['foreignKeys'])} unindexed foreign keys",
+        file=sys.stderr,
+    )
+    return 1 if args.fail_on_missing and missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
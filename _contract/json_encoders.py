@@ -0,0 +1,241 @@
+import argparse
+import json
+import keyword
+import os
+import re
+import sys
+import time
+
+from ref_graph import REF_PREFIX
+
+# The generated functions return the same text as
+# json.dumps(obj, ensure_ascii=False, separators=(",", ":")) whenever obj has
+# exactly the schema's keys with the schema's types; key order then follows the
+# schema. Anything else (missing or extra keys, wrong types, free-form values)
+# falls back to that json.dumps call for the whole object, so output is always
+# valid JSON.
+
+PRELUDE = '''\
+import json
+from json.encoder import encode_basestring as _s
+
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_INF = float("inf")
+
+
+def _int(v):
+    return str(v) if v.__class__ is int else _dumps(v)
+
+
+def _num(v):
+    if v.__class__ is int or (v.__class__ is float and -_INF < v < _INF):
+        return repr(v)
+    return _dumps(v)
+
+
+def _bool(v):
+    return "true" if v is True else "false" if v is False else _dumps(v)
+'''
+
+POSTLUDE = '''
+
+def encode(name, obj):
+    return ENCODERS[name](obj)
+
+
+def encode_array(name, items, write):
+    # streams a JSON array of schema objects to write() one item at a time
+    encoder = ENCODERS[name]
+    write("[")
+    for i, item in enumerate(items):
+        if i:
+            write(",")
+        write(encoder(item))
+    write("]")
+'''
+
+
+def _identifier(name):
+    ident = re.sub(r"\W", "_", name)
+    return ident if ident.isidentifier() and not keyword.iskeyword(ident) else "_" + ident
+
+
+def _types(schema):
+    types = schema.get("type", "object" if "properties" in schema else None)
+    if isinstance(types, list):
+        return [t for t in types if t != "null"], "null" in types
+    return ([types] if types else []), False
+
+
+class _Compiler:
+    def __init__(self, schemas):
+        self.schemas = schemas
+        self.functions = []
+        self.names = {}
+
+    def schema_function(self, name):
+        # top-level component encoders are compiled on first reference so
+        # recursive $refs resolve to the same function
+        if name not in self.names:
+            fname = self.names[name] = "_e_" + _identifier(name)
+            schema = self.schemas.get(name) or {}
+            if _types(schema)[0] in ([], ["object"]):
+                self.object_function(fname, schema)
+            else:
+                self.functions.append(f"def {fname}(o):\n    return {self.value(schema, 'o', fname)}\n")
+        return self.names[name]
+
+    def object_function(self, fname, schema):
+        props = schema.get("properties") or {}
+        types, _ = _types(schema)
+        if not props or types not in ([], ["object"]) or any(k in schema for k in ("oneOf", "anyOf", "allOf")):
+            self.functions.append(f"def {fname}(o):\n    return _dumps(o)\n")
+            return
+        lines = [f"def {fname}(o):", "    try:"]
+        lines.append(f"        if o.__class__ is not dict or len(o) != {len(props)}:")
+        lines.append("            return _dumps(o)")
+        parts = []
+        for i, (key, prop) in enumerate(props.items()):
+            var = f"v{i}"
+            lines.append(f"        {var} = o[{key!r}]")
+            # key bytes are literals in the f-string below (single-quoted, so
+            # the expressions use double quotes), braces doubled
+            literal = ("{" if i == 0 else ",") + json.dumps(key, ensure_ascii=False) + ":"
+            parts.append(literal.replace("{", "{{").replace("}", "}}").replace("\\", "\\\\").replace("'", "\\'"))
+            parts.append("{" + self.value(prop, var, f"{fname}_{_identifier(key)}") + "}")
+        parts.append("}}")
+        lines.append("        return f'" + "".join(parts) + "'")
+        lines.append("    except (KeyError, TypeError):")
+        lines.append("        return _dumps(o)")
+        self.functions.append("\n".join(lines) + "\n")
+
+    def value(self, schema, var, fname):
+        # a Python expression for the JSON text of var
+        if not isinstance(schema, dict):
+            return f"_dumps({var})"
+        ref = schema.get("$ref")
+        if ref and ref.startswith(REF_PREFIX):
+            return f"{self.schema_function(ref[len(REF_PREFIX):])}({var})"
+        if any(k in schema for k in ("$ref", "oneOf", "anyOf", "allOf", "enum", "const")):
+            return f"_dumps({var})"
+        types, nullable = _types(schema)
+        if len(types) != 1:
+            return f"_dumps({var})"
+        kind = types[0]
+        if kind == "string":
+            expr = f"_s({var})"
+        elif kind == "integer":
+            expr = f"_int({var})"
+        elif kind == "number":
+            expr = f"_num({var})"
+        elif kind == "boolean":
+            expr = f"_bool({var})"
+        elif kind == "object" and schema.get("properties"):
+            self.object_function(fname, schema)
+            expr = f"{fname}({var})"
+        elif kind == "array" and isinstance(schema.get("items"), dict):
+            item = self.item_function(schema["items"], fname + "_item")
+            if item is None:
+                expr = f"_dumps({var})"
+            else:
+                # arrays of known shapes are joined item by item; anything else
+                # (free-form items) goes to json.dumps in one call
+                expr = f'("[" + ",".join(map({item}, {var})) + "]" if {var}.__class__ is list else _dumps({var}))'
+        else:
+            expr = f"_dumps({var})"
+        if nullable:
+            expr = f'("null" if {var} is None else {expr})'
+        return expr
+
+    def item_function(self, schema, fname):
+        ref = schema.get("$ref")
+        if ref and ref.startswith(REF_PREFIX):
+            return self.schema_function(ref[len(REF_PREFIX):])
+        types, nullable = _types(schema)
+        if nullable or len(types) != 1:
+            return None
+        if types == ["string"]:
+            return "_s"
+        if types == ["object"] and schema.get("properties"):
+            self.object_function(fname, schema)
+            return fname
+        return None
+
+
+def render_module(schemas):
+    compiler = _Compiler(schemas)
+    for name in schemas:
+        compiler.schema_function(name)
+    table = "".join(f"    {name!r}: {fname},\n" for name, fname in compiler.names.items())
+    return (
+        "# Generated by _contract/build_contract.py --encoders; do not edit.\n"
+        + PRELUDE
+        + "\n\n"
+        + "\n\n".join(compiler.functions)
+        + "\n\nENCODERS = {\n"
+        + table
+        + "}\n"
+        + POSTLUDE
+    )
+
+
+def compile_encoders(schemas):
+    # name -> encoder(obj) -> str, built in memory without writing the module
+    namespace = {}
+    exec(compile(render_module(schemas), "<schema_encoders>", "exec"), namespace)
+    return namespace["ENCODERS"]
+
+
+def write_module(schemas, path):
+    text = render_module(schemas)
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare schema-compiled encoders with json.dumps on sample payloads")
+    parser.add_argument("schema", nargs="*", help="component names (default: every schema)")
+    parser.add_argument("--items", type=int, default=1000, help="copies of each array item in the sample payload")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--contract", help="emitted api-contract.json to read instead of build_contract.py")
+    args = parser.parse_args(argv)
+
+    from build_contract import load_contract
+    from mock_server import sample_value
+
+    schemas = load_contract(args.contract)["components"]["schemas"]
+    encoders = compile_encoders(schemas)
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    for name in args.schema or schemas:
+        value = sample_value(schemas[name], schemas)
+        if isinstance(value, dict):
+            # grow array fields so the payload is worth timing
+            value = {k: v * args.items if isinstance(v, list) else v for k, v in value.items()}
+        encoded = encoders[name](value)
+        if json.loads(encoded) != value:
+            print(f"{name}: encoder output differs from the input", file=sys.stderr)
+            return 1
+        timings = []
+        for fn in (dumps, encoders[name]):
+            best = None
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                fn(value)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings.append(best)
+        print(f"{name}: {len(encoded)} bytes, json.dumps {timings[0] * 1e6:.1f}us, compiled {timings[1] * 1e6:.1f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,367 @@
+import argparse
+import asyncio
+import glob
+import json
+import math
+import os
+import random
+import re
+import shlex
+import ssl
+import sys
+import time
+from urllib.parse import urlsplit
+
+from mock_server import sample_value
+from ref_graph import operation_key
+from route_index import RouteIndex
+
+CONTRACT_DIR = os.path.dirname(os.path.abspath(__file__))
+EXAMPLES_DIR = os.path.join(CONTRACT_DIR, "examples")
+
+DEFAULT_MIX = {
+    "GET /discover": 4,
+    "GET /posts": 4,
+    "POST /posts": 1,
+    "POST /chats/message": 2,
+    "POST /store/purchases/confirm": 1,
+}
+_PARAM = re.compile(r"\{(\w+)\}")
+_TEMPLATE = re.compile(r"\{\{\s*(\w+)\s*\}\}|\$(TOKEN)\b")
+
+
+class LatencyHistogram:
+    # HDR-style log-linear buckets over microseconds: every power of two is split
+    # into 2**(sub_bits - 1) linear buckets, so values keep ~1% relative precision
+    def __init__(self, sub_bits=7, highest_us=60_000_000):
+        self.sub_bits = sub_bits
+        self.sub_count = 1 << sub_bits
+        self.half = self.sub_count >> 1
+        self.counts = [0] * (self._index(highest_us) + 1)
+        self.total = 0
+        self.min = None
+        self.max = 0
+        self.sum = 0
+
+    def _index(self, value):
+        if value < self.sub_count:
+            return value
+        shift = value.bit_length() - self.sub_bits
+        return self.sub_count + (shift - 1) * self.half + ((value >> shift) - self.half)
+
+    def _value(self, index):
+        # upper edge of the bucket, so percentiles never under-report
+        if index < self.sub_count:
+            return index
+        shift, offset = divmod(index - self.sub_count, self.half)
+        shift += 1
+        return ((self.half + offset + 1) << shift) - 1
+
+    def record(self, value_us):
+        value_us = max(0, int(value_us))
+        index = min(self._index(value_us), len(self.counts) - 1)
+        self.counts[index] += 1
+        self.total += 1
+        self.sum += value_us
+        if self.min is None or value_us < self.min:
+            self.min = value_us
+        if value_us > self.max:
+            self.max = value_us
+
+    def merge(self, other):
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total += other.total
+        self.sum += other.sum
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+    def percentile(self, p):
+        if not self.total:
+            return 0
+        rank = max(1, math.ceil(p / 100 * self.total))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._value(index), self.max)
+        return self.max
+
+    def to_dict(self):
+        ms = lambda us: round(us / 1000, 3)
+        return {
+            "count": self.total,
+            "minMs": ms(self.min or 0),
+            "meanMs": ms(self.sum / self.total) if self.total else 0,
+            "p50Ms": ms(self.percentile(50)),
+            "p90Ms": ms(self.percentile(90)),
+            "p99Ms": ms(self.percentile(99)),
+            "p999Ms": ms(self.percentile(99.9)),
+            "maxMs": ms(self.max),
+            # [bucket upper edge in us, count] for the non-empty buckets
+            "buckets": [[self._value(i), c] for i, c in enumerate(self.counts) if c],
+        }
+
+
+def parse_example(text, filename):
+    # .http (method URL, headers, blank line, body) or a curl command line
+    if filename.endswith(".curl"):
+        args = shlex.split(text.replace("\\\n", " "))
+        method, url, headers, body = None, None, {}, None
+        i = 1
+        while i < len(args):
+            arg = args[i]
+            if arg in ("-X", "--request"):
+                method = args[i + 1]
+                i += 1
+            elif arg in ("-H", "--header"):
+                name, _, value = args[i + 1].partition(":")
+                headers[name.strip()] = value.strip()
+                i += 1
+            elif arg in ("-d", "--data", "--data-raw"):
+                body = args[i + 1]
+                i += 1
+            elif not arg.startswith("-"):
+                url = arg
+            i += 1
+        method = method or ("POST" if body is not None else "GET")
+    else:
+        head, _, body = text.strip().partition("\n\n")
+        lines = head.splitlines()
+        method, url = lines[0].split()[:2]
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip()] = value.strip()
+        body = body.strip() or None
+    return {"method": method.upper(), "path": urlsplit(url).path or "/", "headers": headers, "body": body}
+
+
+def load_examples(index, directory=EXAMPLES_DIR):
+    # operation key -> example request, matched against the contract routes
+    examples = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*"))):
+        if not path.endswith((".http", ".curl")):
+            continue
+        with open(path, encoding="utf-8") as f:
+            example = parse_example(f.read(), path)
+        found = index.match(example["method"], example["path"])
+        if found is not None:
+            examples.setdefault(operation_key(found["endpoint"]), example)
+    return examples
+
+
+def parse_mix(spec):
+    mix = {}
+    for item in spec.split(","):
+        key, _, weight = item.rpartition("=")
+        if not key:
+            key, weight = weight, "1"
+        method, _, path = key.strip().partition(" ")
+        mix[f"{method.upper()} {path.strip()}"] = float(weight)
+    return mix
+
+
+def build_requests(contract, mix, host, token=None, params=None, base_path=""):
+    # operation key -> ready-to-send request bytes (params filled, body encoded)
+    schemas = contract["components"]["schemas"]
+    by_key = {operation_key(ep): ep for ep in contract["endpoints"]}
+    index = RouteIndex(contract["endpoints"])
+    examples = load_examples(index)
+    params = params or {}
+    variables = {"token": token or "", "TOKEN": token or ""}
+    requests = {}
+    for key in mix:
+        ep = by_key.get(key)
+        if ep is None:
+            raise SystemExit(f"{key}: not in the contract")
+        # the base URL's path is the proxy prefix, e.g. /api behind infra/nginx.conf
+        path = base_path + _PARAM.sub(lambda m: params.get(m.group(1), "1"), ep["path"])
+        example = examples.get(key)
+        if example is not None and example["body"] is not None:
+            body = _TEMPLATE.sub(lambda m: variables.get(m.group(1) or m.group(2), ""), example["body"])
+            body = json.dumps(json.loads(body), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        elif ep.get("requestSchema"):
+            body = json.dumps(sample_value(ep["requestSchema"], schemas), separators=(",", ":")).encode("utf-8")
+        else:
+            body = b""
+        head = [f"{ep['method']} {path} HTTP/1.1", f"Host: {host}", "Accept: application/json"]
+        if token and not ep.get("public"):
+            head.append(f"Authorization: Bearer {token}")
+        if body or ep["method"] in ("POST", "PUT", "PATCH"):
+            head.append("Content-Type: application/json")
+            head.append(f"Content-Length: {len(body)}")
+        requests[key] = ("\r\n".join(head) + "\r\n\r\n").encode("utf-8") + body
+    return requests
+
+
+async def _read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    length = 0
+    chunked = False
+    close = False
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        name = name.lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "transfer-encoding":
+            chunked = "chunked" in value.lower()
+        elif name == "connection":
+            close = value.strip().lower() == "close"
+    if chunked:
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif length:
+        await reader.readexactly(length)
+    return status, close
+
+
+class ConnectionPool:
+    def __init__(self, host, port, tls, size):
+        self.host = host
+        self.port = port
+        self.ssl = ssl.create_default_context() if tls else None
+        self.size = size
+        self.idle = asyncio.LifoQueue()
+        self.opened = 0
+        self.slots = asyncio.Semaphore(size)
+
+    async def acquire(self):
+        await self.slots.acquire()
+        if not self.idle.empty():
+            return self.idle.get_nowait()
+        self.opened += 1
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    def release(self, conn, reuse):
+        if reuse:
+            self.idle.put_nowait(conn)
+        else:
+            conn[1].close()
+        self.slots.release()
+
+    def close(self):
+        while not self.idle.empty():
+            self.idle.get_nowait()[1].close()
+
+
+async def run_load(url, requests, mix, rate, duration, connections, timeout=10.0, poisson=False, seed=None):
+    # open loop: arrivals follow the schedule no matter how slow responses are,
+    # and latency is measured from the scheduled start so queueing is counted
+    parts = urlsplit(url)
+    tls = parts.scheme == "https"
+    pool = ConnectionPool(parts.hostname, parts.port or (443 if tls else 80), tls, connections)
+    keys = list(mix)
+    weights = [mix[k] for k in keys]
+    rng = random.Random(seed)
+    histograms = {key: LatencyHistogram() for key in keys}
+    statuses = {key: {} for key in keys}
+    errors = {}
+    pending = set()
+
+    async def one(key, scheduled):
+        conn = None
+        reuse = False
+        try:
+            conn = await pool.acquire()
+            reader, writer = conn
+            writer.write(requests[key])
+            status, close = await asyncio.wait_for(_read_response(reader), timeout)
+            reuse = not close
+            histograms[key].record((time.perf_counter() - scheduled) * 1e6)
+            statuses[key][status] = statuses[key].get(status, 0) + 1
+        except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, asyncio.LimitOverrunError, ValueError) as exc:
+            name = type(exc).__name__
+            errors[name] = errors.get(name, 0) + 1
+        finally:
+            if conn is not None:
+                pool.release(conn, reuse)
+
+    loop_start = time.perf_counter()
+    scheduled = loop_start
+    sent = 0
+    while scheduled - loop_start < duration:
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        key = rng.choices(keys, weights)[0]
+        task = asyncio.ensure_future(one(key, scheduled))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+        sent += 1
+        scheduled += rng.expovariate(rate) if poisson else 1.0 / rate
+    if pending:
+        await asyncio.wait(pending)
+    elapsed = time.perf_counter() - loop_start
+    pool.close()
+
+    overall = LatencyHistogram()
+    for histogram in histograms.values():
+        overall.merge(histogram)
+    return {
+        "target": url,
+        "rate": rate,
+        "durationSeconds": duration,
+        "elapsedSeconds": round(elapsed, 3),
+        "connections": {"max": connections, "opened": pool.opened},
+        "sent": sent,
+        "completed": overall.total,
+        "achievedRate": round(overall.total / elapsed, 1) if elapsed else 0,
+        "errors": errors,
+        "overall": overall.to_dict(),
+        "operations": {
+            key: {"weight": mix[key], "statuses": statuses[key], **histograms[key].to_dict()} for key in keys
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drive a weighted, open-loop traffic mix at a tok-friends API")
+    parser.add_argument("url", help="base URL, e.g. http://127.0.0.1:4000")
+    parser.add_argument("--mix", help='weighted operations, e.g. "GET /discover=4,POST /chats/message=1"')
+    parser.add_argument("--rate", type=float, default=1000, help="requests per second (arrival rate)")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--connections", type=int, default=64, help="keep-alive connections in the pool")
+    parser.add_argument("--poisson", action="store_true", help="exponential inter-arrival times instead of a fixed interval")
+    parser.add_argument("--token", default=os.environ.get("TOKEN"), help="bearer token (default: $TOKEN)")
+    parser.add_argument("--param", action="append", default=[], help="path parameter value, e.g. id=42")
+    parser.add_argument("--timeout", type=float, default=10)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--contract", help="emitted api-contract.json to read instead of build_contract.py")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    from build_contract import load_contract
+
+    mix = parse_mix(args.mix) if args.mix else DEFAULT_MIX
+    params = dict(p.split("=", 1) for p in args.param)
+    target = urlsplit(args.url)
+    requests = build_requests(load_contract(args.contract), mix, target.netloc, args.token, params, target.path.rstrip("/"))
+    report = asyncio.run(
+        run_load(args.url, requests, mix, args.rate, args.duration, args.connections, args.timeout, args.poisson, args.seed)
+    )
+    text = json.dumps(report, ensure_ascii=False, indent=2) + "\n"
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    overall = report["overall"]
+    print(
+        f"{report['completed']}/{report['sent']} completed at {report['achievedRate']}/s, "
+        f"p50 {overall['p50Ms']}ms p99 {overall['p99Ms']}ms, {sum(report['errors'].values())} errors",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+import argparse
+import glob
+import gzip
+import json
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from load_gen import LatencyHistogram
+from route_index import RouteIndex
+
+# combined format, optionally followed by $request_time and $upstream_response_time
+# (the "contract" log_format in infra/nginx.conf)
+LOG_LINE = re.compile(
+    r'^(\S+) \S+ \S+ \[([^\]]+)\] "(\S+) (\S+)[^"]*" (\d{3}) \S+(?: "[^"]*" "[^"]*")?'
+    r"(?: (\d+(?:\.\d+)?|-))?(?: (\d+(?:\.\d+)?|-))?"
+)
+ROUTE_CACHE_SIZE = 65536
+TOP_UNMATCHED = 50
+
+
+class SpaceSaving:
+    # top-k heavy hitters in fixed memory (Metwally et al.); counts are upper bounds
+    def __init__(self, k=TOP_UNMATCHED):
+        self.k = k
+        self.counts = {}
+
+    def add(self, key, count=1):
+        counts = self.counts
+        if key in counts:
+            counts[key] += count
+        elif len(counts) < self.k:
+            counts[key] = count
+        else:
+            victim = min(counts, key=counts.get)
+            counts[key] = counts.pop(victim) + count
+
+    def merge(self, other):
+        for key, count in other.counts.items():
+            self.add(key, count)
+
+    def top(self):
+        return sorted(self.counts.items(), key=lambda item: -item[1])
+
+
+class OperationStats:
+    __slots__ = ("count", "statuses", "latency", "upstream")
+
+    def __init__(self):
+        self.count = 0
+        self.statuses = {}
+        self.latency = LatencyHistogram()
+        self.upstream = LatencyHistogram()
+
+    def merge(self, other):
+        self.count += other.count
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        self.latency.merge(other.latency)
+        self.upstream.merge(other.upstream)
+
+
+def _seconds_to_us(value):
+    return None if value is None or value == "-" else int(float(value) * 1e6)
+
+
+def parse_time(text):
+    try:
+        return datetime.strptime(text, "%d/%b/%Y:%H:%M:%S %z")
+    except ValueError:
+        return None
+
+
+def open_log(path):
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, encoding="utf-8", errors="replace")
+
+
+def analyze_file(path, endpoints, strip_prefix):
+    # one pass over one file; memory is bounded by the operation count, the
+    # route cache and the unmatched sketch, not by the file size
+    index = RouteIndex(endpoints, strip_prefix=strip_prefix, require_prefix=True)
+    operations = {}
+    unmatched = SpaceSaving()
+    routes = {}
+    lines = malformed = 0
+    first = last = None
+    match_line = LOG_LINE.match
+    with open_log(path) as f:
+        for line in f:
+            lines += 1
+            m = match_line(line)
+            if m is None:
+                malformed += 1
+                continue
+            _, stamp, method, target, status, request_time, upstream_time = m.groups()
+            if first is None:
+                first = stamp
+            last = stamp
+            path_only = target.split("?", 1)[0]
+            route_key = method + " " + path_only
+            key = routes.get(route_key)
+            if key is None:
+                found = index.match(method, path_only)
+                key = f"{found['endpoint']['method'].upper()} {found['endpoint']['path']}" if found else ""
+                if len(routes) >= ROUTE_CACHE_SIZE:
+                    routes.clear()
+                routes[route_key] = key
+            if not key:
+                unmatched.add(route_key)
+                continue
+            stats = operations.get(key)
+            if stats is None:
+                stats = operations[key] = OperationStats()
+            stats.count += 1
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            latency = _seconds_to_us(request_time)
+            if latency is not None:
+                stats.latency.record(latency)
+            upstream = _seconds_to_us(upstream_time)
+            if upstream is not None:
+                stats.upstream.record(upstream)
+    return {
+        "file": path,
+        "lines": lines,
+        "malformed": malformed,
+        "first": first,
+        "last": last,
+        "operations": operations,
+        "unmatched": unmatched,
+    }
+
+
+def _analyze_job(args):
+    return analyze_file(*args)
+
+
+def expand(paths):
+    files = []
+    for pattern in paths:
+        matches = sorted(glob.glob(pattern)) if pattern != "-" else ["-"]
+        files.extend(matches or [pattern])
+    return files
+
+
+def analyze(paths, endpoints, strip_prefix="/api", jobs=None):
+    files = expand(paths)
+    work = [(path, endpoints, strip_prefix) for path in files]
+    if len(work) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            partials = list(pool.map(_analyze_job, work))
+    else:
+        partials = [_analyze_job(item) for item in work]
+
+    operations = {}
+    unmatched = SpaceSaving()
+    lines = malformed = 0
+    times = []
+    for partial in partials:
+        lines += partial["lines"]
+        malformed += partial["malformed"]
+        unmatched.merge(partial["unmatched"])
+        for stamp in (partial["first"], partial["last"]):
+            parsed = parse_time(stamp) if stamp else None
+            if parsed is not None:
+                times.append(parsed)
+        for key, stats in partial["operations"].items():
+            if key in operations:
+                operations[key].merge(stats)
+            else:
+                operations[key] = stats
+
+    span = (max(times) - min(times)).total_seconds() if len(times) >= 2 else 0
+    matched = sum(stats.count for stats in operations.values())
+    report = {
+        "files": files,
+        "lines": lines,
+        "malformed": malformed,
+        "matched": matched,
+        "unmatched": lines - malformed - matched,
+        "from": min(times).isoformat() if times else None,
+        "to": max(times).isoformat() if times else None,
+        "operations": {},
+        "topUnmatched": [{"request": key, "count": count} for key, count in unmatched.top()],
+    }
+    for key, stats in sorted(operations.items(), key=lambda item: -item[1].count):
+        entry = {
+            "count": stats.count,
+            "share": round(stats.count / matched, 4) if matched else 0,
+            "ratePerSecond": round(stats.count / span, 3) if span else None,
+            "statuses": dict(sorted(stats.statuses.items())),
+        }
+        for name, histogram in (("latency", stats.latency), ("upstreamLatency", stats.upstream)):
+            if histogram.total:
+                summary = histogram.to_dict()
+                summary.pop("buckets")
+                entry[name] = summary
+        report["operations"][key] = entry
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Map nginx access logs to contract operations")
+    parser.add_argument("logs", nargs="+", help="access log files or globs (.gz allowed, - for stdin)")
+    parser.add_argument("--strip-prefix", default="/api", help="proxy prefix removed before matching (default: /api)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes across files (default: CPU count)")
+    parser.add_argument("--contract", help="emitted api-contract.json to read instead of build_contract.py")
+    parser.add_argument("--top", type=int, default=0, help="only print the N busiest operations")
+    args = parser.parse_args(argv)
+
+    from build_contract import load_contract
+
+    report = analyze(args.logs, load_contract(args.contract)["endpoints"], args.strip_prefix, args.jobs)
+    if args.top:
+        report["operations"] = dict(list(report["operations"].items())[:args.top])
+    json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    print(
+        f"{report['lines']} lines, {report['matched']} matched to {len(report['operations'])} operations, "
+        f"{report['unmatched']} unmatched, {report['malformed']} malformed",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
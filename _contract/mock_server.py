@@ -0,0 +1,278 @@
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import sys
+from http import HTTPStatus
+
+from json_encoders import compile_encoders
+from ref_graph import REF_PREFIX, operation_key
+from route_index import RouteIndex
+
+# distinct request lines seen with path parameters; bounded so ids in paths
+# cannot grow it without limit
+ROUTE_CACHE_SIZE = 8192
+MAX_HEADER_BYTES = 65536
+
+_FORMATS = {
+    "email": "user@example.com",
+    "date-time": "2025-01-01T00:00:00.000Z",
+    "date": "2025-01-01",
+    "uri": "https://example.com/",
+    "uuid": "00000000-0000-4000-8000-000000000000",
+}
+
+
+def sample_value(schema, schemas, name=None, seen=()):
+    # a deterministic value that satisfies schema; recursive $refs end in null/{}
+    if not isinstance(schema, dict):
+        return None
+    ref = schema.get("$ref")
+    if ref:
+        target = ref[len(REF_PREFIX):]
+        if target in seen:
+            return None
+        return sample_value(schemas.get(target), schemas, name, seen + (target,))
+    for key in ("example", "default", "const"):
+        if key in schema:
+            return schema[key]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    for key in ("oneOf", "anyOf"):
+        if schema.get(key):
+            return sample_value(schema[key][0], schemas, name, seen)
+    if schema.get("allOf"):
+        merged = {}
+        for part in schema["allOf"]:
+            value = sample_value(part, schemas, name, seen)
+            if isinstance(value, dict):
+                merged.update(value)
+        return merged
+
+    types = schema.get("type", "object" if "properties" in schema else None)
+    if isinstance(types, list):
+        types = next((t for t in types if t != "null"), "null")
+    if types == "object":
+        return {
+            key: sample_value(prop, schemas, key, seen)
+            for key, prop in (schema.get("properties") or {}).items()
+        }
+    if types == "array":
+        return [sample_value(schema.get("items"), schemas, name, seen)] if "items" in schema else []
+    if types == "string":
+        value = _FORMATS.get(schema.get("format")) or (name or "string")
+        return value.ljust(schema.get("minLength", 0), "x")
+    if types == "integer":
+        return max(1, schema.get("minimum", 1))
+    if types == "number":
+        return max(1.0, schema.get("minimum", 1.0))
+    if types == "boolean":
+        return True
+    return None
+
+
+def _response(status, body=b"", extra_headers=()):
+    head = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}", f"Content-Length: {len(body)}"]
+    if body:
+        head.append("Content-Type: application/json")
+    head.extend(extra_headers)
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+
+def _json(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def build_responses(contract):
+    # operation key -> complete HTTP response bytes, built once at startup
+    schemas = contract["components"]["schemas"]
+    encoders = compile_encoders(schemas)
+    responses = {}
+    for ep in contract["endpoints"]:
+        statuses = sorted(s for s in ep.get("responses") or {} if str(s).startswith("2"))
+        status = int(statuses[0]) if statuses else 200
+        response = (ep.get("responses") or {}).get(str(status)) or {}
+        schema = ((response.get("content") or {}).get("application/json") or {}).get("schema")
+        ref = (schema or {}).get("$ref", "")
+        if ref.startswith(REF_PREFIX):
+            body = encoders[ref[len(REF_PREFIX):]](sample_value(schema, schemas)).encode("utf-8")
+        elif schema is not None:
+            body = _json(sample_value(schema, schemas))
+        else:
+            body = b"" if status == 204 else b"{}"
+        responses[operation_key(ep)] = _response(status, body)
+    return responses
+
+
+class MockApp:
+    def __init__(self, contract, strip_prefix=""):
+        self.index = RouteIndex(contract["endpoints"], strip_prefix=strip_prefix)
+        self.responses = build_responses(contract)
+        self.public = {operation_key(ep) for ep in contract["endpoints"] if ep.get("public")}
+        self.route_cache = {}
+        self.unauthorized = _response(
+            401, _json({"statusCode": 401, "message": "Unauthorized"}), ["WWW-Authenticate: Bearer"]
+        )
+        self.not_found = _response(404, _json({"statusCode": 404, "message": "Not Found"}))
+        self.bad_request = _response(400, _json({"statusCode": 400, "message": "Bad Request"}), ["Connection: close"])
+
+    def route(self, method, target):
+        # (response bytes, needs auth) for a request line
+        cache_key = method + " " + target
+        found = self.route_cache.get(cache_key)
+        if found is not None:
+            return found
+        match = self.index.match(method, target)
+        if match is not None:
+            key = operation_key(match["endpoint"])
+            found = (self.responses[key], key not in self.public)
+        else:
+            allowed = self.index.allowed_methods(target)
+            if allowed:
+                body = _json({"statusCode": 405, "message": "Method Not Allowed"})
+                found = (_response(405, body, [f"Allow: {', '.join(allowed)}"]), False)
+            else:
+                found = (self.not_found, False)
+        if len(self.route_cache) >= ROUTE_CACHE_SIZE:
+            self.route_cache.clear()
+        self.route_cache[cache_key] = found
+        return found
+
+
+class MockProtocol(asyncio.Protocol):
+    # HTTP/1.1 with keep-alive and pipelining; request bodies are skipped, not parsed
+    def __init__(self, app):
+        self.app = app
+        self.buffer = b""
+        self.skip = 0
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        buffer = self.buffer + data if self.buffer else data
+        if self.skip:
+            if len(buffer) <= self.skip:
+                self.skip -= len(buffer)
+                self.buffer = b""
+                return
+            buffer = buffer[self.skip:]
+            self.skip = 0
+        out = []
+        route = self.app.route
+        while True:
+            end = buffer.find(b"\r\n\r\n")
+            if end == -1:
+                break
+            head = buffer[:end].decode("latin-1")
+            buffer = buffer[end + 4:]
+            lines = head.split("\r\n")
+            parts = lines[0].split(" ")
+            if len(parts) != 3:
+                out.append(self.app.bad_request)
+                self.transport.write(b"".join(out))
+                self.transport.close()
+                return
+            length = 0
+            authorized = False
+            close = parts[2] == "HTTP/1.0"
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                name = name.lower()
+                if name == "content-length":
+                    try:
+                        length = int(value)
+                    except ValueError:
+                        length = -1
+                elif name == "authorization":
+                    scheme, _, token = value.strip().partition(" ")
+                    authorized = scheme.lower() == "bearer" and bool(token.strip())
+                elif name == "connection":
+                    close = value.strip().lower() == "close"
+            if length < 0:
+                # without a usable Content-Length the body cannot be framed
+                out.append(self.app.bad_request)
+                self.transport.write(b"".join(out))
+                self.transport.close()
+                return
+            response, needs_auth = route(parts[0], parts[1])
+            out.append(self.app.unauthorized if needs_auth and not authorized else response)
+            if length:
+                if len(buffer) < length:
+                    self.skip = length - len(buffer)
+                    buffer = b""
+                    break
+                buffer = buffer[length:]
+            if close:
+                self.transport.write(b"".join(out))
+                self.transport.close()
+                return
+        if out:
+            self.transport.write(b"".join(out))
+        if len(buffer) > MAX_HEADER_BYTES:
+            self.transport.write(self.app.bad_request)
+            self.transport.close()
+            return
+        self.buffer = buffer
+
+
+async def serve(app, host, port, reuse_port=False):
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(lambda: MockProtocol(app), host, port, reuse_port=reuse_port, backlog=1024)
+    stop = loop.create_future()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set_result, None)
+    async with server:
+        await stop
+
+
+def _run(app, host, port, reuse_port):
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(serve(app, host, port, reuse_port))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve sample responses for every contract operation")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--contract", help="emitted api-contract.json to read instead of build_contract.py")
+    parser.add_argument("--strip-prefix", default="", help="prefix removed before routing, e.g. /api")
+    parser.add_argument("--workers", type=int, default=1, help="processes sharing the port via SO_REUSEPORT")
+    args = parser.parse_args(argv)
+
+    from build_contract import load_contract
+
+    app = MockApp(load_contract(args.contract), args.strip_prefix)
+    print(f"Mock API for {len(app.responses)} operations on http://{args.host}:{args.port} ({args.workers} workers)")
+    if args.workers <= 1:
+        _run(app, args.host, args.port, False)
+        return 0
+    if not hasattr(socket, "SO_REUSEPORT"):
+        print("--workers needs SO_REUSEPORT", file=sys.stderr)
+        return 1
+    children = []
+    for _ in range(args.workers):
+        pid = os.fork()
+        if pid == 0:
+            _run(app, args.host, args.port, True)
+            os._exit(0)
+        children.append(pid)
+    try:
+        for pid in children:
+            os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+import argparse
+import os
+import re
+import sys
+
+CONTRACT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(CONTRACT_DIR)
+NGINX_CACHE_PATH = os.path.join(REPO_ROOT, "infra", "nginx-api-cache.conf")
+
+# keys_zone declared by proxy_cache_path in infra/nginx.conf
+CACHE_ZONE = "api_cache"
+PREFIX = "/api"
+UPSTREAM = "http://api:4000"
+
+HEADER = """\
+# Generated by _contract/build_contract.py from the `cache` hints on contract
+# endpoints; do not edit by hand.
+#
+# Only GET/HEAD responses are cached (the proxy_cache_methods default), so
+# writes on the same paths pass straight through. Public operations share one
+# cache entry per URL; operations with varyOnAuth add the Authorization
+# header to the key. The TTL comes from the contract rather than the upstream
+# Cache-Control. Where staleWhileRevalidate is set, nginx serves the stale
+# copy while one background request refreshes it (or while the API is down),
+# and the window is passed on to clients and CDNs in Cache-Control.
+"""
+
+
+def location(path, prefix=PREFIX):
+    # exact match for static paths; {param} segments become [^/]+ in an anchored regex
+    full = prefix + path
+    if "{" not in full:
+        return "= " + full
+    parts = re.split(r"\{[^}]+\}", full)
+    return "~ ^" + "[^/]+".join(re.escape(part) for part in parts) + "$"
+
+
+def cached_operations(contract_endpoints, public_paths):
+    # (path, hint) for GET operations with a cache hint, aliases included; checked
+    # against the public list so a per-user response never lands in a shared entry
+    public_paths = set(public_paths)
+    rules = []
+    for ep in contract_endpoints:
+        cache = ep.get("cache")
+        if ep["method"] != "GET" or not cache:
+            continue
+        if ep["path"] not in public_paths and not cache.get("varyOnAuth"):
+            raise ValueError(f"GET {ep['path']} requires auth; its cache hint needs varyOnAuth")
+        for path in [ep["path"], *(ep.get("aliases") or ())]:
+            rules.append((path, cache))
+    return rules
+
+
+def render(contract_endpoints, public_paths, prefix=PREFIX, upstream=UPSTREAM, zone=CACHE_ZONE):
+    blocks = [HEADER]
+    for path, cache in cached_operations(contract_endpoints, public_paths):
+        ttl = int(cache["ttl"])
+        swr = int(cache.get("staleWhileRevalidate") or 0)
+        vary = bool(cache.get("varyOnAuth"))
+        key = "$scheme$request_method$host$request_uri" + ("$http_authorization" if vary else "")
+        control = f"{'private' if vary else 'public'}, max-age={ttl}"
+        if swr:
+            control += f", stale-while-revalidate={swr}"
+        lines = [
+            f"# GET {path}: ttl {ttl}s, stale-while-revalidate {swr}s{', per Authorization' if vary else ''}",
+            f"location {location(path, prefix)} {{",
+            f"  rewrite ^{re.escape(prefix)}(/.*)$ $1 break;",
+            f"  proxy_pass {upstream};",
+            "  proxy_set_header Host $host;",
+            f"  proxy_cache {zone};",
+            f'  proxy_cache_key "{key}";',
+            f"  proxy_cache_valid 200 {ttl}s;",
+            "  proxy_ignore_headers Cache-Control Expires;",
+            "  proxy_cache_lock on;",
+        ]
+        if swr:
+            # without a stale window (e.g. /health) an upstream failure must not be masked
+            lines.append("  proxy_cache_use_stale updating error timeout http_500 http_502 http_503 http_504;")
+            lines.append("  proxy_cache_background_update on;")
+        lines.append("  proxy_hide_header Cache-Control;")
+        lines.append(f'  add_header Cache-Control "{control}";')
+        if vary:
+            lines.append("  add_header Vary Authorization;")
+        lines.append("  add_header X-Cache-Status $upstream_cache_status;")
+        lines.append("}")
+        blocks.append("\n".join(lines) + "\n")
+    return "\n".join(blocks)
+
+
+def write_if_changed(text, path=NGINX_CACHE_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return True
+
+
+def public_paths(contract):
+    # metadata.authentication.publicEndpoints when emitted, else the endpoints' own flags
+    auth = (contract.get("metadata") or {}).get("authentication") or {}
+    if "publicEndpoints" in auth:
+        return auth["publicEndpoints"]
+    return [ep["path"] for ep in contract["endpoints"] if ep.get("public")]
+
+
+def write_nginx_cache(api_contract, path=NGINX_CACHE_PATH):
+    return write_if_changed(render(api_contract["endpoints"], public_paths(api_contract)), path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the nginx proxy_cache include from contract cache hints")
+    parser.add_argument("--contract", help="emitted api-contract.json to read instead of build_contract.py")
+    parser.add_argument("--output", help=f"file to write (default: print; build_contract.py writes {os.path.relpath(NGINX_CACHE_PATH, REPO_ROOT)})")
+    args = parser.parse_args(argv)
+
+    from build_contract import load_contract
+
+    contract = load_contract(args.contract)
+    text = render(contract["endpoints"], public_paths(contract))
+    if args.output:
+        write_if_changed(text, args.output)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
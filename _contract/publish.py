@@ -0,0 +1,92 @@
+import gzip
+import hashlib
+import json
+import os
+
+CONTRACT_DIR = os.path.dirname(os.path.abspath(__file__))
+DIST_DIR = os.path.join(CONTRACT_DIR, "dist")
+# content-derived mtimes land in [MTIME_BASE, MTIME_BASE + MTIME_SPAN)
+MTIME_BASE = 1_000_000_000
+MTIME_SPAN = 1 << 28
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return lambda data: brotli.compress(data, quality=11)
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard.ZstdCompressor(level=19).compress
+
+
+# extension -> compressor factory; optional ones are skipped when not installed
+COMPRESSORS = {
+    ".gz": lambda: lambda data: gzip.compress(data, 9, mtime=0),
+    ".br": _brotli,
+    ".zst": _zstd,
+}
+
+
+def canonical_json(data):
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def canonical_contract(api_contract):
+    # generatedAt is left out so an unchanged spec publishes identical bytes
+    # (and so the same ETag) across builds
+    metadata = {k: v for k, v in api_contract["metadata"].items() if k != "generatedAt"}
+    return canonical_json({**api_contract, "metadata": metadata})
+
+
+def content_mtime(data):
+    # nginx builds the ETag from mtime and size; an mtime taken from the bytes
+    # gives the same ETag on every checkout or host that publishes them
+    digest = int.from_bytes(hashlib.sha256(data).digest()[:8], "big")
+    return MTIME_BASE + digest % MTIME_SPAN
+
+
+def _write_if_changed(path, data):
+    try:
+        with open(path, "rb") as f:
+            changed = f.read() != data
+    except FileNotFoundError:
+        changed = True
+    if changed:
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    mtime = content_mtime(data)
+    os.utime(path, (mtime, mtime))
+    return changed
+
+
+def publish(files, out_dir=DIST_DIR):
+    # files: name -> bytes; writes each one plus its precompressed siblings and
+    # returns name -> {extension: size} for what was written or already current
+    os.makedirs(out_dir, exist_ok=True)
+    compressors = {ext: factory() for ext, factory in COMPRESSORS.items()}
+    summary = {}
+    for name, data in files.items():
+        path = os.path.join(out_dir, name)
+        sizes = {"": len(data)}
+        changed = _write_if_changed(path, data)
+        for ext, compress in compressors.items():
+            if compress is None:
+                continue
+            if changed or not os.path.exists(path + ext):
+                _write_if_changed(path + ext, compress(data))
+            else:
+                with open(path + ext, "rb") as f:
+                    mtime = content_mtime(f.read())
+                os.utime(path + ext, (mtime, mtime))
+            sizes[ext] = os.path.getsize(path + ext)
+        summary[name] = sizes
+    return summary
@@ -0,0 +1,265 @@
+import argparse
+import bisect
+import heapq
+import json
+import math
+import random
+import sys
+from collections import deque
+
+from load_gen import DEFAULT_MIX, parse_mix
+from log_analyzer import LOG_LINE, expand, open_log, parse_time
+from ref_graph import operation_key
+from route_index import RouteIndex
+
+# rough V8 cost of one `buckets` entry: the Map slot plus a {tokens, ts}
+# object with two doubles; the key string is counted separately
+BUCKET_ENTRY_BYTES = 96
+SAMPLE_SECONDS = 60
+
+
+class BucketMap:
+    # rateLimit.middleware.ts: a bucket starts full, refills continuously up to
+    # capacity, a request needs one whole token, and entries are never evicted
+    def __init__(self, capacity, refill_per_sec):
+        self.capacity = capacity
+        self.refill = refill_per_sec
+        self.buckets = {}
+
+    def take(self, key, now):
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = [self.capacity, now]
+        bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.refill)
+        bucket[1] = now
+        if bucket[0] < 1:
+            return False
+        bucket[0] -= 1
+        return True
+
+
+class OperationSim:
+    def __init__(self, limit):
+        self.limit = limit
+        self.map = BucketMap(limit["capacity"], limit["refillPerSec"])
+        self.requests = 0
+        self.rejected = 0
+        # smallest capacity that would have admitted every request so far, per
+        # key (Lindley recursion: one token per request, refill drains the debt)
+        self.need = {}
+        self.peak_need = {}
+        self.last = {}
+        # a bucket idle for capacity/refill seconds is full again, i.e. no
+        # different from a missing one; these are the entries worth keeping
+        self.idle_after = limit["capacity"] / limit["refillPerSec"] if limit["refillPerSec"] else math.inf
+        self.touched = deque()
+        self.live = 0
+        self.peak_live = 0
+        self.key_bytes = 0
+
+    def offer(self, key, now):
+        self.requests += 1
+        if key not in self.map.buckets:
+            self.key_bytes += len(key)
+        if not self.map.take(key, now):
+            self.rejected += 1
+
+        last = self.last.get(key)
+        need = 1 + max(0.0, self.need.get(key, 0.0) - (now - last) * self.limit["refillPerSec"]) if last is not None else 1
+        self.need[key] = need
+        if need > self.peak_need.get(key, 0):
+            self.peak_need[key] = need
+
+        if last is None or now - last >= self.idle_after:
+            self.live += 1
+            self.peak_live = max(self.peak_live, self.live)
+        self.last[key] = now
+        self.touched.append((now, key))
+        self.expire(now)
+
+    def expire(self, now):
+        touched = self.touched
+        while touched and now - touched[0][0] >= self.idle_after:
+            ts, key = touched.popleft()
+            if self.last.get(key) == ts:
+                self.live -= 1
+
+    def report(self):
+        needs = sorted(math.ceil(value) for value in self.peak_need.values())
+
+        def pick(q):
+            return needs[min(len(needs) - 1, int(q * len(needs)))] if needs else 0
+
+        return {
+            "limit": self.limit,
+            "requests": self.requests,
+            "rejected": self.rejected,
+            "rejectRate": round(self.rejected / self.requests, 6) if self.requests else 0,
+            "keys": len(self.map.buckets),
+            "peakLiveBuckets": self.peak_live,
+            "neededCapacity": {"p50": pick(0.5), "p99": pick(0.99), "max": needs[-1] if needs else 0},
+            "keysRejected": sum(1 for value in needs if value > self.limit["capacity"]),
+        }
+
+
+def read_trace(paths, endpoints, strip_prefix="/api"):
+    # (seconds, operation key, client key) from JSONL traces ({"t", "op", "key"})
+    # or "contract"-format nginx logs, where the client key is the remote address
+    index = RouteIndex(endpoints, strip_prefix=strip_prefix, require_prefix=True)
+    routes = {}
+    stamps = {}
+    for path in expand(paths):
+        with open_log(path) as f:
+            for line in f:
+                if line.startswith("{"):
+                    event = json.loads(line)
+                    yield float(event["t"]), event["op"], str(event["key"])
+                    continue
+                m = LOG_LINE.match(line)
+                if m is None:
+                    continue
+                addr, stamp, method, target = m.group(1, 2, 3, 4)
+                seconds = stamps.get(stamp)
+                if seconds is None:
+                    parsed = parse_time(stamp)
+                    if parsed is None:
+                        continue
+                    seconds = stamps[stamp] = parsed.timestamp()
+                route_key = method + " " + target.split("?", 1)[0]
+                key = routes.get(route_key)
+                if key is None:
+                    found = index.match(method, route_key.split(" ", 1)[1])
+                    key = routes[route_key] = operation_key(found["endpoint"]) if found else ""
+                if key:
+                    yield seconds, key, addr
+
+
+def synthetic_trace(mix, rate, duration, clients, zipf=1.1, spike=None, seed=None):
+    # Poisson arrivals at `rate` req/s (times the spike factor inside the spike
+    # window), operations by mix weight, clients Zipf-distributed so a few heavy
+    # users dominate like they do in production
+    rng = random.Random(seed)
+    ops = list(mix)
+    op_weights = list(mix.values())
+    cum = []
+    total = 0.0
+    for rank in range(1, clients + 1):
+        total += 1 / rank ** zipf
+        cum.append(total)
+    factor, start, length = spike or (1.0, 0.0, 0.0)
+    t = 0.0
+    while True:
+        current = rate * (factor if start <= t < start + length else 1.0)
+        t += rng.expovariate(current)
+        if t >= duration:
+            return
+        op = rng.choices(ops, op_weights)[0]
+        client = bisect.bisect_left(cum, rng.random() * total)
+        yield t, op, f"c{client}"
+
+
+def simulate(trace, limits, sample_seconds=SAMPLE_SECONDS):
+    # limits: operation key -> {"capacity", "refillPerSec"}; buckets are kept
+    # per operation, as if each route's key function were namespaced by route
+    sims = {key: OperationSim(limit) for key, limit in limits.items()}
+    unlimited = {}
+    timeline = []
+    next_sample = None
+    first = now = None
+    for t, op, client in trace:
+        if first is None:
+            first = now = t
+            next_sample = now + sample_seconds
+        # traces are replayed in the order given; small reorderings (nginx
+        # workers flushing out of step) are clamped rather than rewinding buckets
+        now = max(now, t)
+        while now >= next_sample:
+            timeline.append(_sample(sims, next_sample, first))
+            next_sample += sample_seconds
+        sim = sims.get(op)
+        if sim is None:
+            unlimited[op] = unlimited.get(op, 0) + 1
+            continue
+        sim.offer(client, now)
+    if first is not None:
+        timeline.append(_sample(sims, now, first))
+    entries = sum(len(sim.map.buckets) for sim in sims.values())
+    key_bytes = sum(sim.key_bytes for sim in sims.values())
+    return {
+        "seconds": round(now - first, 3) if first is not None else 0,
+        "requests": sum(sim.requests for sim in sims.values()) + sum(unlimited.values()),
+        "rejected": sum(sim.rejected for sim in sims.values()),
+        "bucketMap": {
+            "entries": entries,
+            "estimatedBytes": entries * BUCKET_ENTRY_BYTES + key_bytes,
+            "peakLiveEntries": sum(sim.peak_live for sim in sims.values()),
+        },
+        "operations": {key: sim.report() for key, sim in sims.items() if sim.requests},
+        "unlimited": dict(heapq.nlargest(20, unlimited.items(), key=lambda item: item[1])),
+        "timeline": timeline,
+    }
+
+
+def _sample(sims, at, first):
+    for sim in sims.values():
+        sim.expire(at)
+    return {
+        "t": round(at - first, 3),
+        "entries": sum(len(sim.map.buckets) for sim in sims.values()),
+        "live": sum(sim.live for sim in sims.values()),
+        "rejected": sum(sim.rejected for sim in sims.values()),
+    }
+
+
+def contract_limits(endpoints):
+    return {operation_key(ep): ep["rateLimit"] for ep in endpoints if ep.get("rateLimit")}
+
+
+def parse_spike(text):
+    factor, start, length = (float(part) for part in text.split(":"))
+    return factor, start, length
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay request traces through the contract's token-bucket limits")
+    parser.add_argument("traces", nargs="*", help="JSONL traces or nginx access logs in time order (.gz allowed, - for stdin)")
+    parser.add_argument("--synthetic", action="store_true", help="generate a trace instead of reading one")
+    parser.add_argument("--mix", help="synthetic operation weights, e.g. 'GET /discover=4,POST /posts=1'")
+    parser.add_argument("--rate", type=float, default=200.0, help="synthetic requests per second")
+    parser.add_argument("--duration", type=float, default=600.0, help="synthetic trace length in seconds")
+    parser.add_argument("--clients", type=int, default=10000, help="synthetic distinct client keys")
+    parser.add_argument("--zipf", type=float, default=1.1, help="synthetic client skew; 0 is uniform")
+    parser.add_argument("--spike", type=parse_spike, help="FACTOR:START:LENGTH, e.g. 5:300:60 for 5x traffic at t=300s for a minute")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--sample", type=float, default=SAMPLE_SECONDS, help="seconds between timeline samples")
+    parser.add_argument("--strip-prefix", default="/api", help="proxy prefix removed before matching log paths")
+    parser.add_argument("--contract", help="emitted api-contract.json to read instead of build_contract.py")
+    args = parser.parse_args(argv)
+
+    if not args.synthetic and not args.traces:
+        parser.error("give trace files or --synthetic")
+
+    from build_contract import load_contract
+
+    endpoints = load_contract(args.contract)["endpoints"]
+    limits = contract_limits(endpoints)
+    if args.synthetic:
+        mix = parse_mix(args.mix) if args.mix else DEFAULT_MIX
+        trace = synthetic_trace(mix, args.rate, args.duration, args.clients, args.zipf, args.spike, args.seed)
+    else:
+        trace = read_trace(args.traces, endpoints, args.strip_prefix)
+    report = simulate(trace, limits, args.sample)
+    json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    for key, op in report["operations"].items():
+        print(
+            f"{key}: {op['rejectRate']:.2%} rejected, capacity {op['limit']['capacity']} "
+            f"(p99 key needs {op['neededCapacity']['p99']}, max {op['neededCapacity']['max']}), "
+            f"{op['keys']} buckets, {op['peakLiveBuckets']} live at peak",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+import argparse
+import json
+import sys
+
+REF_PREFIX = "#/components/schemas/"
+
+
+def operation_key(ep):
+    return f"{ep['method'].upper()} {ep['path']}"
+
+
+def iter_refs(node):
+    stack = [node]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            ref = obj.get("$ref")
+            if isinstance(ref, str) and ref.startswith(REF_PREFIX):
+                yield ref[len(REF_PREFIX):]
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+
+
+def endpoint_schemas(ep):
+    # works on both the raw endpoints table and contract_endpoints
+    request = ep.get("requestSchema")
+    if request is None:
+        request = (ep.get("requestBody") or {}).get("schema")
+    return [request, ep.get("responses")]
+
+
+class RefGraph:
+    def __init__(self, schemas, endpoints):
+        self.schemas = schemas
+        self.edges = {name: sorted(set(iter_refs(schema))) for name, schema in schemas.items()}
+        self.reverse = {name: [] for name in schemas}
+        for name, refs in self.edges.items():
+            for ref in refs:
+                self.reverse.setdefault(ref, []).append(name)
+        self.missing = sorted(ref for ref in self.reverse if ref not in schemas)
+
+        self.endpoints = {}
+        self.direct = {}
+        for ep in endpoints:
+            key = operation_key(ep)
+            self.endpoints[key] = ep
+            self.direct[key] = sorted(set(iter_refs(endpoint_schemas(ep))))
+
+        self.components, self.cycles = self._strongly_connected()
+        self.cyclic = {name for component in self.cycles for name in component}
+        self.closure = self._closures()
+        self.uses = {
+            key: sorted(set().union(*(self.closure.get(ref, {ref}) for ref in refs)))
+            for key, refs in self.direct.items()
+        }
+        self.used_by = {name: [] for name in schemas}
+        for key, names in self.uses.items():
+            for name in names:
+                self.used_by.setdefault(name, []).append(key)
+
+        self._bundles = {}
+        self._dereferenced = {}
+        self._dereferenced_endpoints = {}
+
+    def _strongly_connected(self):
+        # iterative Tarjan; components come out in reverse topological order
+        index = {}
+        low = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+        for root in self.edges:
+            if root in index:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, i = work.pop()
+                if i == 0:
+                    index[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack.add(node)
+                children = self.edges.get(node, ())
+                if i < len(children):
+                    work.append((node, i + 1))
+                    child = children[i]
+                    if child not in self.edges:
+                        continue
+                    if child not in index:
+                        work.append((child, 0))
+                    elif child in on_stack:
+                        low[node] = min(low[node], index[child])
+                    continue
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+        cycles = [c for c in components if len(c) > 1 or c[0] in self.edges[c[0]]]
+        return components, cycles
+
+    def _closures(self):
+        closure = {}
+        for component in self.components:
+            reach = set(component)
+            for member in component:
+                for ref in self.edges[member]:
+                    reach |= closure.get(ref, {ref})
+            for member in component:
+                closure[member] = reach
+        return closure
+
+    def bundle(self, key):
+        # the endpoint plus only the schemas it can reach
+        if key not in self._bundles:
+            ep = self.endpoints[key]
+            self._bundles[key] = {
+                "endpoint": ep,
+                "components": {"schemas": {name: self.schemas[name] for name in self.uses[key] if name in self.schemas}},
+            }
+        return self._bundles[key]
+
+    def dereference_schema(self, name):
+        if name not in self._dereferenced:
+            self._dereferenced[name] = self._inline(self.schemas[name], (name,))
+        return self._dereferenced[name]
+
+    def dereference(self, key):
+        # fully inlined endpoint; references back into a cycle stay as $ref.
+        # results are memoized and shared, so callers must not mutate them
+        if key not in self._dereferenced_endpoints:
+            self._dereferenced_endpoints[key] = self._inline(self.endpoints[key], ())
+        return self._dereferenced_endpoints[key]
+
+    def _inline(self, node, active):
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith(REF_PREFIX):
+                name = ref[len(REF_PREFIX):]
+                if name in active or name not in self.schemas:
+                    return node
+                if len(node) == 1 and (not active or name not in self.cyclic):
+                    return self.dereference_schema(name)
+                target = self._inline(self.schemas[name], active + (name,))
+                if len(node) == 1:
+                    return target
+                merged = dict(target)
+                merged.update({k: self._inline(v, active) for k, v in node.items() if k != "$ref"})
+                return merged
+            return {k: self._inline(v, active) for k, v in node.items()}
+        if isinstance(node, list):
+            return [self._inline(v, active) for v in node]
+        return node
+
+    def index(self):
+        return {
+            "schemas": {
+                name: {
+                    "refs": self.edges[name],
+                    "referencedBy": sorted(self.reverse.get(name, [])),
+                    "usedBy": self.used_by.get(name, []),
+                }
+                for name in self.schemas
+            },
+            "endpoints": self.uses,
+            "cycles": self.cycles,
+            "missing": self.missing,
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect the $ref graph of the contract")
+    parser.add_argument("mode", choices=["index", "bundle", "dereference"])
+    parser.add_argument("operation", nargs="?", help='e.g. "GET /announcements/active"')
+    parser.add_argument("--contract", help="emitted api-contract.json to read instead of build_contract.py")
+    args = parser.parse_args(argv)
+
+    from build_contract import load_contract
+
+    contract = load_contract(args.contract)
+    graph = RefGraph(contract["components"]["schemas"], contract["endpoints"])
+    if args.mode == "index":
+        result = graph.index()
+    else:
+        if args.operation not in graph.endpoints:
+            parser.error(f"unknown operation: {args.operation}")
+        result = graph.bundle(args.operation) if args.mode == "bundle" else graph.dereference(args.operation)
+    json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
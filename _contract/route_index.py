@@ -0,0 +1,184 @@
+import argparse
+import json
+import re
+import sys
+from collections import Counter
+
+
+# client-side placeholders: {id}, :id, ${id}, $id, <id>
+_PLACEHOLDER = re.compile(r"^(\{[^/{}]*\}|:[A-Za-z_]\w*|\$\{[^/{}]*\}|\$[A-Za-z_]\w*|<[^/<>]*>)$")
+_SCHEME_HOST = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:/{1,2}[^/]*")
+
+
+class _Node:
+    __slots__ = ("static", "param", "param_name", "methods")
+
+    def __init__(self):
+        self.static = {}
+        self.param = None
+        self.param_name = None
+        self.methods = {}
+
+
+def is_placeholder(segment):
+    return _PLACEHOLDER.match(segment) is not None
+
+
+def split_path(path, strip_prefix="", require_prefix=False):
+    # None when require_prefix is set and the path lies outside strip_prefix
+    path = _SCHEME_HOST.sub("", path)
+    for sep in ("?", "#"):
+        cut = path.find(sep)
+        if cut != -1:
+            path = path[:cut]
+    if strip_prefix:
+        if path == strip_prefix or path.startswith(strip_prefix + "/"):
+            path = path[len(strip_prefix):]
+        elif require_prefix:
+            return None
+    return [segment for segment in path.split("/") if segment]
+
+
+class RouteIndex:
+    def __init__(self, endpoints=(), aliases=True, strip_prefix="", require_prefix=False):
+        self.root = _Node()
+        # routes without parameters also get a flat lookup table
+        self.static_routes = {}
+        self.strip_prefix = strip_prefix.rstrip("/")
+        # access logs see every vhost path; there only prefixed paths are API calls
+        self.require_prefix = require_prefix
+        self.operations = []
+        for ep in endpoints:
+            self.add(ep["method"], ep["path"], ep)
+            if aliases:
+                for alias in ep.get("aliases") or ():
+                    self.add(ep["method"], alias, ep, alias=True)
+
+    def add(self, method, path, endpoint, alias=False):
+        node = self.root
+        segments = split_path(path)
+        for segment in segments:
+            if segment.startswith("{") and segment.endswith("}"):
+                if node.param is None:
+                    node.param = _Node()
+                    node.param_name = segment[1:-1]
+                node = node.param
+            else:
+                node = node.static.setdefault(segment, _Node())
+        method = method.upper()
+        # the canonical route wins over an alias registered at the same place
+        if method not in node.methods or not alias:
+            node.methods[method] = (endpoint, alias)
+        if not alias:
+            self.operations.append((method, endpoint["path"]))
+        if not any(s.startswith("{") for s in segments):
+            self.static_routes["/" + "/".join(segments)] = node
+
+    def lookup(self, path, method=None):
+        # returns (node, params) for the best matching route node, static segments first;
+        # with a method, keeps backtracking until a node that serves it
+        segments = split_path(path, self.strip_prefix, self.require_prefix)
+        if segments is None:
+            return None, None
+        node = self.static_routes.get("/" + "/".join(segments))
+        if node is not None and (method is None or method in node.methods):
+            return node, {}
+        stack = [(self.root, 0, {})]
+        while stack:
+            node, i, params = stack.pop()
+            if i == len(segments):
+                if node.methods if method is None else method in node.methods:
+                    return node, params
+                continue
+            segment = segments[i]
+            if node.param is not None:
+                child_params = dict(params)
+                child_params[node.param_name] = segment
+                stack.append((node.param, i + 1, child_params))
+            if not is_placeholder(segment):
+                child = node.static.get(segment)
+                if child is not None:
+                    stack.append((child, i + 1, params))
+        return None, None
+
+    def match(self, method, path):
+        method = method.upper()
+        node, params = self.lookup(path, method)
+        if node is None:
+            return None
+        endpoint, alias = node.methods[method]
+        return {"endpoint": endpoint, "params": params, "alias": alias}
+
+    def allowed_methods(self, path):
+        node, _ = self.lookup(path)
+        return sorted(node.methods) if node is not None else []
+
+
+def classify(index, method, path):
+    if not split_path(path, index.strip_prefix) or all(is_placeholder(s) for s in split_path(path)):
+        return "dynamic", None
+    found = index.match(method, path)
+    if found is not None:
+        return ("alias" if found["alias"] else "matched"), found
+    if index.allowed_methods(path):
+        return "method-mismatch", None
+    return "missing", None
+
+
+def read_calls(path):
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
+        data = data.get("calls") or data.get("missingCalls") or []
+    if isinstance(data, list):
+        return [(call["method"], call["path"]) for call in data]
+    calls = []
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) >= 2:
+            calls.append((parts[0], parts[1]))
+    return calls
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Match client calls against contract routes")
+    parser.add_argument("calls", help='JSON list of {"method", "path"} objects, or text lines "METHOD /path"')
+    parser.add_argument("--contract", help="emitted api-contract.json to read instead of build_contract.py")
+    parser.add_argument("--strip-prefix", default="", help="prefix removed before matching, e.g. /api")
+    parser.add_argument("--no-aliases", action="store_true")
+    args = parser.parse_args(argv)
+
+    from build_contract import load_contract
+
+    contract = load_contract(args.contract)
+    index = RouteIndex(contract["endpoints"], aliases=not args.no_aliases, strip_prefix=args.strip_prefix)
+
+    summary = Counter()
+    operations = Counter()
+    unmatched = []
+    for method, path in read_calls(args.calls):
+        status, found = classify(index, method, path)
+        summary[status] += 1
+        if found is not None:
+            ep = found["endpoint"]
+            operations[f"{ep['method'].upper()} {ep['path']}"] += 1
+        else:
+            unmatched.append({"method": method.upper(), "path": path, "status": status})
+    used = set(operations)
+    report = {
+        "summary": dict(summary),
+        "operations": dict(operations.most_common()),
+        "unmatched": unmatched,
+        "unusedOperations": sorted(f"{m} {p}" for m, p in index.operations if f"{m} {p}" not in used),
+    }
+    json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
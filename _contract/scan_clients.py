@@ -0,0 +1,276 @@
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from codegen import TARGETS as CODEGEN_TARGETS
+from file_cache import FileCache, read_if_changed
+
+CONTRACT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(CONTRACT_DIR)
+CACHE_PATH = os.path.join(CONTRACT_DIR, ".client-usage-cache.json")
+
+TARGETS = {
+    "admin": {
+        "output": os.path.join(CONTRACT_DIR, "client-usage-admin.json"),
+        "patterns": ["apps/admin/src/lib/api.ts", "apps/admin/app/**/page.tsx"],
+    },
+    "app": {
+        "output": os.path.join(CONTRACT_DIR, "client-usage-app.json"),
+        "patterns": ["apps/mobile/lib/**/*.dart"],
+    },
+}
+
+_TS_CALL = re.compile(
+    r"\b(?:(?P<helper>req|request|apiFetch|fetch)|(?:axios|api|client|http|dio)\.(?P<verb>get|post|put|patch|delete))"
+    r"\s*(?:<[^>()]*>)?\s*\("
+)
+_DART_CALL = re.compile(
+    r"\b(?:http|dio|client|_client|api|_dio|_http)\.(?P<verb>get|post|put|patch|delete)\s*(?:<[^>()]*>)?\s*\(\s*(?:Uri\.parse\s*\()?"
+)
+_TS_DEFINITION = re.compile(r"(?:export\s+)?const\s+(\w+Api)\s*=\s*\{")
+_TS_FUNCTION = re.compile(
+    r"(?:async\s+)?(?:function\s+)?(\w+)\s*(?:<[^<>()]*>)?\s*(?:=\s*(?:async\s*)?)?\([^()]*\)\s*(?::\s*[^{=]+)?(?:=>\s*)?\{"
+)
+_DART_FUNCTION = re.compile(r"(?:Future<[^>]*>|void|[A-Z]\w*(?:<[^>]*>)?)\s+(\w+)\s*\([^()]*\)\s*(?:async\s*)?\{")
+_WRAPPER_CALL = re.compile(r"\b(\w+Api)\.(\w+)\s*\(")
+_METHOD_OPTION = re.compile(r"\bmethod\s*:\s*['\"](\w+)['\"]")
+_AUTH_OPTION = re.compile(r"\bauth\s*:\s*true\b|Authorization|Bearer")
+_INTERPOLATION = re.compile(r"\$\{([^}]*)\}|\$([A-Za-z_]\w*)")
+_SCHEME_HOST = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://[^/]*")
+_KEYWORDS = {"if", "for", "while", "switch", "catch", "return", "function"}
+_HELPERS = {"req", "request", "apiFetch"}
+
+
+def _base_like(expr):
+    lowered = expr.lower()
+    return "base" in lowered or lowered.endswith("url") or lowered.endswith("host")
+
+
+def _placeholder(expr):
+    names = re.findall(r"[A-Za-z_]\w*", expr)
+    names = [n for n in names if n not in ("encodeURIComponent", "String", "toString")]
+    return "{" + (names[-1] if names else "param") + "}"
+
+
+def normalize_path(raw):
+    # turns a client URL expression into a contract-style path
+    path = raw.strip()
+    if path.startswith("{") and path.endswith("}") and "/" not in path:
+        return path
+    first = _INTERPOLATION.match(path)
+    if first and _base_like(first.group(1) or first.group(2)):
+        path = path[first.end():]
+    path = _SCHEME_HOST.sub("", path)
+    path = _INTERPOLATION.sub(lambda m: _placeholder(m.group(1) or m.group(2)), path)
+    path = path.split("?", 1)[0].split("#", 1)[0]
+    if not path.startswith("/") and not path.startswith("{"):
+        path = "/" + path
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return path
+
+
+def _read_literal(text, pos):
+    # returns (literal, end) for a string literal at pos, or (None, pos)
+    while pos < len(text) and text[pos].isspace():
+        pos += 1
+    if pos >= len(text) or text[pos] not in "'\"`":
+        # a variable instead of a literal: the URL is only known at runtime
+        match = re.match(r"[A-Za-z_][\w.]*", text[pos:])
+        if match:
+            return "{" + match.group(0).split(".")[-1] + "}", pos + match.end()
+        return None, pos
+    quote = text[pos]
+    end = pos + 1
+    depth = 0
+    while end < len(text):
+        c = text[end]
+        if c == "\\":
+            end += 2
+            continue
+        if c == "{" and text[end - 1] == "$":
+            depth += 1
+        elif c == "}" and depth:
+            depth -= 1
+        elif c == quote and not depth:
+            return text[pos + 1:end], end + 1
+        end += 1
+    return None, pos
+
+
+def _call_args(text, pos, depth=1):
+    # text of the argument list starting right after "(" up to its closing paren
+    end = pos
+    quote = None
+    while end < len(text) and depth:
+        c = text[end]
+        if quote:
+            if c == "\\":
+                end += 1
+            elif c == quote:
+                quote = None
+        elif c in "'\"`":
+            quote = c
+        elif c in "([{":
+            depth += 1
+        elif c in ")]}":
+            depth -= 1
+        end += 1
+    return text[pos:end - 1]
+
+
+def _enclosing(definitions, offset):
+    name = None
+    for start, candidate in definitions:
+        if start > offset:
+            break
+        name = candidate
+    return name
+
+
+def _line_of(text, offset):
+    return text.count("\n", 0, offset) + 1
+
+
+def scan_source(text, filename):
+    dart = filename.endswith(".dart")
+    call_re = _DART_CALL if dart else _TS_CALL
+    function_re = _DART_FUNCTION if dart else _TS_FUNCTION
+    functions = [(m.start(), m.group(1)) for m in function_re.finditer(text) if m.group(1) not in _KEYWORDS]
+    objects = [(m.start(), m.group(1)) for m in _TS_DEFINITION.finditer(text)] if not dart else []
+    base = os.path.basename(filename)
+
+    calls = []
+    definitions = {}
+    for m in call_re.finditer(text):
+        if re.search(r"\bfunction\s+$", text[max(0, m.start() - 20):m.start()]):
+            continue
+        literal, _ = _read_literal(text, m.end())
+        if literal is None:
+            continue
+        args = _call_args(text, m.end(), 2 if "Uri.parse" in m.group(0) else 1)
+        verb = m.groupdict().get("verb")
+        if verb:
+            method = verb.upper()
+        else:
+            option = _METHOD_OPTION.search(args)
+            method = option.group(1).upper() if option else "GET"
+        function = _enclosing(functions, m.start())
+        owner = _enclosing(objects, m.start())
+        line = _line_of(text, m.start())
+        if function and owner and function != owner:
+            context = f"{owner}.{function}"
+        else:
+            context = function or f"anonymous@{base}:{line}"
+        call = {
+            "line": line,
+            "context": context,
+            "method": method,
+            "path": normalize_path(literal),
+            "auth": "bearer" if _AUTH_OPTION.search(args) else "none",
+        }
+        if function in _HELPERS and call["path"].startswith("{"):
+            # the transport inside req()/request() itself, not a call site
+            continue
+        if "." in context:
+            # xxxApi.method definitions are reported where they are called
+            definitions[context] = call
+        else:
+            calls.append(call)
+
+    wrappers = [
+        {"line": _line_of(text, m.start()), "via": f"{m.group(1)}.{m.group(2)}"}
+        for m in _WRAPPER_CALL.finditer(text)
+        if f"{m.group(1)}.{m.group(2)}" not in definitions
+    ]
+    return {"calls": calls, "definitions": definitions, "wrappers": wrappers}
+
+
+def _scan_job(path, known_hash):
+    digest, text = read_if_changed(path, known_hash)
+    return path, digest, None if text is None else scan_source(text, path)
+
+
+def collect_files(root, patterns, exclude=tuple(CODEGEN_TARGETS.values())):
+    # codegen.py output is skipped: it is derived from the contract, not a client's own usage
+    prefixes = tuple(directory.rstrip("/") + "/" for directory in exclude)
+    found = set()
+    for pattern in patterns:
+        for path in Path(root).glob(pattern):
+            rel = path.relative_to(root).as_posix()
+            if path.is_file() and not rel.startswith(prefixes):
+                found.add(rel)
+    return sorted(found)
+
+
+def build_usage(source, results):
+    definitions = {}
+    for result in results.values():
+        definitions.update(result["definitions"])
+    calls = []
+    unresolved = []
+    for rel, result in sorted(results.items()):
+        for call in result["calls"]:
+            calls.append({"source": source, "file": rel, **call})
+        for wrapper in result["wrappers"]:
+            target = definitions.get(wrapper["via"])
+            if target is None:
+                unresolved.append({"source": source, "file": rel, **wrapper})
+                continue
+            calls.append({
+                "source": source,
+                "file": rel,
+                "line": wrapper["line"],
+                "context": wrapper["via"],
+                "method": target["method"],
+                "path": target["path"],
+                "auth": target["auth"],
+            })
+    return {"source": source, "filesScanned": len(results), "calls": calls, "unresolved": unresolved}
+
+
+def write_if_changed(path, data):
+    text = json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract HTTP calls from the admin and mobile clients")
+    parser.add_argument("--root", default=REPO_ROOT, help="repository root that holds apps/")
+    parser.add_argument("--only", choices=sorted(TARGETS), action="append")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--cache", default=CACHE_PATH)
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args(argv)
+
+    cache = FileCache(args.cache, [__file__])
+    if not args.no_cache:
+        cache.load()
+    for name in args.only or sorted(TARGETS):
+        target = TARGETS[name]
+        files = collect_files(args.root, target["patterns"])
+        results, scanned = cache.scan(name, args.root, files, _scan_job, args.jobs)
+        usage = build_usage(name, results)
+        changed = write_if_changed(target["output"], usage)
+        print(
+            f"{name}: {len(usage['calls'])} calls, {len(usage['unresolved'])} unresolved wrapper calls "
+            f"({scanned}/{len(files)} files scanned{', written' if changed else ', unchanged'})"
+        )
+    if not args.no_cache:
+        cache.save()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,467 @@
+import argparse
+import functools
+import gzip
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
+
+from index_advisor import SCHEMA_PATH, parse_schema
+
+CONTRACT_DIR = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR = os.path.join(CONTRACT_DIR, "seed")
+
+# load order: every table only references tables before it
+TABLES = ["User", "Profile", "Topic", "Friendship", "Chat", "Message", "Post", "Report", "AnalyticsEvent"]
+
+# volumes and distribution knobs, overridable with --set name=value
+DEFAULTS = {
+    "users": 100_000,
+    "days": 365,
+    "profileRate": 0.9,
+    "friendsPerUser": 8.0,
+    "acceptRate": 0.6,
+    "chatsPerUser": 2.0,
+    "messagesPerChat": 30.0,
+    "postsPerUser": 3.0,
+    "reportsPerPost": 0.01,
+    "eventsPerUser": 40.0,
+    "retentionDays": 14.0,
+    # activity skew: users are picked as int(n * u**skew), so older (lower
+    # index) users are more active; 1 is uniform
+    "skew": 2.0,
+}
+SHARD_ROWS = 250_000
+
+TOPICS = ["일상", "연애", "취미", "여행", "운동", "반려동물", "요리", "음악", "게임", "진로"]
+REGIONS = {
+    "Seoul": ["Gangnam", "Mapo", "Songpa", "Jongno", "Yongsan"],
+    "Busan": ["Haeundae", "Suyeong", "Busanjin"],
+    "Gyeonggi": ["Suwon", "Seongnam", "Goyang", "Yongin"],
+    "Incheon": ["Yeonsu", "Namdong"],
+    "Daegu": ["Suseong", "Jung"],
+}
+REGION_NAMES = list(REGIONS)
+WORDS = ["오늘", "같이", "커피", "산책", "주말", "영화", "노래", "맛집", "여행", "운동", "고양이", "강아지", "게임", "책", "hello", "ㅋㅋ"]
+INTERESTS = ["music", "travel", "games", "food", "sports", "pets", "movies", "books", "art", "study"]
+REPORT_REASONS = ["spam", "abuse", "nudity", "scam", "other"]
+EVENTS = ["app_open", "app_open", "app_open", "message_sent", "message_sent", "friend_request_sent", "post_created"]
+_MASK = (1 << 64) - 1
+
+
+def _mix(x):
+    # splitmix64 finalizer: a bijection on 64-bit ints, so per-index values are
+    # reproducible in any worker without shared state
+    x = (x + 0x9E3779B97F4A7C15) & _MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x ^ (x >> 31)
+
+
+class Plan:
+    # everything a worker needs to derive any row from its index alone
+    def __init__(self, settings, seed, end):
+        self.s = settings
+        self.seed = seed
+        self.users = int(settings["users"])
+        self.end = end
+        self.start = end - settings["days"] * 86400
+        self.chats = int(self.users * settings["chatsPerUser"])
+        self.posts = int(self.users * settings["postsPerUser"])
+        self.reports = int(self.posts * settings["reportsPerPost"])
+
+    def unit(self, tag, i, salt=0):
+        return _mix((self.seed << 40) ^ (tag << 32) ^ (salt << 56) ^ i) / 2.0 ** 64
+
+    def user_created(self, u):
+        # signups spread evenly over the window in index order, jittered within a slot
+        slot = (self.end - self.start) / max(1, self.users)
+        return self.start + slot * (u + self.unit(1, u))
+
+    def pick_user(self, tag, i, salt=0):
+        return min(self.users - 1, int(self.users * self.unit(tag, i, salt) ** self.s["skew"]))
+
+    def after(self, t, tag, i, mean_days=3.0):
+        # a time after t, exponentially distributed, clamped to the window end
+        gap = -math.log(1.0 - self.unit(tag, i, 7)) * mean_days * 86400
+        return min(self.end, t + gap)
+
+    def chat_users(self, c):
+        a = self.pick_user(2, c)
+        b = (a + 1 + int(self.unit(2, c, 1) * (self.users - 1))) % self.users
+        return a, b
+
+    def post_author(self, p):
+        return self.pick_user(3, p)
+
+    def post_created(self, p):
+        return self.after(self.user_created(self.post_author(p)), 3, p, 30.0)
+
+
+def _fanout(plan, tag, i, mean):
+    # geometric count with the given mean
+    if mean <= 0:
+        return 0
+    return int(-math.log(1.0 - plan.unit(tag, i, 9)) * mean)
+
+
+@functools.lru_cache(maxsize=4096)
+def _date(day):
+    return (date(1970, 1, 1) + timedelta(days=day)).isoformat()
+
+
+def _ts(t):
+    # timestamp(3) text; the date part is cached since rows cluster by day
+    day, rem = divmod(t, 86400)
+    ms = int(rem * 1000)
+    h, ms = divmod(ms, 3_600_000)
+    m, ms = divmod(ms, 60_000)
+    s, ms = divmod(ms, 1000)
+    return f"{_date(int(day))} {h:02d}:{m:02d}:{s:02d}.{ms:03d}"
+
+
+def _sentences(count=4096):
+    # a fixed pool of 3-14 word texts; rows pick one with a single hash
+    pool = []
+    for i in range(count):
+        n = 3 + _mix(i) % 12
+        pool.append(" ".join(WORDS[_mix(i * 31 + k) % len(WORDS)] for k in range(n)))
+    return pool
+
+
+SENTENCES = _sentences()
+
+
+def _text(plan, tag, i):
+    return SENTENCES[int(plan.unit(tag, i, 11) * len(SENTENCES))]
+
+
+# row builders: index -> {field: value}; fields left out get a type default
+
+def user_row(plan, u):
+    created = plan.user_created(u)
+    region = REGION_NAMES[int(plan.unit(4, u) * len(REGION_NAMES))]
+    districts = REGIONS[region]
+    age = 18 + int(plan.unit(4, u, 1) ** 1.7 * 30)
+    return {
+        "id": f"u{u:x}",
+        "createdAt": created,
+        "updatedAt": plan.after(created, 4, u, 20.0),
+        "phoneHash": f"{_mix(u ^ 0x5EED):016x}" if plan.unit(4, u, 2) < 0.6 else None,
+        "email": f"user{u}@seed.example" if plan.unit(4, u, 2) >= 0.6 else None,
+        "provider": "phone" if plan.unit(4, u, 2) < 0.6 else ("email" if plan.unit(4, u, 3) < 0.7 else "apple"),
+        "dob": created - age * 365.25 * 86400,
+        "gender": "female" if plan.unit(4, u, 4) < 0.48 else ("male" if plan.unit(4, u, 4) < 0.97 else "other"),
+        "region1": region,
+        "region2": districts[int(plan.unit(4, u, 5) * len(districts))],
+        "lang": "ko" if plan.unit(4, u, 6) < 0.9 else "en",
+        "trustScore": int(20 + plan.unit(4, u, 7) * 80),
+        "status": "active" if plan.unit(4, u, 8) < 0.97 else "suspended",
+        "role": "user",
+        "displayName": f"user{u}",
+        "pointsBalance": int(plan.unit(4, u, 9) ** 3 * 5000),
+    }
+
+
+def profile_row(plan, u):
+    k = 1 + int(plan.unit(5, u) * 4)
+    return {
+        "userId": f"u{u:x}",
+        "nickname": f"닉네임{u}",
+        "bio": _text(plan, 5, u) if plan.unit(5, u, 1) < 0.7 else None,
+        "interests": [INTERESTS[(_mix(u) + j * 3) % len(INTERESTS)] for j in range(k)],
+        "badges": ["verified"] if plan.unit(5, u, 2) < 0.2 else [],
+        "lastSeenAt": plan.after(plan.user_created(u), 5, u, 30.0),
+        "visibility": {"profile": "public"},
+    }
+
+
+def friendship_rows(plan, u):
+    # distinct addressees per requester, so (requesterId, addresseeId) stays unique
+    count = min(plan.users - 1, _fanout(plan, 6, u, plan.s["friendsPerUser"]))
+    step = 1 + _mix(u) % max(1, plan.users - 1)
+    seen = set()
+    for k in range(count):
+        other = (u + 1 + (step * (k + 1)) % (plan.users - 1)) % plan.users
+        if other == u or other in seen:
+            continue
+        seen.add(other)
+        created = plan.after(max(plan.user_created(u), plan.user_created(other)), 6, u * 64 + k, 10.0)
+        answer = plan.unit(6, u * 64 + k, 1)
+        status = "accepted" if answer < plan.s["acceptRate"] else ("declined" if answer > 0.95 else "requested")
+        yield {
+            "id": f"f{u:x}-{k:x}",
+            "requesterId": f"u{u:x}",
+            "addresseeId": f"u{other:x}",
+            "status": status,
+            "createdAt": created,
+        }
+
+
+def chat_and_message_rows(plan, c):
+    a, b = plan.chat_users(c)
+    opened = plan.after(max(plan.user_created(a), plan.user_created(b)), 7, c, 5.0)
+    count = _fanout(plan, 7, c, plan.s["messagesPerChat"])
+    messages = []
+    t = opened
+    for k in range(count):
+        t = plan.after(t, 8, c * 4096 + k, 0.2)
+        sender = a if plan.unit(8, c * 4096 + k, 1) < 0.5 else b
+        messages.append({
+            "id": f"m{c:x}-{k:x}",
+            "chatId": f"c{c:x}",
+            "senderId": f"u{sender:x}",
+            "type": "text",
+            "content": _text(plan, 8, c * 4096 + k),
+            "createdAt": t,
+            "isFlagged": plan.unit(8, c * 4096 + k, 2) < 0.002,
+        })
+    chat = {"id": f"c{c:x}", "userAId": f"u{a:x}", "userBId": f"u{b:x}", "lastMessageAt": t if messages else None}
+    return chat, messages
+
+
+def post_row(plan, p):
+    created = plan.post_created(p)
+    return {
+        "id": f"p{p:x}",
+        "userId": f"u{plan.post_author(p):x}",
+        "topicId": f"t{int(plan.unit(9, p) * len(TOPICS))}",
+        "content": _text(plan, 9, p),
+        "createdAt": created,
+        "updatedAt": created,
+    }
+
+
+def report_row(plan, r):
+    p = int(plan.unit(10, r) * plan.posts)
+    reporter = plan.pick_user(10, r, 1)
+    created = plan.after(max(plan.post_created(p), plan.user_created(reporter)), 10, r, 2.0)
+    status = "PENDING" if plan.unit(10, r, 2) < 0.5 else ("RESOLVED" if plan.unit(10, r, 2) < 0.9 else "REJECTED")
+    return {
+        "id": r + 1,
+        "reporterId": f"u{reporter:x}",
+        "reportedId": f"u{plan.post_author(p):x}",
+        "postId": f"p{p:x}",
+        "reason": REPORT_REASONS[int(plan.unit(10, r, 3) * len(REPORT_REASONS))],
+        "status": status,
+        "createdAt": created,
+        "updatedAt": created,
+    }
+
+
+def event_rows(plan, u):
+    # activity decays after signup: each event lands retentionDays (mean) later
+    signup = plan.user_created(u)
+    yield {"id": f"e{u:x}-0", "userId": f"u{u:x}", "event": "signup", "props": {}, "createdAt": signup}
+    count = _fanout(plan, 11, u, plan.s["eventsPerUser"])
+    for k in range(1, count + 1):
+        t = plan.after(signup, 11, u * 4096 + k, plan.s["retentionDays"])
+        if t >= plan.end:
+            continue
+        event = EVENTS[int(plan.unit(11, u * 4096 + k, 1) * len(EVENTS))]
+        yield {
+            "id": f"e{u:x}-{k:x}",
+            "userId": f"u{u:x}",
+            "event": event,
+            "props": {"platform": "ios" if plan.unit(11, u, 2) < 0.55 else "android"},
+            "createdAt": t,
+        }
+
+
+_DEFAULTS_BY_TYPE = {"String": "", "Int": 0, "BigInt": 0, "Float": 0.0, "Boolean": False, "Json": {}}
+_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _array(values):
+    return "{" + ",".join('"' + v.replace("\\", "\\\\").replace('"', '\\"') + '"' for v in values) + "}"
+
+
+def _formatter(spec):
+    # field spec -> fn(value, row) returning COPY text, chosen once per column
+    kind = spec["type"]
+    if spec["list"]:
+        fmt = lambda v: _array(v).translate(_ESCAPES)
+    elif kind == "DateTime":
+        fmt = _ts
+    elif kind == "Boolean":
+        fmt = lambda v: "t" if v else "f"
+    elif kind == "Json":
+        fmt = lambda v: json.dumps(v, ensure_ascii=False, separators=(",", ":")).translate(_ESCAPES)
+    elif kind == "String":
+        fmt = lambda v: v.translate(_ESCAPES)
+    else:
+        fmt = str
+    if spec["optional"]:
+        return lambda v, row: "\\N" if v is None else fmt(v)
+    # required columns the builder left out get createdAt (timestamps) or a type default
+    fallback = _DEFAULTS_BY_TYPE.get(kind, "")
+    if kind == "DateTime":
+        return lambda v, row: fmt(row["createdAt"] if v is None else v)
+    return lambda v, row: fmt(fallback if v is None else v)
+
+
+class CopyWriter:
+    # one shard file in COPY text format; rows are buffered and flushed in chunks
+    def __init__(self, path, model, compress):
+        self.path = path
+        self.fields = [(name, _formatter(spec)) for name, spec in model["fields"].items()]
+        self.f = gzip.open(path, "wt", encoding="utf-8", compresslevel=1) if compress else open(path, "w", encoding="utf-8")
+        self.buffer = []
+        self.rows = 0
+
+    def write(self, row):
+        get = row.get
+        self.buffer.append("\t".join([fmt(get(name), row) for name, fmt in self.fields]))
+        self.rows += 1
+        if len(self.buffer) >= 10_000:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.f.write("\n".join(self.buffer) + "\n")
+            self.buffer = []
+
+    def close(self):
+        self.flush()
+        self.f.close()
+
+
+def _shard_job(unit, plan, models, out_dir, compress):
+    # one range of driving indexes -> one file per table it feeds
+    kind, start, stop, shard = unit
+    ext = ".copy.gz" if compress else ".copy"
+    writers = {}
+
+    def writer(table):
+        if table not in writers:
+            writers[table] = CopyWriter(os.path.join(out_dir, f"{table}.{shard:05d}{ext}"), models[table], compress)
+        return writers[table]
+
+    if kind == "users":
+        for u in range(start, stop):
+            writer("User").write(user_row(plan, u))
+            if plan.unit(5, u, 3) < plan.s["profileRate"]:
+                writer("Profile").write(profile_row(plan, u))
+            for row in friendship_rows(plan, u):
+                writer("Friendship").write(row)
+            for row in event_rows(plan, u):
+                writer("AnalyticsEvent").write(row)
+    elif kind == "chats":
+        for c in range(start, stop):
+            chat, messages = chat_and_message_rows(plan, c)
+            writer("Chat").write(chat)
+            for row in messages:
+                writer("Message").write(row)
+    elif kind == "posts":
+        for p in range(start, stop):
+            writer("Post").write(post_row(plan, p))
+    elif kind == "reports":
+        for r in range(start, stop):
+            writer("Report").write(report_row(plan, r))
+    elif kind == "topics":
+        created = plan.start
+        for i, name in enumerate(TOPICS):
+            writer("Topic").write({"id": f"t{i}", "name": name, "createdAt": created})
+
+    result = {}
+    for table, w in writers.items():
+        w.close()
+        result[table] = (os.path.basename(w.path), w.rows)
+    return result
+
+
+def work_units(plan, shard_rows):
+    units = [("topics", 0, len(TOPICS))]
+    for kind, total in (("users", plan.users), ("chats", plan.chats), ("posts", plan.posts), ("reports", plan.reports)):
+        for start in range(0, total, shard_rows):
+            units.append((kind, start, min(total, start + shard_rows)))
+    return [(kind, start, stop, shard) for shard, (kind, start, stop) in enumerate(units)]
+
+
+def load_script(files, models):
+    # psql script: tables in foreign-key order, sequences bumped past the copied ids
+    lines = ["\\set ON_ERROR_STOP on", "BEGIN;"]
+    for table in TABLES:
+        columns = ", ".join(f'"{spec["column"]}"' for spec in models[table]["fields"].values())
+        for name in sorted(files.get(table, ())):
+            source = f"PROGRAM 'gzip -dc {name}'" if name.endswith(".gz") else f"'{name}'"
+            lines.append(f'\\copy "{models[table]["table"]}" ({columns}) FROM {source}')
+    lines.append("""SELECT setval(pg_get_serial_sequence('"Report"', 'id'), coalesce(max(id), 0) + 1, false) FROM "Report";""")
+    lines.append("COMMIT;")
+    lines.append("ANALYZE;")
+    return "\n".join(lines) + "\n"
+
+
+def generate(settings, out_dir=OUT_DIR, seed=1, end=None, jobs=None, shard_rows=SHARD_ROWS, compress=False, schema=SCHEMA_PATH):
+    with open(schema, encoding="utf-8") as f:
+        models = parse_schema(f.read())
+    if end is None:
+        today = datetime.now(timezone.utc).date()
+        end = datetime(today.year, today.month, today.day, tzinfo=timezone.utc).timestamp()
+    plan = Plan(settings, seed, end)
+    os.makedirs(out_dir, exist_ok=True)
+    files = {}
+    rows = {}
+    units = work_units(plan, shard_rows)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_shard_job, unit, plan, models, out_dir, compress) for unit in units]
+        for future in as_completed(futures):
+            for table, (name, count) in future.result().items():
+                files.setdefault(table, []).append(name)
+                rows[table] = rows.get(table, 0) + count
+    with open(os.path.join(out_dir, "load.sql"), "w", encoding="utf-8") as f:
+        f.write(load_script(files, models))
+    manifest = {
+        "seed": seed,
+        "end": datetime.fromtimestamp(end, timezone.utc).isoformat(),
+        "settings": settings,
+        "rows": {table: rows.get(table, 0) for table in TABLES},
+        "files": {table: sorted(files.get(table, ())) for table in TABLES},
+    }
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def parse_setting(text):
+    name, _, value = text.partition("=")
+    if name not in DEFAULTS:
+        raise argparse.ArgumentTypeError(f"unknown setting {name!r}; one of {', '.join(DEFAULTS)}")
+    return name, float(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate sharded Postgres COPY files of synthetic data for capacity tests")
+    parser.add_argument("--users", type=int, default=DEFAULTS["users"], help="users to generate; other tables scale from it")
+    parser.add_argument("--set", type=parse_setting, action="append", default=[], metavar="NAME=VALUE",
+                        help=f"override a distribution knob ({', '.join(k for k in DEFAULTS if k != 'users')})")
+    parser.add_argument("--out", default=OUT_DIR, help="output directory (default: _contract/seed)")
+    parser.add_argument("--seed", type=int, default=1, help="same seed and settings give byte-identical files")
+    parser.add_argument("--end", help="last day of the data window, YYYY-MM-DD (default: today)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--shard-rows", type=int, default=SHARD_ROWS, help="driving rows (users, chats, posts, reports) per shard")
+    parser.add_argument("--gzip", action="store_true", help="write .copy.gz shards, loaded through gzip -dc")
+    parser.add_argument("--schema", default=SCHEMA_PATH, help="schema.prisma to take tables and columns from")
+    args = parser.parse_args(argv)
+
+    settings = dict(DEFAULTS, users=args.users)
+    settings.update(args.set)
+    end = datetime.strptime(args.end, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp() if args.end else None
+    started = time.perf_counter()
+    manifest = generate(settings, args.out, args.seed, end, args.jobs, args.shard_rows, args.gzip, args.schema)
+    elapsed = time.perf_counter() - started
+    total = sum(manifest["rows"].values())
+    for table, count in manifest["rows"].items():
+        print(f"{table}: {count} rows in {len(manifest['files'][table])} files", file=sys.stderr)
+    print(
+        f"{total} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s); load with: cd {args.out} && psql -f load.sql",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+import argparse
+import json
+import sys
+
+REF_PREFIX = "#/components/schemas/"
+
+_MISSING = object()
+
+_TYPE_TESTS = {
+    "string": "type({v}) is str",
+    "integer": "(type({v}) is int or (type({v}) is float and {v}.is_integer()))",
+    "number": "(type({v}) is int or type({v}) is float)",
+    "boolean": "type({v}) is bool",
+    "null": "{v} is None",
+    "object": "type({v}) is dict",
+    "array": "type({v}) is list",
+}
+
+# keywords that only apply when the instance has the given JSON type
+_OBJECT_KEYWORDS = ("properties", "required", "additionalProperties")
+_STRING_KEYWORDS = ("minLength", "maxLength")
+_ARRAY_KEYWORDS = ("items", "minItems", "maxItems")
+_NUMBER_KEYWORDS = ("minimum", "maximum")
+
+
+def _func_name(name):
+    return "v_" + "".join(c if c.isalnum() else "_" for c in name)
+
+
+def _path_key(key):
+    # property names end up inside generated f-strings
+    return key.replace("\\", "\\\\").replace('"', '\\"').replace("{", "{{").replace("}", "}}")
+
+
+def _ref_name(ref):
+    if not ref.startswith(REF_PREFIX):
+        raise ValueError(f"unsupported $ref: {ref}")
+    return ref[len(REF_PREFIX):]
+
+
+class _Compiler:
+    def __init__(self, schemas):
+        self.schemas = schemas
+        self.lines = []
+        self.constants = []
+        self.counter = 0
+
+    def var(self, prefix):
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def constant(self, prefix, value):
+        # built once at module level rather than on every call
+        name = self.var(prefix.upper() + "_")
+        self.constants.append(f"{name} = {value!r}")
+        return name
+
+    def emit(self, indent, line):
+        self.lines.append("    " * indent + line)
+
+    def source(self):
+        return "\n".join(self.constants + [""] + self.lines)
+
+    def function(self, name, schema, refs=()):
+        self.emit(0, f"def {name}(value, path, errors):")
+        start = len(self.lines)
+        self.node(schema, "value", "{path}", "errors", 1, refs)
+        if len(self.lines) == start:
+            self.emit(1, "pass")
+        self.emit(0, "")
+
+    def node(self, schema, v, path, errs, indent, refs):
+        if schema is True or schema == {}:
+            return
+        if schema is False:
+            self.emit(indent, f'{errs}.append(f"{path}: no value allowed")')
+            return
+
+        if "$ref" in schema:
+            name = _ref_name(schema["$ref"])
+            if name not in self.schemas:
+                raise KeyError(f"unknown schema in $ref: {name}")
+            if name in refs:
+                # recursive reference: call the compiled function instead of inlining forever
+                self.emit(indent, f'{_func_name(name)}({v}, f"{path}", {errs})')
+            else:
+                self.node(self.schemas[name], v, path, errs, indent, refs + (name,))
+
+        for sub in schema.get("allOf", ()):
+            self.node(sub, v, path, errs, indent, refs)
+        if "oneOf" in schema or "anyOf" in schema:
+            self.branches(schema, v, path, errs, indent, refs)
+
+        if "enum" in schema:
+            options = self.constant("enum", schema["enum"])
+            self.emit(indent, f"if {v} not in {options}:")
+            self.emit(indent + 1, f'{errs}.append(f"{path}: expected one of {{{options}!r}}")')
+
+        types = schema.get("type")
+        if isinstance(types, str):
+            types = [types]
+        groups = [
+            ("object", self.object_keywords, _OBJECT_KEYWORDS),
+            ("string", self.string_keywords, _STRING_KEYWORDS),
+            ("array", self.array_keywords, _ARRAY_KEYWORDS),
+            ("number", self.number_keywords, _NUMBER_KEYWORDS),
+        ]
+        active = [(t, fn) for t, fn, keys in groups if any(k in schema for k in keys)]
+
+        if types is None:
+            for t, fn in active:
+                self.emit(indent, f"if {_TYPE_TESTS[t].format(v=v)}:")
+                start = len(self.lines)
+                fn(schema, v, path, errs, indent + 1, refs)
+                if len(self.lines) == start:
+                    self.emit(indent + 1, "pass")
+            return
+
+        chain = []
+        for t, fn in active:
+            if t in types or (t == "number" and "integer" in types):
+                chain.append((_TYPE_TESTS[t if t in types else "integer"].format(v=v), fn))
+        handled = {t for t, _ in active}
+        rest = [t for t in types if t not in handled]
+        if rest:
+            chain.append((" or ".join(_TYPE_TESTS[t].format(v=v) for t in rest), None))
+        expected = " or ".join(types) or "nothing"
+        if len(chain) == 1 and chain[0][1] is None:
+            self.emit(indent, f"if not ({chain[0][0]}):")
+            self.emit(indent + 1, f'{errs}.append(f"{path}: expected {expected}")')
+            return
+        keyword = "if"
+        for cond, fn in chain:
+            self.emit(indent, f"{keyword} {cond}:")
+            start = len(self.lines)
+            if fn is not None:
+                fn(schema, v, path, errs, indent + 1, refs)
+            if len(self.lines) == start:
+                self.emit(indent + 1, "pass")
+            keyword = "elif"
+        if not chain:
+            self.emit(indent, f'{errs}.append(f"{path}: expected {expected}")')
+            return
+        self.emit(indent, "else:")
+        self.emit(indent + 1, f'{errs}.append(f"{path}: expected {expected}")')
+
+    def branches(self, schema, v, path, errs, indent, refs):
+        count = self.var("matched")
+        self.emit(indent, f"{count} = 0")
+        for key in ("oneOf", "anyOf"):
+            for sub in schema.get(key, ()):
+                sub_errs = self.var("branch")
+                self.emit(indent, f"{sub_errs} = []")
+                self.node(sub, v, path, sub_errs, indent, refs)
+                self.emit(indent, f"if not {sub_errs}:")
+                self.emit(indent + 1, f"{count} += 1")
+            if key == "oneOf" and key in schema:
+                self.emit(indent, f"if {count} != 1:")
+                self.emit(indent + 1, f'{errs}.append(f"{path}: expected exactly one oneOf match, got {{{count}}}")')
+                self.emit(indent, f"{count} = 0")
+            elif key in schema:
+                self.emit(indent, f"if not {count}:")
+                self.emit(indent + 1, f'{errs}.append(f"{path}: expected at least one anyOf match")')
+
+    def object_keywords(self, schema, v, path, errs, indent, refs):
+        properties = schema.get("properties", {})
+        required = schema.get("required", ())
+        for key in required:
+            if key not in properties:
+                self.emit(indent, f"if {key!r} not in {v}:")
+                self.emit(indent + 1, f'{errs}.append(f"{path}: missing required property {key!r}")')
+        for key, sub in properties.items():
+            child = self.var("p")
+            self.emit(indent, f"{child} = {v}.get({key!r}, _MISSING)")
+            if key in required:
+                self.emit(indent, f"if {child} is _MISSING:")
+                self.emit(indent + 1, f'{errs}.append(f"{path}: missing required property {key!r}")')
+                self.emit(indent, "else:")
+            else:
+                self.emit(indent, f"if {child} is not _MISSING:")
+            start = len(self.lines)
+            self.node(sub, child, f"{path}.{_path_key(key)}", errs, indent + 1, refs)
+            if len(self.lines) == start:
+                self.emit(indent + 1, "pass")
+        extra = schema.get("additionalProperties", True)
+        if extra is not True:
+            known = self.constant("known", frozenset(properties))
+            key_var = self.var("k")
+            self.emit(indent, f"for {key_var}, {key_var}_value in {v}.items():")
+            self.emit(indent + 1, f"if {key_var} not in {known}:")
+            if extra is False:
+                self.emit(indent + 2, f'{errs}.append(f"{path}: unexpected property {{{key_var}!r}}")')
+            else:
+                self.node(extra, f"{key_var}_value", f"{path}.{{{key_var}}}", errs, indent + 2, refs)
+                self.emit(indent + 2, "pass")
+
+    def string_keywords(self, schema, v, path, errs, indent, refs):
+        if "minLength" in schema:
+            self.emit(indent, f"if len({v}) < {schema['minLength']!r}:")
+            self.emit(indent + 1, f'{errs}.append(f"{path}: shorter than {schema["minLength"]}")')
+        if "maxLength" in schema:
+            self.emit(indent, f"if len({v}) > {schema['maxLength']!r}:")
+            self.emit(indent + 1, f'{errs}.append(f"{path}: longer than {schema["maxLength"]}")')
+
+    def array_keywords(self, schema, v, path, errs, indent, refs):
+        if "minItems" in schema:
+            self.emit(indent, f"if len({v}) < {schema['minItems']!r}:")
+            self.emit(indent + 1, f'{errs}.append(f"{path}: fewer than {schema["minItems"]} items")')
+        if "maxItems" in schema:
+            self.emit(indent, f"if len({v}) > {schema['maxItems']!r}:")
+            self.emit(indent + 1, f'{errs}.append(f"{path}: more than {schema["maxItems"]} items")')
+        items = schema.get("items")
+        if items not in (None, True, {}):
+            index = self.var("i")
+            item = self.var("item")
+            self.emit(indent, f"for {index}, {item} in enumerate({v}):")
+            start = len(self.lines)
+            self.node(items, item, f"{path}[{{{index}}}]", errs, indent + 1, refs)
+            if len(self.lines) == start:
+                self.emit(indent + 1, "pass")
+
+    def number_keywords(self, schema, v, path, errs, indent, refs):
+        if "minimum" in schema:
+            self.emit(indent, f"if {v} < {schema['minimum']!r}:")
+            self.emit(indent + 1, f'{errs}.append(f"{path}: less than {schema["minimum"]}")')
+        if "maximum" in schema:
+            self.emit(indent, f"if {v} > {schema['maximum']!r}:")
+            self.emit(indent + 1, f'{errs}.append(f"{path}: greater than {schema["maximum"]}")')
+
+
+def _wrap(func):
+    def validate(value, path="$"):
+        errors = []
+        func(value, path, errors)
+        return errors
+
+    return validate
+
+
+def compile_source(schemas, extra=None):
+    compiler = _Compiler(schemas)
+    for name, schema in schemas.items():
+        compiler.function(_func_name(name), schema, (name,))
+    for name, schema in (extra or {}).items():
+        compiler.function(_func_name("inline_" + name), schema)
+    return compiler.source()
+
+
+def compile_schemas(schemas, extra=None):
+    source = compile_source(schemas, extra)
+    namespace = {"_MISSING": _MISSING}
+    exec(compile(source, "<contract-validators>", "exec"), namespace)
+    validators = {name: _wrap(namespace[_func_name(name)]) for name in schemas}
+    for name in extra or {}:
+        validators[name] = _wrap(namespace[_func_name("inline_" + name)])
+    return validators
+
+
+def compile_contract(contract):
+    schemas = contract["components"]["schemas"]
+    extra = {}
+    for ep in contract.get("endpoints", []):
+        operation = f"{ep['method'].upper()} {ep['path']}"
+        if ep.get("requestSchema"):
+            extra[f"{operation} request"] = ep["requestSchema"]
+        for status, response in (ep.get("responses") or {}).items():
+            schema = (response.get("content") or {}).get("application/json", {}).get("schema")
+            if schema:
+                extra[f"{operation} {status}"] = schema
+    return compile_schemas(schemas, extra)
+
+
+def validate_many(validate, payloads):
+    # yields (index, errors) for invalid payloads only
+    for index, payload in enumerate(payloads):
+        errors = validate(payload)
+        if errors:
+            yield index, errors
+
+
+def validate_ndjson(validate, lines):
+    loads = json.loads
+    for index, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            payload = loads(line)
+        except ValueError as exc:
+            yield index, [f"$: invalid JSON ({exc})"]
+            continue
+        errors = validate(payload)
+        if errors:
+            yield index, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate JSON payloads against compiled contract schemas")
+    parser.add_argument("target", help='schema name (e.g. ChatMessageRequest) or "POST /auth/apple request" / "GET /gifts 200"')
+    parser.add_argument("input", nargs="?", default="-", help="NDJSON file, or a JSON array with --array (default: stdin)")
+    parser.add_argument("--array", action="store_true", help="input is a single JSON array of payloads")
+    parser.add_argument("--contract", help="emitted api-contract.json to read instead of build_contract.py")
+    parser.add_argument("--show-source", action="store_true", help="print the generated validator source and exit")
+    args = parser.parse_args(argv)
+
+    from build_contract import load_contract
+
+    contract = load_contract(args.contract)
+    if args.show_source:
+        print(compile_source(contract["components"]["schemas"]))
+        return 0
+    validators = compile_contract(contract)
+    if args.target not in validators:
+        parser.error(f"unknown schema or operation: {args.target}")
+    validate = validators[args.target]
+
+    f = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    try:
+        if args.array:
+            payloads = json.load(f)
+            failures = validate_many(validate, payloads)
+        else:
+            failures = validate_ndjson(validate, f)
+        invalid = 0
+        for index, errors in failures:
+            invalid += 1
+            for error in errors:
+                print(f"{index}: {error}")
+    finally:
+        if f is not sys.stdin:
+            f.close()
+    print(f"{invalid} invalid payload(s)", file=sys.stderr)
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
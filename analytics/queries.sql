@@ -15,18 +15,22 @@ SELECT
   / greatest(count(*),1) AS first_day_accept_rate
 FROM sent LEFT JOIN accepted USING (user_id);
 
--- D1/D7 retention (approximate cohort)
-WITH d0 AS (
-  SELECT id AS user_id, date_trunc('day', "createdAt") AS d0 FROM "User"
-), d1 AS (
-  SELECT "userId" AS user_id, min(date_trunc('day', "createdAt")) AS d1
-  FROM "AnalyticsEvent" WHERE event IN ('message_sent','friend_request_sent') GROUP BY 1
-), d7 AS (
-  SELECT "userId" AS user_id, min(date_trunc('day', "createdAt")) AS d7
-  FROM "AnalyticsEvent" WHERE event IN ('message_sent','friend_request_sent') GROUP BY 1
+-- D1/D7/D30 retention per signup-day cohort
+-- One aggregate over active days instead of a correlated subquery per cohort
+-- row; a user counts as retained on day N when active exactly N days after
+-- signup. For daily dashboards prefer analytics/retention.py, which keeps the
+-- cohorts incrementally from exports.
+WITH active AS (
+  SELECT DISTINCT "userId" AS user_id, date_trunc('day', "createdAt") AS day
+  FROM "AnalyticsEvent"
+  WHERE event IN ('message_sent','message_sent_ws','friend_request_sent') AND "userId" IS NOT NULL
 )
 SELECT
-  d0.d0 AS cohort,
-  (SELECT count(*) FROM d0 d WHERE d.d0 = d0.d0) AS installs,
-  (SELECT count(*) FROM d0 d JOIN d1 USING (user_id) WHERE d.d0 = d0.d0 AND d1.d1 = d0.d0 + interval '1 day') AS d1_retained,
-  (SELECT count(*) FROM d0 d JOIN d7 USING (user_id) WHERE d.d0 = d0.d0 AND d7.d7 = d0.d0 + interval '7 day') AS d7_retained;
+  date_trunc('day', u."createdAt") AS cohort,
+  count(DISTINCT u.id) AS installs,
+  count(DISTINCT a.user_id) FILTER (WHERE a.day = date_trunc('day', u."createdAt") + interval '1 day') AS d1_retained,
+  count(DISTINCT a.user_id) FILTER (WHERE a.day = date_trunc('day', u."createdAt") + interval '7 day') AS d7_retained,
+  count(DISTINCT a.user_id) FILTER (WHERE a.day = date_trunc('day', u."createdAt") + interval '30 day') AS d30_retained
+FROM "User" u
+LEFT JOIN active a ON a.user_id = u.id
+GROUP BY 1 ORDER BY 1;
@@ -0,0 +1,364 @@
+import argparse
+import base64
+import csv
+import gzip
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+# Incremental replacement for the cohort queries in queries.sql. One pass over
+# User, AnalyticsEvent and Friendship exports (NDJSON from row_to_json, or CSV
+# with a header from \copy ... CSV HEADER) updates a checkpoint:
+#   - every user gets a signup day (cohort) and a dense ordinal inside it
+#   - each cohort keeps one bitmap per retention offset; bit i is set when
+#     user i of the cohort was active exactly N days after signup, so seeing
+#     an event twice changes nothing
+#   - friend requests keep the first send per requester and the accepts that
+#     fall within 24h of it, read from the Friendship table like the
+#     first-day accept query: the API logs no friend request events, and
+#     Friendship has no accept time, so an accepted row counts at its
+#     createdAt
+# Append-only plain exports are resumed from the byte offset the last run
+# stopped at; events older than the watermark minus the lateness window are
+# skipped, so re-reading overlapping, rewritten or gzipped exports is cheap
+# and safe.
+
+CHECKPOINT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".retention-state.json")
+OFFSETS = (1, 7, 30)
+# message_sent_ws is what chat.gateway.ts logs today
+ACTIVE_EVENTS = ("message_sent", "message_sent_ws", "friend_request_sent")
+SENT_STATUSES = ("requested", "accepted")
+ACCEPTED_STATUS = "accepted"
+LATENESS_HOURS = 48
+DAY = 86400
+# accepts seen before any send are kept until the send shows up, up to this many
+PENDING_ACCEPTS = 8
+TAIL_BYTES = 4096
+
+
+def parse_ts(text):
+    # Postgres text/CSV ("2026-01-01 12:00:00.123") or ISO 8601 from JSON; naive is UTC
+    parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def day_label(day):
+    return datetime.fromtimestamp(day * DAY, timezone.utc).date().isoformat()
+
+
+def _popcount(bitmap):
+    return int.from_bytes(bitmap, "little").bit_count()
+
+
+class RetentionState:
+    def __init__(self, data=None):
+        data = data or {}
+        # user id -> [cohort day, ordinal in cohort]
+        self.users = data.get("users", {})
+        self.cohorts = {
+            int(day): {
+                "size": cohort["size"],
+                "bits": {int(n): bytearray(base64.b64decode(b)) for n, b in cohort["bits"].items()},
+            }
+            for day, cohort in data.get("cohorts", {}).items()
+        }
+        # requester id -> [first send ts, accept timestamps]; accepts are
+        # collapsed to a bool once the 24h window has closed past the lateness
+        self.friends = data.get("friends", {})
+        self.watermark = data.get("watermark")
+        self.files = data.get("files", {})
+        self.unknown = 0
+        self.events = 0
+
+    def to_json(self):
+        return {
+            "watermark": self.watermark,
+            "files": self.files,
+            "users": self.users,
+            "cohorts": {
+                str(day): {"size": c["size"], "bits": {str(n): base64.b64encode(bytes(b)).decode() for n, b in c["bits"].items()}}
+                for day, c in sorted(self.cohorts.items())
+            },
+            "friends": self.friends,
+        }
+
+    def add_user(self, user_id, created):
+        if user_id in self.users:
+            return
+        day = int(created // DAY)
+        cohort = self.cohorts.get(day)
+        if cohort is None:
+            cohort = self.cohorts[day] = {"size": 0, "bits": {}}
+        self.users[user_id] = [day, cohort["size"]]
+        cohort["size"] += 1
+
+    def _seen(self, ts):
+        if self.watermark is None or ts > self.watermark:
+            self.watermark = ts
+
+    def add_event(self, user_id, event, ts, active, offsets):
+        self.events += 1
+        self._seen(ts)
+        if event in active and user_id:
+            user = self.users.get(user_id)
+            if user is None:
+                self.unknown += 1
+            else:
+                n = int(ts // DAY) - user[0]
+                if n in offsets:
+                    bits = self.cohorts[user[0]]["bits"]
+                    bitmap = bits.get(n)
+                    if bitmap is None:
+                        bitmap = bits[n] = bytearray()
+                    byte = user[1] >> 3
+                    if byte >= len(bitmap):
+                        bitmap.extend(bytes(byte + 1 - len(bitmap)))
+                    bitmap[byte] |= 1 << (user[1] & 7)
+
+    def add_friendship(self, requester, status, ts):
+        self._seen(ts)
+        if status in SENT_STATUSES:
+            self._sent(requester, ts)
+        if status == ACCEPTED_STATUS:
+            self._accepted(requester, ts)
+
+    def _sent(self, user_id, ts):
+        record = self.friends.get(user_id)
+        if record is None:
+            self.friends[user_id] = [ts, []]
+        elif record[0] is None or ts < record[0]:
+            if isinstance(record[1], bool):
+                return
+            record[0] = ts
+            record[1] = [a for a in record[1] if a <= ts + DAY]
+
+    def _accepted(self, user_id, ts):
+        record = self.friends.get(user_id)
+        if record is None:
+            self.friends[user_id] = [None, [ts]]
+        elif isinstance(record[1], bool):
+            # a request answered after its window was frozen; snapshots are
+            # re-read, so a row only turns accepted later
+            if not record[1] and record[0] <= ts <= record[0] + DAY:
+                record[1] = True
+        elif (record[0] is None or ts <= record[0] + DAY) and ts not in record[1]:
+            record[1].append(ts)
+            if record[0] is None and len(record[1]) > PENDING_ACCEPTS:
+                record[1] = sorted(record[1])[:PENDING_ACCEPTS]
+
+    def settle(self, lateness):
+        # freeze first-day outcomes whose window can no longer change
+        if self.watermark is None:
+            return
+        for record in self.friends.values():
+            first, accepts = record
+            if first is not None and isinstance(accepts, list) and self.watermark - lateness > first + DAY:
+                record[1] = any(first <= a <= first + DAY for a in accepts)
+
+    def report(self, offsets, last_days=None):
+        mark = int(self.watermark // DAY) if self.watermark is not None else None
+        rows = []
+        for day in sorted(self.cohorts):
+            if last_days and mark is not None and day < mark - last_days:
+                continue
+            cohort = self.cohorts[day]
+            row = {"cohort": day_label(day), "installs": cohort["size"]}
+            for n in offsets:
+                if mark is None or mark <= day + n:
+                    # day N is not over yet; the figure would only go up
+                    row[f"d{n}"] = None
+                    continue
+                retained = _popcount(cohort["bits"].get(n, b""))
+                row[f"d{n}"] = {"retained": retained, "rate": round(retained / cohort["size"], 4) if cohort["size"] else 0}
+            rows.append(row)
+
+        by_day = {}
+        senders = accepted = pending = 0
+        for first, accepts in self.friends.values():
+            if first is None:
+                continue
+            if isinstance(accepts, bool):
+                hit = accepts
+            elif self.watermark is not None and self.watermark > first + DAY:
+                hit = any(first <= a <= first + DAY for a in accepts)
+            else:
+                pending += 1
+                continue
+            day = by_day.setdefault(int(first // DAY), [0, 0])
+            day[0] += 1
+            day[1] += hit
+            senders += 1
+            accepted += hit
+        return {
+            "watermark": datetime.fromtimestamp(self.watermark, timezone.utc).isoformat() if self.watermark is not None else None,
+            "users": len(self.users),
+            "eventsApplied": self.events,
+            "unknownUserEvents": self.unknown,
+            "cohorts": rows,
+            "firstDayFriendAccept": {
+                "senders": senders,
+                "accepted": accepted,
+                "rate": round(accepted / senders, 4) if senders else 0,
+                "pending": pending,
+                "byDay": [
+                    {"day": day_label(day), "senders": s, "accepted": a, "rate": round(a / s, 4)}
+                    for day, (s, a) in sorted(by_day.items())
+                    if not last_days or mark is None or day >= mark - last_days
+                ],
+            },
+        }
+
+
+def _open(path):
+    if path == "-":
+        return sys.stdin.buffer
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def read_rows(path, start=0):
+    # (row dict, byte offset after the row); offsets are only meaningful for
+    # plain files, which are the ones resumed from a checkpoint
+    is_csv = path.removesuffix(".gz").endswith(".csv")
+    with _open(path) as f:
+        header = None
+        if is_csv:
+            header = next(csv.reader([f.readline().decode("utf-8")]), None)
+        if start:
+            f.seek(start)
+        offset = f.tell() if f.seekable() else 0
+        consumed = [offset]
+
+        def lines():
+            for raw in f:
+                consumed[0] += len(raw)
+                yield raw.decode("utf-8")
+
+        if is_csv:
+            for values in csv.reader(lines()):
+                if values:
+                    yield dict(zip(header, values)), consumed[0]
+        else:
+            for line in lines():
+                if line.strip():
+                    yield json.loads(line), consumed[0]
+
+
+def _tail_digest(path, end):
+    # fingerprint of the bytes just before `end`; a re-exported file under the
+    # same name almost never matches it
+    with open(path, "rb") as f:
+        f.seek(max(0, end - TAIL_BYTES))
+        return hashlib.sha1(f.read(min(end, TAIL_BYTES))).hexdigest()
+
+
+def _resume(state, path):
+    # byte offset to continue an append-only plain export from; anything else
+    # (rewritten, truncated, gzipped) is read from the start
+    if path == "-" or path.endswith(".gz"):
+        return 0
+    start, digest = state.files.get(os.path.abspath(path), (0, None))
+    if not start or os.path.getsize(path) < start or _tail_digest(path, start) != digest:
+        return 0
+    return start
+
+
+def _remember(state, path, end):
+    if end is not None and path != "-" and not path.endswith(".gz"):
+        state.files[os.path.abspath(path)] = [end, _tail_digest(path, end)]
+
+
+def ingest_users(state, paths):
+    for path in paths:
+        end = None
+        for row, end in read_rows(path, _resume(state, path)):
+            state.add_user(row["id"], parse_ts(row["createdAt"]))
+        _remember(state, path, end)
+
+
+def ingest_events(state, paths, active, offsets, lateness):
+    floor = state.watermark - lateness if state.watermark is not None else None
+    for path in paths:
+        end = None
+        for row, end in read_rows(path, _resume(state, path)):
+            event = row["event"]
+            if event not in active:
+                continue
+            ts = parse_ts(row["createdAt"])
+            if floor is not None and ts < floor:
+                continue
+            state.add_event(row.get("userId") or None, event, ts, active, offsets)
+        _remember(state, path, end)
+
+
+def ingest_friendships(state, paths):
+    # snapshots, not a log: statuses change in place anywhere in the file, so
+    # every export is read in full and rows are not held to the lateness window
+    for path in paths:
+        for row, _ in read_rows(path):
+            state.add_friendship(row["requesterId"], row["status"], parse_ts(row["createdAt"]))
+
+
+def load_checkpoint(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return RetentionState(json.load(f))
+    except FileNotFoundError:
+        return RetentionState()
+
+
+def save_checkpoint(state, path):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state.to_json(), f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incremental D1/D7/D30 retention and first-day friend-accept rate from exports")
+    parser.add_argument("--users", nargs="*", default=[], help='User exports (NDJSON or CSV with header, .gz allowed): "id", "createdAt"')
+    parser.add_argument("--events", nargs="*", default=[], help='AnalyticsEvent exports: "userId", "event", "createdAt"')
+    parser.add_argument("--friendships", nargs="*", default=[], help='Friendship exports: "requesterId", "status", "createdAt"')
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH, help="state file carried between runs (default: analytics/.retention-state.json)")
+    parser.add_argument("--fresh", action="store_true", help="ignore an existing checkpoint")
+    parser.add_argument("--dry-run", action="store_true", help="report without writing the checkpoint")
+    parser.add_argument("--active", default=",".join(ACTIVE_EVENTS), help="comma-separated events that count as retained activity")
+    parser.add_argument("--offsets", default=",".join(str(n) for n in OFFSETS), help="retention days to track (fixed once a checkpoint exists)")
+    parser.add_argument("--lateness-hours", type=float, default=LATENESS_HOURS, help="how late an event may arrive and still count")
+    parser.add_argument("--days", type=int, help="only report cohorts from the last N days")
+    args = parser.parse_args(argv)
+
+    offsets = tuple(int(n) for n in args.offsets.split(","))
+    active = set(args.active.split(","))
+    lateness = args.lateness_hours * 3600
+    state = RetentionState() if args.fresh else load_checkpoint(args.checkpoint)
+    ingest_users(state, args.users)
+    ingest_events(state, args.events, active, set(offsets), lateness)
+    ingest_friendships(state, args.friendships)
+    state.settle(lateness)
+    if not args.dry_run:
+        save_checkpoint(state, args.checkpoint)
+
+    report = state.report(offsets, args.days)
+    json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    friends = report["firstDayFriendAccept"]
+    if state.friends:
+        accept = f"first-day friend accept {friends['rate']:.1%} of {friends['senders']} senders"
+    else:
+        accept = "no friend accept rate (pass a Friendship export with --friendships)"
+    print(
+        f"{report['users']} users in {len(state.cohorts)} cohorts, {state.events} events applied "
+        f"({state.unknown} from unknown users), watermark {report['watermark']}; {accept}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,434 @@
+// Generated by _contract/codegen.py from _contract/build_contract.py. Do not edit.
+
+import type {
+  AdminSetRoleRequest,
+  AdminUserAction,
+  AdminUserDetailResponse,
+  AdminUserNote,
+  AdminUserProfileUpdate,
+  AdminUserStatusUpdate,
+  AdminUsersListResponse,
+  AnnouncementCreate,
+  AnnouncementEnvelope,
+  AnnouncementListEnvelope,
+  AnnouncementUpdate,
+  AuthCompletePhoneProfileRequest,
+  AuthEmailLoginRequest,
+  AuthEmailResponse,
+  AuthEmailSignupRequest,
+  AuthPhoneRequestOtp,
+  AuthPhoneRequestOtpResponse,
+  AuthPhoneVerifyRequest,
+  AuthPhoneVerifyResponsePending,
+  AuthPhoneVerifyResponseSuccess,
+  ChatDirectRequest,
+  ChatMessageRequest,
+  ChatRoomRequest,
+  CommunityBlock,
+  CommunityReport,
+  ConfirmPurchaseRequest,
+  ConfirmPurchaseResponse,
+  CreatePostRequest,
+  DiscoverUser,
+  Friendship,
+  FriendshipEnvelope,
+  FriendshipRequest,
+  GiftItemList,
+  HealthResponse,
+  InlineOkId,
+  LegalDocument,
+  MetricsDashboard,
+  MetricsSummary,
+  ObjectList,
+  PaginatedPosts,
+  PointProduct,
+  Post,
+  Refund,
+  RefundRequest,
+  ReportItemListEnvelope,
+  Topic,
+  TranslateRequest,
+  TranslateResponse,
+  UsersMeResponse,
+  UsersSearchResponse,
+  UsersUpdateRequest,
+} from './models';
+
+export type Query = Record<string, string | number | boolean | null | undefined>;
+
+export interface ApiClientOptions {
+  baseUrl: string;
+  getToken?: () => string | null | Promise<string | null>;
+  fetch?: typeof fetch;
+  /** GET responses kept for If-None-Match revalidation (default 100). */
+  cacheSize?: number;
+}
+
+export class ApiError extends Error {
+  constructor(public status: number, public body: unknown, message: string) {
+    super(message);
+  }
+}
+
+interface CacheEntry {
+  etag: string;
+  data: unknown;
+}
+
+interface QueuedGet {
+  url: string;
+  auth: boolean;
+  token: string | null | undefined;
+  resolve: (value: unknown) => void;
+  reject: (reason: unknown) => void;
+}
+
+export function createApiClient(options: ApiClientOptions) {
+  const baseUrl = options.baseUrl.replace(/\/+$/, '');
+  const doFetch = options.fetch ?? fetch;
+  const cacheSize = options.cacheSize ?? 100;
+
+  // every GET goes through here: identical in-flight reads share one promise,
+  // reads issued in the same tick are dispatched together, and responses with
+  // an ETag are revalidated with If-None-Match instead of refetched
+  const inflight = new Map<string, Promise<unknown>>();
+  const cache = new Map<string, CacheEntry>();
+  let queue: QueuedGet[] = [];
+  let lastToken: string | null | undefined;
+
+  function buildUrl(path: string, query?: Query): string {
+    let url = baseUrl + path;
+    if (query) {
+      const params = new URLSearchParams();
+      for (const key of Object.keys(query).sort()) {
+        const value = query[key];
+        if (value !== undefined && value !== null) params.set(key, String(value));
+      }
+      const qs = params.toString();
+      if (qs) url += `?${qs}`;
+    }
+    return url;
+  }
+
+  async function tokenFor(auth: boolean): Promise<string | null | undefined> {
+    if (!auth) return undefined;
+    const token = (await options.getToken?.()) ?? null;
+    if (token !== lastToken) {
+      // another user's cached responses must not be served, and reads still
+      // in flight under the old token must not be shared with new callers
+      cache.clear();
+      inflight.clear();
+      lastToken = token;
+    }
+    return token;
+  }
+
+  function headersFor(token: string | null | undefined, body: boolean): Record<string, string> {
+    const headers: Record<string, string> = { Accept: 'application/json' };
+    if (body) headers['Content-Type'] = 'application/json';
+    if (token) headers['Authorization'] = `Bearer ${token}`;
+    return headers;
+  }
+
+  async function readBody(res: Response): Promise<unknown> {
+    if (res.status === 204) return undefined;
+    const data = await res.json().catch(() => undefined);
+    if (!res.ok) {
+      const message = (data && ((data as any).message || (data as any).error)) || `HTTP ${res.status}`;
+      throw new ApiError(res.status, data, String(message));
+    }
+    return data;
+  }
+
+  function remember(url: string, entry: CacheEntry) {
+    cache.delete(url);
+    cache.set(url, entry);
+    while (cache.size > cacheSize) cache.delete(cache.keys().next().value as string);
+  }
+
+  async function fetchGet(url: string, auth: boolean, token: string | null | undefined): Promise<unknown> {
+    const headers = headersFor(token, false);
+    const cached = cache.get(url);
+    if (cached) headers['If-None-Match'] = cached.etag;
+    const res = await doFetch(url, { method: 'GET', headers, cache: 'no-store' });
+    // the token changed while this was in flight: the caller still gets its
+    // answer, but it must not land in the next user's cache
+    const stale = () => auth && token !== lastToken;
+    if (res.status === 304 && cached) {
+      if (!stale()) remember(url, cached);
+      return cached.data;
+    }
+    const data = await readBody(res);
+    if (stale()) return data;
+    const etag = res.headers.get('ETag');
+    if (etag) remember(url, { etag, data });
+    else cache.delete(url);
+    return data;
+  }
+
+  function flush() {
+    const batch = queue;
+    queue = [];
+    for (const item of batch) fetchGet(item.url, item.auth, item.token).then(item.resolve, item.reject);
+  }
+
+  async function get<T>(path: string, auth: boolean, query?: Query): Promise<T> {
+    const url = buildUrl(path, query);
+    // the token is read before the in-flight lookup, so a switch drops reads
+    // started for the previous user instead of sharing them
+    const token = await tokenFor(auth);
+    const pending = inflight.get(url);
+    if (pending) return pending as Promise<T>;
+    const promise = new Promise<unknown>((resolve, reject) => {
+      if (queue.length === 0) queueMicrotask(flush);
+      queue.push({ url, auth, token, resolve, reject });
+    });
+    inflight.set(url, promise);
+    const done = () => {
+      if (inflight.get(url) === promise) inflight.delete(url);
+    };
+    promise.then(done, done);
+    return promise as Promise<T>;
+  }
+
+  function invalidate(pathPrefix = '') {
+    const prefix = baseUrl + pathPrefix;
+    // whole segments only: /posts covers /posts/1 and /posts?page=2, not /postsX
+    for (const url of Array.from(cache.keys())) {
+      if (url === prefix || url.startsWith(prefix + '/') || url.startsWith(prefix + '?')) cache.delete(url);
+    }
+  }
+
+  async function request<T>(method: string, path: string, body: unknown, auth: boolean, collection: string): Promise<T> {
+    const res = await doFetch(baseUrl + path, {
+      method,
+      headers: headersFor(await tokenFor(auth), body !== undefined),
+      body: body === undefined ? undefined : JSON.stringify(body),
+    });
+    const data = await readBody(res);
+    // a write makes cached reads of the same collection stale
+    invalidate(collection);
+    return data as T;
+  }
+
+  /** Issues several reads in the same tick; they share the batch's round of requests. */
+  function batch<T extends readonly unknown[]>(reads: readonly [...{ [K in keyof T]: () => Promise<T[K]> }]): Promise<T> {
+    return Promise.all(reads.map((read) => read())) as unknown as Promise<T>;
+  }
+
+  return {
+    batch,
+    invalidate,
+    /** Redirect to docs */
+    getRoot: (query?: Query): Promise<void> =>
+      get(`/`, false, query),
+    /** Legacy sequential POST fallback */
+    postByFallbackPath: (fallbackPath: string | number, body: Record<string, unknown>): Promise<void> =>
+      request('POST', `/${encodeURIComponent(String(fallbackPath))}`, body, true, ''),
+    /** Health check */
+    getHealth: (query?: Query): Promise<HealthResponse> =>
+      get(`/health`, false, query),
+    /** Email signup */
+    postAuthSignupEmail: (body: AuthEmailSignupRequest): Promise<AuthEmailResponse> =>
+      request('POST', `/auth/signup/email`, body, false, '/auth/signup/email'),
+    /** Email login */
+    postAuthLoginEmail: (body: AuthEmailLoginRequest): Promise<AuthEmailResponse> =>
+      request('POST', `/auth/login/email`, body, false, '/auth/login/email'),
+    /** Apple login */
+    postAuthApple: (body: {
+      token: string;
+      idToken?: string;
+      authorizationCode?: string;
+    }): Promise<void> =>
+      request('POST', `/auth/apple`, body, false, '/auth/apple'),
+    /** Request phone OTP */
+    postAuthPhoneRequestOtp: (body: AuthPhoneRequestOtp): Promise<AuthPhoneRequestOtpResponse> =>
+      request('POST', `/auth/phone/request-otp`, body, false, '/auth/phone/request-otp'),
+    /** Verify phone OTP */
+    postAuthPhoneVerify: (body: AuthPhoneVerifyRequest): Promise<AuthPhoneVerifyResponseSuccess | AuthPhoneVerifyResponsePending> =>
+      request('POST', `/auth/phone/verify`, body, false, '/auth/phone/verify'),
+    /** Complete phone profile */
+    postAuthPhoneCompleteProfile: (body: AuthCompletePhoneProfileRequest): Promise<AuthPhoneVerifyResponseSuccess> =>
+      request('POST', `/auth/phone/complete-profile`, body, false, '/auth/phone/complete-profile'),
+    /** Get current user */
+    getUsersMe: (query?: Query): Promise<UsersMeResponse> =>
+      get(`/users/me`, true, query),
+    /** Search users */
+    getUsersSearch: (query?: Query): Promise<UsersSearchResponse> =>
+      get(`/users/search`, true, query),
+    /** Update profile */
+    patchUsersById: (id: string | number, body: UsersUpdateRequest): Promise<UsersMeResponse> =>
+      request('PATCH', `/users/${encodeURIComponent(String(id))}`, body, true, '/users'),
+    /** Get user */
+    getUsersById: (id: string | number, query?: Query): Promise<UsersMeResponse> =>
+      get(`/users/${encodeURIComponent(String(id))}`, true, query),
+    /** Admin list users */
+    getAdminUsers: (query?: Query): Promise<AdminUsersListResponse> =>
+      get(`/admin/users`, true, query),
+    /** Admin user detail */
+    getAdminUsersById: (id: string | number, query?: Query): Promise<AdminUserDetailResponse> =>
+      get(`/admin/users/${encodeURIComponent(String(id))}`, true, query),
+    /** Admin update user */
+    patchAdminUsersById: (id: string | number, body: AdminUserProfileUpdate): Promise<AdminUserDetailResponse> =>
+      request('PATCH', `/admin/users/${encodeURIComponent(String(id))}`, body, true, '/admin/users'),
+    /** Admin update status */
+    patchAdminUsersByIdStatus: (id: string | number, body: AdminUserStatusUpdate): Promise<void> =>
+      request('PATCH', `/admin/users/${encodeURIComponent(String(id))}/status`, body, true, '/admin/users'),
+    /** Admin add note */
+    postAdminUsersByIdNotes: (id: string | number, body: AdminUserNote): Promise<void> =>
+      request('POST', `/admin/users/${encodeURIComponent(String(id))}/notes`, body, true, '/admin/users'),
+    /** Log resend verification */
+    postAdminUsersByIdActionsResendVerification: (id: string | number, body: AdminUserAction): Promise<void> =>
+      request('POST', `/admin/users/${encodeURIComponent(String(id))}/actions/resend-verification`, body, true, '/admin/users'),
+    /** Log password reset */
+    postAdminUsersByIdActionsPasswordReset: (id: string | number, body: AdminUserAction): Promise<void> =>
+      request('POST', `/admin/users/${encodeURIComponent(String(id))}/actions/password-reset`, body, true, '/admin/users'),
+    /** Log escalate */
+    postAdminUsersByIdActionsEscalate: (id: string | number, body: AdminUserAction): Promise<void> =>
+      request('POST', `/admin/users/${encodeURIComponent(String(id))}/actions/escalate`, body, true, '/admin/users'),
+    /** Create post */
+    postPosts: (body: CreatePostRequest): Promise<Post> =>
+      request('POST', `/posts`, body, true, '/posts'),
+    /** List posts */
+    getPosts: (query?: Query): Promise<PaginatedPosts> =>
+      get(`/posts`, true, query),
+    /** Posts by topic */
+    getTopicsByIdPosts: (id: string | number, query?: Query): Promise<PaginatedPosts> =>
+      get(`/topics/${encodeURIComponent(String(id))}/posts`, true, query),
+    /** List topics */
+    getTopics: (query?: Query): Promise<Topic[]> =>
+      get(`/topics`, true, query),
+    /** Discover users */
+    getDiscover: (query?: Query): Promise<{
+      ok?: boolean;
+      data?: DiscoverUser[];
+    }> =>
+      get(`/discover`, true, query),
+    /** Send friend request */
+    postFriendships: (body: FriendshipRequest): Promise<FriendshipEnvelope> =>
+      request('POST', `/friendships`, body, true, '/friendships'),
+    /** Accept friend */
+    postFriendshipsByIdAccept: (id: string | number): Promise<FriendshipEnvelope> =>
+      request('POST', `/friendships/${encodeURIComponent(String(id))}/accept`, undefined, true, '/friendships'),
+    /** Decline friend */
+    postFriendshipsByIdDecline: (id: string | number): Promise<FriendshipEnvelope> =>
+      request('POST', `/friendships/${encodeURIComponent(String(id))}/decline`, undefined, true, '/friendships'),
+    /** Cancel friend */
+    postFriendshipsByIdCancel: (id: string | number): Promise<FriendshipEnvelope> =>
+      request('POST', `/friendships/${encodeURIComponent(String(id))}/cancel`, undefined, true, '/friendships'),
+    /** List friend requests */
+    getFriendships: (query?: Query): Promise<{
+      ok?: boolean;
+      data?: Friendship[];
+    }> =>
+      get(`/friendships`, true, query),
+    /** List chats */
+    getChats: (query?: Query): Promise<ObjectList> =>
+      get(`/chats`, true, query),
+    /** Send message */
+    postChatsMessage: (body: ChatMessageRequest): Promise<Record<string, unknown>> =>
+      request('POST', `/chats/message`, body, true, '/chats/message'),
+    /** Create chat room */
+    postChatsRooms: (body: ChatRoomRequest): Promise<{
+      ok?: boolean;
+      id?: string;
+      userAId?: string;
+      userBId?: string;
+      title?: string;
+      category?: string;
+    }> =>
+      request('POST', `/chats/rooms`, body, true, '/chats/rooms'),
+    /** Ensure direct chat */
+    postChatsDirect: (body: ChatDirectRequest): Promise<{
+      id?: string;
+      title?: string;
+      participants?: ObjectList;
+    }> =>
+      request('POST', `/chats/direct`, body, true, '/chats/direct'),
+    /** List point products */
+    getStorePointProducts: (query?: Query): Promise<{
+      items?: PointProduct[];
+    }> =>
+      get(`/store/point-products`, false, query),
+    /** Confirm purchase */
+    postStorePurchasesConfirm: (body: ConfirmPurchaseRequest): Promise<ConfirmPurchaseResponse> =>
+      request('POST', `/store/purchases/confirm`, body, true, '/store/purchases/confirm'),
+    /** List gifts */
+    getGifts: (query?: Query): Promise<{
+      ok?: boolean;
+      data?: GiftItemList;
+      items?: GiftItemList;
+    }> =>
+      get(`/gifts`, false, query),
+    /** Get legal document */
+    getLegalDocumentsBySlug: (slug: string | number, query?: Query): Promise<LegalDocument> =>
+      get(`/legal-documents/${encodeURIComponent(String(slug))}`, false, query),
+    /** Admin list announcements */
+    getAdminAnnouncements: (query?: Query): Promise<AnnouncementListEnvelope> =>
+      get(`/admin/announcements`, true, query),
+    /** Create announcement */
+    postAdminAnnouncements: (body: AnnouncementCreate): Promise<AnnouncementEnvelope> =>
+      request('POST', `/admin/announcements`, body, true, '/admin/announcements'),
+    /** Update announcement */
+    patchAdminAnnouncementsById: (id: string | number, body: AnnouncementUpdate): Promise<AnnouncementEnvelope> =>
+      request('PATCH', `/admin/announcements/${encodeURIComponent(String(id))}`, body, true, '/admin/announcements'),
+    /** Delete announcement */
+    deleteAdminAnnouncementsById: (id: string | number): Promise<{
+      ok?: boolean;
+    }> =>
+      request('DELETE', `/admin/announcements/${encodeURIComponent(String(id))}`, undefined, true, '/admin/announcements'),
+    /** Active announcements */
+    getAnnouncementsActive: (query?: Query): Promise<AnnouncementListEnvelope> =>
+      get(`/announcements/active`, true, query),
+    /** List announcements */
+    getAnnouncements: (query?: Query): Promise<AnnouncementListEnvelope> =>
+      get(`/announcements`, true, query),
+    /** Admin list reports */
+    getAdminReports: (query?: Query): Promise<ReportItemListEnvelope> =>
+      get(`/admin/reports`, true, query),
+    /** Recent reports */
+    getAdminReportsRecent: (query?: Query): Promise<ReportItemListEnvelope> =>
+      get(`/admin/reports/recent`, true, query),
+    /** Metrics summary */
+    getMetrics: (query?: Query): Promise<{
+      ok?: boolean;
+      data?: MetricsSummary;
+    }> =>
+      get(`/metrics`, true, query),
+    /** Metrics dashboard */
+    getMetricsDashboard: (query?: Query): Promise<{
+      ok?: boolean;
+      data?: MetricsDashboard;
+    }> =>
+      get(`/metrics/dashboard`, true, query),
+    /** Report content */
+    postCommunityReport: (body: CommunityReport): Promise<InlineOkId> =>
+      request('POST', `/community/report`, body, true, '/community/report'),
+    /** Block user */
+    postCommunityBlock: (body: CommunityBlock): Promise<InlineOkId> =>
+      request('POST', `/community/block`, body, true, '/community/block'),
+    /** Translate text */
+    postTranslate: (body: TranslateRequest): Promise<TranslateResponse> =>
+      request('POST', `/translate`, body, true, '/translate'),
+    /** Get icebreakers */
+    getIcebreakers: (query?: Query): Promise<string[]> =>
+      get(`/icebreakers`, true, query),
+    /** Set user role */
+    patchAdminUsersByIdRole: (id: string | number, body: AdminSetRoleRequest): Promise<Record<string, unknown>> =>
+      request('PATCH', `/admin/users/${encodeURIComponent(String(id))}/role`, body, true, '/admin/users'),
+    /** List refunds */
+    getAdminRefunds: (query?: Query): Promise<Refund[]> =>
+      get(`/admin/refunds`, true, query),
+    /** Create refund */
+    postAdminRefunds: (body: RefundRequest): Promise<Refund> =>
+      request('POST', `/admin/refunds`, body, true, '/admin/refunds'),
+    /** Approve refund */
+    patchAdminRefundsByIdApprove: (id: string | number): Promise<Refund> =>
+      request('PATCH', `/admin/refunds/${encodeURIComponent(String(id))}/approve`, undefined, true, '/admin/refunds'),
+    /** Deny refund */
+    patchAdminRefundsByIdDeny: (id: string | number): Promise<Refund> =>
+      request('PATCH', `/admin/refunds/${encodeURIComponent(String(id))}/deny`, undefined, true, '/admin/refunds'),
+  };
+}
+
+export type ApiClient = ReturnType<typeof createApiClient>;
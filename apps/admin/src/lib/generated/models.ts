@@ -0,0 +1,358 @@
+// Generated by _contract/codegen.py from _contract/build_contract.py. Do not edit.
+
+export interface AuthUser {
+  id?: string;
+  email?: string | null;
+  displayName?: string | null;
+  provider?: string | null;
+  pointsBalance?: number;
+  profile?: Record<string, unknown> | null;
+}
+
+export interface AuthEmailSignupRequest {
+  email: string;
+  password: string;
+  displayName?: string;
+  dob: string;
+  gender: string;
+}
+
+export interface AuthEmailLoginRequest {
+  email: string;
+  password: string;
+}
+
+export interface AuthEmailResponse {
+  user: AuthUser;
+  token: string;
+  access_token: string;
+}
+
+export interface AuthPhoneRequestOtp {
+  phone: string;
+  countryCode: string;
+}
+
+export interface AuthPhoneRequestOtpResponse {
+  requestId: string;
+  expiresIn: number;
+  debugCode?: string;
+}
+
+export interface AuthPhoneVerifyRequest {
+  requestId: string;
+  phone: string;
+  code: string;
+}
+
+export interface AuthPhoneVerifyResponseSuccess {
+  token: string;
+  user: AuthUser;
+}
+
+export interface AuthPhoneVerifyResponsePending {
+  needsProfile: boolean;
+  verificationId: string;
+}
+
+export interface AuthCompletePhoneProfileRequest {
+  phone: string;
+  verificationId: string;
+  nickname: string;
+  birthYear: number;
+  gender: string;
+  region?: string;
+  headline?: string;
+  bio?: string;
+  avatarUri?: string;
+  adminOverride?: boolean;
+}
+
+export interface UserSummary {
+  id?: string;
+  email?: string | null;
+  displayName?: string | null;
+  status?: string;
+  provider?: string | null;
+  pointsBalance?: number;
+  createdAt?: string;
+  profile?: Record<string, unknown> | null;
+  counts?: Record<string, unknown> | null;
+}
+
+export interface UsersMeResponse {
+  ok?: boolean;
+  data?: UserSummary;
+}
+
+export interface UsersUpdateRequest {
+  displayName?: string;
+  nickname?: string;
+  bio?: string;
+  region1?: string;
+  region2?: string;
+  interests?: string[] | string;
+  marketingOptIn?: boolean | string;
+  headline?: string;
+  avatarUri?: string;
+}
+
+export interface UsersSearchResponse {
+  ok?: boolean;
+  data?: (Record<string, unknown>)[];
+}
+
+export interface AdminUsersListResponse {
+  ok?: boolean;
+  page?: number;
+  limit?: number;
+  total?: number;
+  totalPages?: number;
+  data?: (Record<string, unknown>)[];
+}
+
+export interface AdminUserDetailResponse {
+  ok?: boolean;
+  data?: Record<string, unknown>;
+}
+
+export type AdminUserProfileUpdate = Record<string, unknown>;
+
+export interface AdminUserStatusUpdate {
+  status: string;
+  expiresAt?: string;
+}
+
+export interface AdminUserNote {
+  note: string;
+  authorId?: string;
+}
+
+export interface AdminUserAction {
+  reason?: string;
+  performedBy?: string;
+  metadata?: Record<string, unknown>;
+}
+
+export interface CreatePostRequest {
+  topicId: string;
+  content: string;
+}
+
+export interface Post {
+  id?: string;
+  userId?: string;
+  topicId?: string;
+  content?: string;
+  createdAt?: string;
+}
+
+export interface PaginatedPosts {
+  items?: Post[];
+  nextCursor?: string | null;
+  hasMore?: boolean;
+}
+
+export interface Topic {
+  id?: string;
+  name?: string;
+  createdAt?: string;
+  postsCount?: number;
+}
+
+export interface DiscoverUser {
+  id?: string;
+  email?: string;
+  displayName?: string | null;
+  gender?: string | null;
+  dob?: string | null;
+  region1?: string | null;
+  region2?: string | null;
+}
+
+export interface FriendshipRequest {
+  requesterId: string;
+  addresseeId: string;
+}
+
+export interface Friendship {
+  id?: string;
+  requesterId?: string;
+  addresseeId?: string;
+  status?: string;
+  createdAt?: string;
+  updatedAt?: string;
+  [key: string]: unknown;
+}
+
+export interface ChatMessageRequest {
+  chatId: string;
+  senderId: string;
+  content: string;
+}
+
+export interface ChatRoomRequest {
+  userAId: string;
+  userBId: string;
+  title?: string;
+  category?: string;
+}
+
+export interface ChatDirectRequest {
+  targetUserId: string;
+}
+
+export interface PointProduct {
+  id?: string;
+  productId?: string;
+  label?: string;
+  priceText?: string;
+  points?: number;
+  recommended?: boolean;
+  currency?: string;
+}
+
+export interface ConfirmPurchaseRequest {
+  productId: string;
+  transactionId: string;
+  receipt: string;
+  platform: string;
+}
+
+export interface ConfirmPurchaseResponse {
+  success?: boolean;
+  balance?: number;
+}
+
+export interface GiftItem {
+  id?: string;
+  name?: string;
+  description?: string;
+  imageUrl?: string;
+  priceCents?: number;
+  currency?: string;
+}
+
+export interface LegalDocument {
+  slug?: string;
+  title?: string;
+  content?: string;
+}
+
+export interface Announcement {
+  id?: string;
+  title?: string;
+  body?: string;
+  isActive?: boolean;
+  createdAt?: string;
+  startsAt?: string | null;
+  endsAt?: string | null;
+}
+
+export interface AnnouncementCreate {
+  title: string;
+  body: string;
+  isActive?: boolean;
+  startsAt?: string;
+  endsAt?: string | null;
+}
+
+export interface AnnouncementUpdate {
+  title?: string;
+  body?: string;
+  isActive?: boolean;
+  startsAt?: string;
+  endsAt?: string | null;
+}
+
+export interface ReportItem {
+  id?: string;
+  reason?: string;
+  status?: string;
+  createdAt?: string;
+  [key: string]: unknown;
+}
+
+export interface MetricsSummary {
+  users?: number;
+  posts?: number;
+  chats?: number;
+  reports?: number;
+  activeAnnouncements?: number;
+  bannedWords?: number;
+  activeSubscriptions?: number;
+}
+
+export type MetricsDashboard = Record<string, unknown>;
+
+export interface CommunityReport {
+  targetUserId?: string;
+  postId?: string;
+  reason: string;
+}
+
+export interface CommunityBlock {
+  blockedUserId: string;
+}
+
+export interface TranslateRequest {
+  text: string;
+  source: string;
+  target: string;
+}
+
+export interface TranslateResponse {
+  text?: string;
+  provider?: string;
+  mode?: string;
+  error?: string;
+}
+
+export interface HealthResponse {
+  ok?: boolean;
+  timestamp?: string;
+  components?: (Record<string, unknown>)[];
+}
+
+export interface AdminSetRoleRequest {
+  role: string;
+}
+
+export interface RefundRequest {
+  userId: string;
+  platform: string;
+  productId: string;
+  receiptId: string;
+  reason?: string;
+}
+
+export type Refund = Record<string, unknown>;
+
+export interface FriendshipEnvelope {
+  ok?: boolean;
+  data?: Friendship;
+}
+
+export type ObjectList = (Record<string, unknown>)[];
+
+export type GiftItemList = GiftItem[];
+
+export interface AnnouncementListEnvelope {
+  ok?: boolean;
+  data?: Announcement[];
+}
+
+export interface AnnouncementEnvelope {
+  ok?: boolean;
+  data?: Announcement;
+}
+
+export interface ReportItemListEnvelope {
+  ok?: boolean;
+  data?: ReportItem[];
+}
+
+export interface InlineOkId {
+  ok?: boolean;
+  id?: string;
+}
@@ -0,0 +1,373 @@
+// Generated by _contract/codegen.py from _contract/build_contract.py. Do not edit.
+
+import 'package:dio/dio.dart';
+
+import 'models.dart';
+
+class TokApiClient {
+  TokApiClient(this._dio, {this.tokenProvider});
+
+  final Dio _dio;
+  final Future<String?> Function()? tokenProvider;
+
+  Future<dynamic> _request(
+    String path, {
+    required String method,
+    required bool auth,
+    Object? data,
+    Map<String, dynamic>? query,
+  }) async {
+    final headers = <String, dynamic>{};
+    if (auth && tokenProvider != null) {
+      final token = await tokenProvider!();
+      if (token != null) headers['Authorization'] = 'Bearer $token';
+    }
+    final res = await _dio.request<dynamic>(
+      path,
+      data: data,
+      queryParameters: query,
+      options: Options(method: method, headers: headers),
+    );
+    return res.data;
+  }
+
+  /// Redirect to docs
+  Future<void> getRoot({Map<String, dynamic>? query}) async {
+    await _request('/', method: 'GET', auth: false, query: query);
+  }
+
+  /// Legacy sequential POST fallback
+  Future<void> postByFallbackPath(String fallbackPath, Map<String, dynamic> body) async {
+    await _request('/${Uri.encodeComponent(fallbackPath)}', method: 'POST', auth: true, data: body);
+  }
+
+  /// Health check
+  Future<HealthResponse> getHealth({Map<String, dynamic>? query}) async {
+    final data = await _request('/health', method: 'GET', auth: false, query: query);
+    return HealthResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Email signup
+  Future<AuthEmailResponse> postAuthSignupEmail(AuthEmailSignupRequest body) async {
+    final data = await _request('/auth/signup/email', method: 'POST', auth: false, data: body.toJson());
+    return AuthEmailResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Email login
+  Future<AuthEmailResponse> postAuthLoginEmail(AuthEmailLoginRequest body) async {
+    final data = await _request('/auth/login/email', method: 'POST', auth: false, data: body.toJson());
+    return AuthEmailResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Apple login
+  Future<void> postAuthApple(PostAuthAppleRequest body) async {
+    await _request('/auth/apple', method: 'POST', auth: false, data: body.toJson());
+  }
+
+  /// Request phone OTP
+  Future<AuthPhoneRequestOtpResponse> postAuthPhoneRequestOtp(AuthPhoneRequestOtp body) async {
+    final data = await _request('/auth/phone/request-otp', method: 'POST', auth: false, data: body.toJson());
+    return AuthPhoneRequestOtpResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Verify phone OTP
+  Future<dynamic> postAuthPhoneVerify(AuthPhoneVerifyRequest body) async {
+    final data = await _request('/auth/phone/verify', method: 'POST', auth: false, data: body.toJson());
+    return data;
+  }
+
+  /// Complete phone profile
+  Future<AuthPhoneVerifyResponseSuccess> postAuthPhoneCompleteProfile(AuthCompletePhoneProfileRequest body) async {
+    final data = await _request('/auth/phone/complete-profile', method: 'POST', auth: false, data: body.toJson());
+    return AuthPhoneVerifyResponseSuccess.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Get current user
+  Future<UsersMeResponse> getUsersMe({Map<String, dynamic>? query}) async {
+    final data = await _request('/users/me', method: 'GET', auth: true, query: query);
+    return UsersMeResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Search users
+  Future<UsersSearchResponse> getUsersSearch({Map<String, dynamic>? query}) async {
+    final data = await _request('/users/search', method: 'GET', auth: true, query: query);
+    return UsersSearchResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Update profile
+  Future<UsersMeResponse> patchUsersById(String id, UsersUpdateRequest body) async {
+    final data = await _request('/users/${Uri.encodeComponent(id)}', method: 'PATCH', auth: true, data: body.toJson());
+    return UsersMeResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Get user
+  Future<UsersMeResponse> getUsersById(String id, {Map<String, dynamic>? query}) async {
+    final data = await _request('/users/${Uri.encodeComponent(id)}', method: 'GET', auth: true, query: query);
+    return UsersMeResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Admin list users
+  Future<AdminUsersListResponse> getAdminUsers({Map<String, dynamic>? query}) async {
+    final data = await _request('/admin/users', method: 'GET', auth: true, query: query);
+    return AdminUsersListResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Admin user detail
+  Future<AdminUserDetailResponse> getAdminUsersById(String id, {Map<String, dynamic>? query}) async {
+    final data = await _request('/admin/users/${Uri.encodeComponent(id)}', method: 'GET', auth: true, query: query);
+    return AdminUserDetailResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Admin update user
+  Future<AdminUserDetailResponse> patchAdminUsersById(String id, Map<String, dynamic> body) async {
+    final data = await _request('/admin/users/${Uri.encodeComponent(id)}', method: 'PATCH', auth: true, data: body);
+    return AdminUserDetailResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Admin update status
+  Future<void> patchAdminUsersByIdStatus(String id, AdminUserStatusUpdate body) async {
+    await _request('/admin/users/${Uri.encodeComponent(id)}/status', method: 'PATCH', auth: true, data: body.toJson());
+  }
+
+  /// Admin add note
+  Future<void> postAdminUsersByIdNotes(String id, AdminUserNote body) async {
+    await _request('/admin/users/${Uri.encodeComponent(id)}/notes', method: 'POST', auth: true, data: body.toJson());
+  }
+
+  /// Log resend verification
+  Future<void> postAdminUsersByIdActionsResendVerification(String id, AdminUserAction body) async {
+    await _request('/admin/users/${Uri.encodeComponent(id)}/actions/resend-verification', method: 'POST', auth: true, data: body.toJson());
+  }
+
+  /// Log password reset
+  Future<void> postAdminUsersByIdActionsPasswordReset(String id, AdminUserAction body) async {
+    await _request('/admin/users/${Uri.encodeComponent(id)}/actions/password-reset', method: 'POST', auth: true, data: body.toJson());
+  }
+
+  /// Log escalate
+  Future<void> postAdminUsersByIdActionsEscalate(String id, AdminUserAction body) async {
+    await _request('/admin/users/${Uri.encodeComponent(id)}/actions/escalate', method: 'POST', auth: true, data: body.toJson());
+  }
+
+  /// Create post
+  Future<Post> postPosts(CreatePostRequest body) async {
+    final data = await _request('/posts', method: 'POST', auth: true, data: body.toJson());
+    return Post.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// List posts
+  Future<PaginatedPosts> getPosts({Map<String, dynamic>? query}) async {
+    final data = await _request('/posts', method: 'GET', auth: true, query: query);
+    return PaginatedPosts.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Posts by topic
+  Future<PaginatedPosts> getTopicsByIdPosts(String id, {Map<String, dynamic>? query}) async {
+    final data = await _request('/topics/${Uri.encodeComponent(id)}/posts', method: 'GET', auth: true, query: query);
+    return PaginatedPosts.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// List topics
+  Future<List<Topic>> getTopics({Map<String, dynamic>? query}) async {
+    final data = await _request('/topics', method: 'GET', auth: true, query: query);
+    return (data as List<dynamic>).map((e) => Topic.fromJson(e as Map<String, dynamic>)).toList();
+  }
+
+  /// Discover users
+  Future<GetDiscoverResponse> getDiscover({Map<String, dynamic>? query}) async {
+    final data = await _request('/discover', method: 'GET', auth: true, query: query);
+    return GetDiscoverResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Send friend request
+  Future<FriendshipEnvelope> postFriendships(FriendshipRequest body) async {
+    final data = await _request('/friendships', method: 'POST', auth: true, data: body.toJson());
+    return FriendshipEnvelope.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Accept friend
+  Future<FriendshipEnvelope> postFriendshipsByIdAccept(String id) async {
+    final data = await _request('/friendships/${Uri.encodeComponent(id)}/accept', method: 'POST', auth: true);
+    return FriendshipEnvelope.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Decline friend
+  Future<FriendshipEnvelope> postFriendshipsByIdDecline(String id) async {
+    final data = await _request('/friendships/${Uri.encodeComponent(id)}/decline', method: 'POST', auth: true);
+    return FriendshipEnvelope.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Cancel friend
+  Future<FriendshipEnvelope> postFriendshipsByIdCancel(String id) async {
+    final data = await _request('/friendships/${Uri.encodeComponent(id)}/cancel', method: 'POST', auth: true);
+    return FriendshipEnvelope.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// List friend requests
+  Future<GetFriendshipsResponse> getFriendships({Map<String, dynamic>? query}) async {
+    final data = await _request('/friendships', method: 'GET', auth: true, query: query);
+    return GetFriendshipsResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// List chats
+  Future<List<Map<String, dynamic>>> getChats({Map<String, dynamic>? query}) async {
+    final data = await _request('/chats', method: 'GET', auth: true, query: query);
+    return (data as List<dynamic>).map((e) => e as Map<String, dynamic>).toList();
+  }
+
+  /// Send message
+  Future<Map<String, dynamic>> postChatsMessage(ChatMessageRequest body) async {
+    final data = await _request('/chats/message', method: 'POST', auth: true, data: body.toJson());
+    return data as Map<String, dynamic>;
+  }
+
+  /// Create chat room
+  Future<PostChatsRoomsResponse> postChatsRooms(ChatRoomRequest body) async {
+    final data = await _request('/chats/rooms', method: 'POST', auth: true, data: body.toJson());
+    return PostChatsRoomsResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Ensure direct chat
+  Future<PostChatsDirectResponse> postChatsDirect(ChatDirectRequest body) async {
+    final data = await _request('/chats/direct', method: 'POST', auth: true, data: body.toJson());
+    return PostChatsDirectResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// List point products
+  Future<GetStorePointProductsResponse> getStorePointProducts({Map<String, dynamic>? query}) async {
+    final data = await _request('/store/point-products', method: 'GET', auth: false, query: query);
+    return GetStorePointProductsResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Confirm purchase
+  Future<ConfirmPurchaseResponse> postStorePurchasesConfirm(ConfirmPurchaseRequest body) async {
+    final data = await _request('/store/purchases/confirm', method: 'POST', auth: true, data: body.toJson());
+    return ConfirmPurchaseResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// List gifts
+  Future<GetGiftsResponse> getGifts({Map<String, dynamic>? query}) async {
+    final data = await _request('/gifts', method: 'GET', auth: false, query: query);
+    return GetGiftsResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Get legal document
+  Future<LegalDocument> getLegalDocumentsBySlug(String slug, {Map<String, dynamic>? query}) async {
+    final data = await _request('/legal-documents/${Uri.encodeComponent(slug)}', method: 'GET', auth: false, query: query);
+    return LegalDocument.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Admin list announcements
+  Future<AnnouncementListEnvelope> getAdminAnnouncements({Map<String, dynamic>? query}) async {
+    final data = await _request('/admin/announcements', method: 'GET', auth: true, query: query);
+    return AnnouncementListEnvelope.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Create announcement
+  Future<AnnouncementEnvelope> postAdminAnnouncements(AnnouncementCreate body) async {
+    final data = await _request('/admin/announcements', method: 'POST', auth: true, data: body.toJson());
+    return AnnouncementEnvelope.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Update announcement
+  Future<AnnouncementEnvelope> patchAdminAnnouncementsById(String id, AnnouncementUpdate body) async {
+    final data = await _request('/admin/announcements/${Uri.encodeComponent(id)}', method: 'PATCH', auth: true, data: body.toJson());
+    return AnnouncementEnvelope.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Delete announcement
+  Future<DeleteAdminAnnouncementsByIdResponse> deleteAdminAnnouncementsById(String id) async {
+    final data = await _request('/admin/announcements/${Uri.encodeComponent(id)}', method: 'DELETE', auth: true);
+    return DeleteAdminAnnouncementsByIdResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Active announcements
+  Future<AnnouncementListEnvelope> getAnnouncementsActive({Map<String, dynamic>? query}) async {
+    final data = await _request('/announcements/active', method: 'GET', auth: true, query: query);
+    return AnnouncementListEnvelope.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// List announcements
+  Future<AnnouncementListEnvelope> getAnnouncements({Map<String, dynamic>? query}) async {
+    final data = await _request('/announcements', method: 'GET', auth: true, query: query);
+    return AnnouncementListEnvelope.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Admin list reports
+  Future<ReportItemListEnvelope> getAdminReports({Map<String, dynamic>? query}) async {
+    final data = await _request('/admin/reports', method: 'GET', auth: true, query: query);
+    return ReportItemListEnvelope.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Recent reports
+  Future<ReportItemListEnvelope> getAdminReportsRecent({Map<String, dynamic>? query}) async {
+    final data = await _request('/admin/reports/recent', method: 'GET', auth: true, query: query);
+    return ReportItemListEnvelope.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Metrics summary
+  Future<GetMetricsResponse> getMetrics({Map<String, dynamic>? query}) async {
+    final data = await _request('/metrics', method: 'GET', auth: true, query: query);
+    return GetMetricsResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Metrics dashboard
+  Future<GetMetricsDashboardResponse> getMetricsDashboard({Map<String, dynamic>? query}) async {
+    final data = await _request('/metrics/dashboard', method: 'GET', auth: true, query: query);
+    return GetMetricsDashboardResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Report content
+  Future<InlineOkId> postCommunityReport(CommunityReport body) async {
+    final data = await _request('/community/report', method: 'POST', auth: true, data: body.toJson());
+    return InlineOkId.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Block user
+  Future<InlineOkId> postCommunityBlock(CommunityBlock body) async {
+    final data = await _request('/community/block', method: 'POST', auth: true, data: body.toJson());
+    return InlineOkId.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Translate text
+  Future<TranslateResponse> postTranslate(TranslateRequest body) async {
+    final data = await _request('/translate', method: 'POST', auth: true, data: body.toJson());
+    return TranslateResponse.fromJson(data as Map<String, dynamic>);
+  }
+
+  /// Get icebreakers
+  Future<List<String>> getIcebreakers({Map<String, dynamic>? query}) async {
+    final data = await _request('/icebreakers', method: 'GET', auth: true, query: query);
+    return (data as List<dynamic>).map((e) => e as String).toList();
+  }
+
+  /// Set user role
+  Future<Map<String, dynamic>> patchAdminUsersByIdRole(String id, AdminSetRoleRequest body) async {
+    final data = await _request('/admin/users/${Uri.encodeComponent(id)}/role', method: 'PATCH', auth: true, data: body.toJson());
+    return data as Map<String, dynamic>;
+  }
+
+  /// List refunds
+  Future<List<Map<String, dynamic>>> getAdminRefunds({Map<String, dynamic>? query}) async {
+    final data = await _request('/admin/refunds', method: 'GET', auth: true, query: query);
+    return (data as List<dynamic>).map((e) => e as Map<String, dynamic>).toList();
+  }
+
+  /// Create refund
+  Future<Map<String, dynamic>> postAdminRefunds(RefundRequest body) async {
+    final data = await _request('/admin/refunds', method: 'POST', auth: true, data: body.toJson());
+    return data as Map<String, dynamic>;
+  }
+
+  /// Approve refund
+  Future<Map<String, dynamic>> patchAdminRefundsByIdApprove(String id) async {
+    final data = await _request('/admin/refunds/${Uri.encodeComponent(id)}/approve', method: 'PATCH', auth: true);
+    return data as Map<String, dynamic>;
+  }
+
+  /// Deny refund
+  Future<Map<String, dynamic>> patchAdminRefundsByIdDeny(String id) async {
+    final data = await _request('/admin/refunds/${Uri.encodeComponent(id)}/deny', method: 'PATCH', auth: true);
+    return data as Map<String, dynamic>;
+  }
+}
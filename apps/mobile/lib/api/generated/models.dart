@@ -0,0 +1,1324 @@
+// Generated by _contract/codegen.py from _contract/build_contract.py. Do not edit.
+// ignore_for_file: prefer_const_constructors, unnecessary_this
+
+class AuthUser {
+  const AuthUser({this.id, this.email, this.displayName, this.provider, this.pointsBalance, this.profile});
+
+  final String? id;
+  final String? email;
+  final String? displayName;
+  final String? provider;
+  final int? pointsBalance;
+  final Map<String, dynamic>? profile;
+
+  factory AuthUser.fromJson(Map<String, dynamic> json) => AuthUser(
+        id: json['id'] as String?,
+        email: json['email'] as String?,
+        displayName: json['displayName'] as String?,
+        provider: json['provider'] as String?,
+        pointsBalance: json['pointsBalance'] as int?,
+        profile: json['profile'] == null ? null : json['profile'] as Map<String, dynamic>,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (id != null) 'id': id,
+        if (email != null) 'email': email,
+        if (displayName != null) 'displayName': displayName,
+        if (provider != null) 'provider': provider,
+        if (pointsBalance != null) 'pointsBalance': pointsBalance,
+        if (profile != null) 'profile': profile,
+      };
+}
+
+class AuthEmailSignupRequest {
+  const AuthEmailSignupRequest({required this.email, required this.password, this.displayName, required this.dob, required this.gender});
+
+  final String email;
+  final String password;
+  final String? displayName;
+  final String dob;
+  final String gender;
+
+  factory AuthEmailSignupRequest.fromJson(Map<String, dynamic> json) => AuthEmailSignupRequest(
+        email: json['email'] as String,
+        password: json['password'] as String,
+        displayName: json['displayName'] as String?,
+        dob: json['dob'] as String,
+        gender: json['gender'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'email': email,
+        'password': password,
+        if (displayName != null) 'displayName': displayName,
+        'dob': dob,
+        'gender': gender,
+      };
+}
+
+class AuthEmailLoginRequest {
+  const AuthEmailLoginRequest({required this.email, required this.password});
+
+  final String email;
+  final String password;
+
+  factory AuthEmailLoginRequest.fromJson(Map<String, dynamic> json) => AuthEmailLoginRequest(
+        email: json['email'] as String,
+        password: json['password'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'email': email,
+        'password': password,
+      };
+}
+
+class AuthEmailResponse {
+  const AuthEmailResponse({required this.user, required this.token, required this.accessToken});
+
+  final AuthUser user;
+  final String token;
+  final String accessToken;
+
+  factory AuthEmailResponse.fromJson(Map<String, dynamic> json) => AuthEmailResponse(
+        user: AuthUser.fromJson(json['user'] as Map<String, dynamic>),
+        token: json['token'] as String,
+        accessToken: json['access_token'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'user': user.toJson(),
+        'token': token,
+        'access_token': accessToken,
+      };
+}
+
+class AuthPhoneRequestOtp {
+  const AuthPhoneRequestOtp({required this.phone, required this.countryCode});
+
+  final String phone;
+  final String countryCode;
+
+  factory AuthPhoneRequestOtp.fromJson(Map<String, dynamic> json) => AuthPhoneRequestOtp(
+        phone: json['phone'] as String,
+        countryCode: json['countryCode'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'phone': phone,
+        'countryCode': countryCode,
+      };
+}
+
+class AuthPhoneRequestOtpResponse {
+  const AuthPhoneRequestOtpResponse({required this.requestId, required this.expiresIn, this.debugCode});
+
+  final String requestId;
+  final int expiresIn;
+  final String? debugCode;
+
+  factory AuthPhoneRequestOtpResponse.fromJson(Map<String, dynamic> json) => AuthPhoneRequestOtpResponse(
+        requestId: json['requestId'] as String,
+        expiresIn: json['expiresIn'] as int,
+        debugCode: json['debugCode'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'requestId': requestId,
+        'expiresIn': expiresIn,
+        if (debugCode != null) 'debugCode': debugCode,
+      };
+}
+
+class AuthPhoneVerifyRequest {
+  const AuthPhoneVerifyRequest({required this.requestId, required this.phone, required this.code});
+
+  final String requestId;
+  final String phone;
+  final String code;
+
+  factory AuthPhoneVerifyRequest.fromJson(Map<String, dynamic> json) => AuthPhoneVerifyRequest(
+        requestId: json['requestId'] as String,
+        phone: json['phone'] as String,
+        code: json['code'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'requestId': requestId,
+        'phone': phone,
+        'code': code,
+      };
+}
+
+class AuthPhoneVerifyResponseSuccess {
+  const AuthPhoneVerifyResponseSuccess({required this.token, required this.user});
+
+  final String token;
+  final AuthUser user;
+
+  factory AuthPhoneVerifyResponseSuccess.fromJson(Map<String, dynamic> json) => AuthPhoneVerifyResponseSuccess(
+        token: json['token'] as String,
+        user: AuthUser.fromJson(json['user'] as Map<String, dynamic>),
+      );
+
+  Map<String, dynamic> toJson() => {
+        'token': token,
+        'user': user.toJson(),
+      };
+}
+
+class AuthPhoneVerifyResponsePending {
+  const AuthPhoneVerifyResponsePending({required this.needsProfile, required this.verificationId});
+
+  final bool needsProfile;
+  final String verificationId;
+
+  factory AuthPhoneVerifyResponsePending.fromJson(Map<String, dynamic> json) => AuthPhoneVerifyResponsePending(
+        needsProfile: json['needsProfile'] as bool,
+        verificationId: json['verificationId'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'needsProfile': needsProfile,
+        'verificationId': verificationId,
+      };
+}
+
+class AuthCompletePhoneProfileRequest {
+  const AuthCompletePhoneProfileRequest({required this.phone, required this.verificationId, required this.nickname, required this.birthYear, required this.gender, this.region, this.headline, this.bio, this.avatarUri, this.adminOverride});
+
+  final String phone;
+  final String verificationId;
+  final String nickname;
+  final int birthYear;
+  final String gender;
+  final String? region;
+  final String? headline;
+  final String? bio;
+  final String? avatarUri;
+  final bool? adminOverride;
+
+  factory AuthCompletePhoneProfileRequest.fromJson(Map<String, dynamic> json) => AuthCompletePhoneProfileRequest(
+        phone: json['phone'] as String,
+        verificationId: json['verificationId'] as String,
+        nickname: json['nickname'] as String,
+        birthYear: json['birthYear'] as int,
+        gender: json['gender'] as String,
+        region: json['region'] as String?,
+        headline: json['headline'] as String?,
+        bio: json['bio'] as String?,
+        avatarUri: json['avatarUri'] as String?,
+        adminOverride: json['adminOverride'] as bool?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'phone': phone,
+        'verificationId': verificationId,
+        'nickname': nickname,
+        'birthYear': birthYear,
+        'gender': gender,
+        if (region != null) 'region': region,
+        if (headline != null) 'headline': headline,
+        if (bio != null) 'bio': bio,
+        if (avatarUri != null) 'avatarUri': avatarUri,
+        if (adminOverride != null) 'adminOverride': adminOverride,
+      };
+}
+
+class UserSummary {
+  const UserSummary({this.id, this.email, this.displayName, this.status, this.provider, this.pointsBalance, this.createdAt, this.profile, this.counts});
+
+  final String? id;
+  final String? email;
+  final String? displayName;
+  final String? status;
+  final String? provider;
+  final int? pointsBalance;
+  final String? createdAt;
+  final Map<String, dynamic>? profile;
+  final Map<String, dynamic>? counts;
+
+  factory UserSummary.fromJson(Map<String, dynamic> json) => UserSummary(
+        id: json['id'] as String?,
+        email: json['email'] as String?,
+        displayName: json['displayName'] as String?,
+        status: json['status'] as String?,
+        provider: json['provider'] as String?,
+        pointsBalance: json['pointsBalance'] as int?,
+        createdAt: json['createdAt'] as String?,
+        profile: json['profile'] == null ? null : json['profile'] as Map<String, dynamic>,
+        counts: json['counts'] == null ? null : json['counts'] as Map<String, dynamic>,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (id != null) 'id': id,
+        if (email != null) 'email': email,
+        if (displayName != null) 'displayName': displayName,
+        if (status != null) 'status': status,
+        if (provider != null) 'provider': provider,
+        if (pointsBalance != null) 'pointsBalance': pointsBalance,
+        if (createdAt != null) 'createdAt': createdAt,
+        if (profile != null) 'profile': profile,
+        if (counts != null) 'counts': counts,
+      };
+}
+
+class UsersMeResponse {
+  const UsersMeResponse({this.ok, this.data});
+
+  final bool? ok;
+  final UserSummary? data;
+
+  factory UsersMeResponse.fromJson(Map<String, dynamic> json) => UsersMeResponse(
+        ok: json['ok'] as bool?,
+        data: json['data'] == null ? null : UserSummary.fromJson(json['data'] as Map<String, dynamic>),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (data != null) 'data': data?.toJson(),
+      };
+}
+
+class UsersUpdateRequest {
+  const UsersUpdateRequest({this.displayName, this.nickname, this.bio, this.region1, this.region2, required this.interests, required this.marketingOptIn, this.headline, this.avatarUri});
+
+  final String? displayName;
+  final String? nickname;
+  final String? bio;
+  final String? region1;
+  final String? region2;
+  final dynamic interests;
+  final dynamic marketingOptIn;
+  final String? headline;
+  final String? avatarUri;
+
+  factory UsersUpdateRequest.fromJson(Map<String, dynamic> json) => UsersUpdateRequest(
+        displayName: json['displayName'] as String?,
+        nickname: json['nickname'] as String?,
+        bio: json['bio'] as String?,
+        region1: json['region1'] as String?,
+        region2: json['region2'] as String?,
+        interests: json['interests'],
+        marketingOptIn: json['marketingOptIn'],
+        headline: json['headline'] as String?,
+        avatarUri: json['avatarUri'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (displayName != null) 'displayName': displayName,
+        if (nickname != null) 'nickname': nickname,
+        if (bio != null) 'bio': bio,
+        if (region1 != null) 'region1': region1,
+        if (region2 != null) 'region2': region2,
+        'interests': interests,
+        'marketingOptIn': marketingOptIn,
+        if (headline != null) 'headline': headline,
+        if (avatarUri != null) 'avatarUri': avatarUri,
+      };
+}
+
+class UsersSearchResponse {
+  const UsersSearchResponse({this.ok, this.data});
+
+  final bool? ok;
+  final List<Map<String, dynamic>>? data;
+
+  factory UsersSearchResponse.fromJson(Map<String, dynamic> json) => UsersSearchResponse(
+        ok: json['ok'] as bool?,
+        data: json['data'] == null ? null : (json['data'] as List<dynamic>).map((e) => e as Map<String, dynamic>).toList(),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (data != null) 'data': data,
+      };
+}
+
+class AdminUsersListResponse {
+  const AdminUsersListResponse({this.ok, this.page, this.limit, this.total, this.totalPages, this.data});
+
+  final bool? ok;
+  final int? page;
+  final int? limit;
+  final int? total;
+  final int? totalPages;
+  final List<Map<String, dynamic>>? data;
+
+  factory AdminUsersListResponse.fromJson(Map<String, dynamic> json) => AdminUsersListResponse(
+        ok: json['ok'] as bool?,
+        page: json['page'] as int?,
+        limit: json['limit'] as int?,
+        total: json['total'] as int?,
+        totalPages: json['totalPages'] as int?,
+        data: json['data'] == null ? null : (json['data'] as List<dynamic>).map((e) => e as Map<String, dynamic>).toList(),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (page != null) 'page': page,
+        if (limit != null) 'limit': limit,
+        if (total != null) 'total': total,
+        if (totalPages != null) 'totalPages': totalPages,
+        if (data != null) 'data': data,
+      };
+}
+
+class AdminUserDetailResponse {
+  const AdminUserDetailResponse({this.ok, this.data});
+
+  final bool? ok;
+  final Map<String, dynamic>? data;
+
+  factory AdminUserDetailResponse.fromJson(Map<String, dynamic> json) => AdminUserDetailResponse(
+        ok: json['ok'] as bool?,
+        data: json['data'] == null ? null : json['data'] as Map<String, dynamic>,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (data != null) 'data': data,
+      };
+}
+
+class AdminUserStatusUpdate {
+  const AdminUserStatusUpdate({required this.status, this.expiresAt});
+
+  final String status;
+  final String? expiresAt;
+
+  factory AdminUserStatusUpdate.fromJson(Map<String, dynamic> json) => AdminUserStatusUpdate(
+        status: json['status'] as String,
+        expiresAt: json['expiresAt'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'status': status,
+        if (expiresAt != null) 'expiresAt': expiresAt,
+      };
+}
+
+class AdminUserNote {
+  const AdminUserNote({required this.note, this.authorId});
+
+  final String note;
+  final String? authorId;
+
+  factory AdminUserNote.fromJson(Map<String, dynamic> json) => AdminUserNote(
+        note: json['note'] as String,
+        authorId: json['authorId'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'note': note,
+        if (authorId != null) 'authorId': authorId,
+      };
+}
+
+class AdminUserAction {
+  const AdminUserAction({this.reason, this.performedBy, this.metadata});
+
+  final String? reason;
+  final String? performedBy;
+  final Map<String, dynamic>? metadata;
+
+  factory AdminUserAction.fromJson(Map<String, dynamic> json) => AdminUserAction(
+        reason: json['reason'] as String?,
+        performedBy: json['performedBy'] as String?,
+        metadata: json['metadata'] == null ? null : json['metadata'] as Map<String, dynamic>,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (reason != null) 'reason': reason,
+        if (performedBy != null) 'performedBy': performedBy,
+        if (metadata != null) 'metadata': metadata,
+      };
+}
+
+class CreatePostRequest {
+  const CreatePostRequest({required this.topicId, required this.content});
+
+  final String topicId;
+  final String content;
+
+  factory CreatePostRequest.fromJson(Map<String, dynamic> json) => CreatePostRequest(
+        topicId: json['topicId'] as String,
+        content: json['content'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'topicId': topicId,
+        'content': content,
+      };
+}
+
+class Post {
+  const Post({this.id, this.userId, this.topicId, this.content, this.createdAt});
+
+  final String? id;
+  final String? userId;
+  final String? topicId;
+  final String? content;
+  final String? createdAt;
+
+  factory Post.fromJson(Map<String, dynamic> json) => Post(
+        id: json['id'] as String?,
+        userId: json['userId'] as String?,
+        topicId: json['topicId'] as String?,
+        content: json['content'] as String?,
+        createdAt: json['createdAt'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (id != null) 'id': id,
+        if (userId != null) 'userId': userId,
+        if (topicId != null) 'topicId': topicId,
+        if (content != null) 'content': content,
+        if (createdAt != null) 'createdAt': createdAt,
+      };
+}
+
+class PaginatedPosts {
+  const PaginatedPosts({this.items, this.nextCursor, this.hasMore});
+
+  final List<Post>? items;
+  final String? nextCursor;
+  final bool? hasMore;
+
+  factory PaginatedPosts.fromJson(Map<String, dynamic> json) => PaginatedPosts(
+        items: json['items'] == null ? null : (json['items'] as List<dynamic>).map((e) => Post.fromJson(e as Map<String, dynamic>)).toList(),
+        nextCursor: json['nextCursor'] as String?,
+        hasMore: json['hasMore'] as bool?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (items != null) 'items': items?.map((e) => e.toJson()).toList(),
+        if (nextCursor != null) 'nextCursor': nextCursor,
+        if (hasMore != null) 'hasMore': hasMore,
+      };
+}
+
+class Topic {
+  const Topic({this.id, this.name, this.createdAt, this.postsCount});
+
+  final String? id;
+  final String? name;
+  final String? createdAt;
+  final int? postsCount;
+
+  factory Topic.fromJson(Map<String, dynamic> json) => Topic(
+        id: json['id'] as String?,
+        name: json['name'] as String?,
+        createdAt: json['createdAt'] as String?,
+        postsCount: json['postsCount'] as int?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (id != null) 'id': id,
+        if (name != null) 'name': name,
+        if (createdAt != null) 'createdAt': createdAt,
+        if (postsCount != null) 'postsCount': postsCount,
+      };
+}
+
+class DiscoverUser {
+  const DiscoverUser({this.id, this.email, this.displayName, this.gender, this.dob, this.region1, this.region2});
+
+  final String? id;
+  final String? email;
+  final String? displayName;
+  final String? gender;
+  final String? dob;
+  final String? region1;
+  final String? region2;
+
+  factory DiscoverUser.fromJson(Map<String, dynamic> json) => DiscoverUser(
+        id: json['id'] as String?,
+        email: json['email'] as String?,
+        displayName: json['displayName'] as String?,
+        gender: json['gender'] as String?,
+        dob: json['dob'] as String?,
+        region1: json['region1'] as String?,
+        region2: json['region2'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (id != null) 'id': id,
+        if (email != null) 'email': email,
+        if (displayName != null) 'displayName': displayName,
+        if (gender != null) 'gender': gender,
+        if (dob != null) 'dob': dob,
+        if (region1 != null) 'region1': region1,
+        if (region2 != null) 'region2': region2,
+      };
+}
+
+class FriendshipRequest {
+  const FriendshipRequest({required this.requesterId, required this.addresseeId});
+
+  final String requesterId;
+  final String addresseeId;
+
+  factory FriendshipRequest.fromJson(Map<String, dynamic> json) => FriendshipRequest(
+        requesterId: json['requesterId'] as String,
+        addresseeId: json['addresseeId'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'requesterId': requesterId,
+        'addresseeId': addresseeId,
+      };
+}
+
+class Friendship {
+  const Friendship({this.id, this.requesterId, this.addresseeId, this.status, this.createdAt, this.updatedAt});
+
+  final String? id;
+  final String? requesterId;
+  final String? addresseeId;
+  final String? status;
+  final String? createdAt;
+  final String? updatedAt;
+
+  factory Friendship.fromJson(Map<String, dynamic> json) => Friendship(
+        id: json['id'] as String?,
+        requesterId: json['requesterId'] as String?,
+        addresseeId: json['addresseeId'] as String?,
+        status: json['status'] as String?,
+        createdAt: json['createdAt'] as String?,
+        updatedAt: json['updatedAt'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (id != null) 'id': id,
+        if (requesterId != null) 'requesterId': requesterId,
+        if (addresseeId != null) 'addresseeId': addresseeId,
+        if (status != null) 'status': status,
+        if (createdAt != null) 'createdAt': createdAt,
+        if (updatedAt != null) 'updatedAt': updatedAt,
+      };
+}
+
+class ChatMessageRequest {
+  const ChatMessageRequest({required this.chatId, required this.senderId, required this.content});
+
+  final String chatId;
+  final String senderId;
+  final String content;
+
+  factory ChatMessageRequest.fromJson(Map<String, dynamic> json) => ChatMessageRequest(
+        chatId: json['chatId'] as String,
+        senderId: json['senderId'] as String,
+        content: json['content'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'chatId': chatId,
+        'senderId': senderId,
+        'content': content,
+      };
+}
+
+class ChatRoomRequest {
+  const ChatRoomRequest({required this.userAId, required this.userBId, this.title, this.category});
+
+  final String userAId;
+  final String userBId;
+  final String? title;
+  final String? category;
+
+  factory ChatRoomRequest.fromJson(Map<String, dynamic> json) => ChatRoomRequest(
+        userAId: json['userAId'] as String,
+        userBId: json['userBId'] as String,
+        title: json['title'] as String?,
+        category: json['category'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'userAId': userAId,
+        'userBId': userBId,
+        if (title != null) 'title': title,
+        if (category != null) 'category': category,
+      };
+}
+
+class ChatDirectRequest {
+  const ChatDirectRequest({required this.targetUserId});
+
+  final String targetUserId;
+
+  factory ChatDirectRequest.fromJson(Map<String, dynamic> json) => ChatDirectRequest(
+        targetUserId: json['targetUserId'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'targetUserId': targetUserId,
+      };
+}
+
+class PointProduct {
+  const PointProduct({this.id, this.productId, this.label, this.priceText, this.points, this.recommended, this.currency});
+
+  final String? id;
+  final String? productId;
+  final String? label;
+  final String? priceText;
+  final int? points;
+  final bool? recommended;
+  final String? currency;
+
+  factory PointProduct.fromJson(Map<String, dynamic> json) => PointProduct(
+        id: json['id'] as String?,
+        productId: json['productId'] as String?,
+        label: json['label'] as String?,
+        priceText: json['priceText'] as String?,
+        points: json['points'] as int?,
+        recommended: json['recommended'] as bool?,
+        currency: json['currency'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (id != null) 'id': id,
+        if (productId != null) 'productId': productId,
+        if (label != null) 'label': label,
+        if (priceText != null) 'priceText': priceText,
+        if (points != null) 'points': points,
+        if (recommended != null) 'recommended': recommended,
+        if (currency != null) 'currency': currency,
+      };
+}
+
+class ConfirmPurchaseRequest {
+  const ConfirmPurchaseRequest({required this.productId, required this.transactionId, required this.receipt, required this.platform});
+
+  final String productId;
+  final String transactionId;
+  final String receipt;
+  final String platform;
+
+  factory ConfirmPurchaseRequest.fromJson(Map<String, dynamic> json) => ConfirmPurchaseRequest(
+        productId: json['productId'] as String,
+        transactionId: json['transactionId'] as String,
+        receipt: json['receipt'] as String,
+        platform: json['platform'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'productId': productId,
+        'transactionId': transactionId,
+        'receipt': receipt,
+        'platform': platform,
+      };
+}
+
+class ConfirmPurchaseResponse {
+  const ConfirmPurchaseResponse({this.success, this.balance});
+
+  final bool? success;
+  final int? balance;
+
+  factory ConfirmPurchaseResponse.fromJson(Map<String, dynamic> json) => ConfirmPurchaseResponse(
+        success: json['success'] as bool?,
+        balance: json['balance'] as int?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (success != null) 'success': success,
+        if (balance != null) 'balance': balance,
+      };
+}
+
+class GiftItem {
+  const GiftItem({this.id, this.name, this.description, this.imageUrl, this.priceCents, this.currency});
+
+  final String? id;
+  final String? name;
+  final String? description;
+  final String? imageUrl;
+  final int? priceCents;
+  final String? currency;
+
+  factory GiftItem.fromJson(Map<String, dynamic> json) => GiftItem(
+        id: json['id'] as String?,
+        name: json['name'] as String?,
+        description: json['description'] as String?,
+        imageUrl: json['imageUrl'] as String?,
+        priceCents: json['priceCents'] as int?,
+        currency: json['currency'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (id != null) 'id': id,
+        if (name != null) 'name': name,
+        if (description != null) 'description': description,
+        if (imageUrl != null) 'imageUrl': imageUrl,
+        if (priceCents != null) 'priceCents': priceCents,
+        if (currency != null) 'currency': currency,
+      };
+}
+
+class LegalDocument {
+  const LegalDocument({this.slug, this.title, this.content});
+
+  final String? slug;
+  final String? title;
+  final String? content;
+
+  factory LegalDocument.fromJson(Map<String, dynamic> json) => LegalDocument(
+        slug: json['slug'] as String?,
+        title: json['title'] as String?,
+        content: json['content'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (slug != null) 'slug': slug,
+        if (title != null) 'title': title,
+        if (content != null) 'content': content,
+      };
+}
+
+class Announcement {
+  const Announcement({this.id, this.title, this.body, this.isActive, this.createdAt, this.startsAt, this.endsAt});
+
+  final String? id;
+  final String? title;
+  final String? body;
+  final bool? isActive;
+  final String? createdAt;
+  final String? startsAt;
+  final String? endsAt;
+
+  factory Announcement.fromJson(Map<String, dynamic> json) => Announcement(
+        id: json['id'] as String?,
+        title: json['title'] as String?,
+        body: json['body'] as String?,
+        isActive: json['isActive'] as bool?,
+        createdAt: json['createdAt'] as String?,
+        startsAt: json['startsAt'] as String?,
+        endsAt: json['endsAt'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (id != null) 'id': id,
+        if (title != null) 'title': title,
+        if (body != null) 'body': body,
+        if (isActive != null) 'isActive': isActive,
+        if (createdAt != null) 'createdAt': createdAt,
+        if (startsAt != null) 'startsAt': startsAt,
+        if (endsAt != null) 'endsAt': endsAt,
+      };
+}
+
+class AnnouncementCreate {
+  const AnnouncementCreate({required this.title, required this.body, this.isActive, this.startsAt, this.endsAt});
+
+  final String title;
+  final String body;
+  final bool? isActive;
+  final String? startsAt;
+  final String? endsAt;
+
+  factory AnnouncementCreate.fromJson(Map<String, dynamic> json) => AnnouncementCreate(
+        title: json['title'] as String,
+        body: json['body'] as String,
+        isActive: json['isActive'] as bool?,
+        startsAt: json['startsAt'] as String?,
+        endsAt: json['endsAt'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'title': title,
+        'body': body,
+        if (isActive != null) 'isActive': isActive,
+        if (startsAt != null) 'startsAt': startsAt,
+        if (endsAt != null) 'endsAt': endsAt,
+      };
+}
+
+class AnnouncementUpdate {
+  const AnnouncementUpdate({this.title, this.body, this.isActive, this.startsAt, this.endsAt});
+
+  final String? title;
+  final String? body;
+  final bool? isActive;
+  final String? startsAt;
+  final String? endsAt;
+
+  factory AnnouncementUpdate.fromJson(Map<String, dynamic> json) => AnnouncementUpdate(
+        title: json['title'] as String?,
+        body: json['body'] as String?,
+        isActive: json['isActive'] as bool?,
+        startsAt: json['startsAt'] as String?,
+        endsAt: json['endsAt'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (title != null) 'title': title,
+        if (body != null) 'body': body,
+        if (isActive != null) 'isActive': isActive,
+        if (startsAt != null) 'startsAt': startsAt,
+        if (endsAt != null) 'endsAt': endsAt,
+      };
+}
+
+class ReportItem {
+  const ReportItem({this.id, this.reason, this.status, this.createdAt});
+
+  final String? id;
+  final String? reason;
+  final String? status;
+  final String? createdAt;
+
+  factory ReportItem.fromJson(Map<String, dynamic> json) => ReportItem(
+        id: json['id'] as String?,
+        reason: json['reason'] as String?,
+        status: json['status'] as String?,
+        createdAt: json['createdAt'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (id != null) 'id': id,
+        if (reason != null) 'reason': reason,
+        if (status != null) 'status': status,
+        if (createdAt != null) 'createdAt': createdAt,
+      };
+}
+
+class MetricsSummary {
+  const MetricsSummary({this.users, this.posts, this.chats, this.reports, this.activeAnnouncements, this.bannedWords, this.activeSubscriptions});
+
+  final int? users;
+  final int? posts;
+  final int? chats;
+  final int? reports;
+  final int? activeAnnouncements;
+  final int? bannedWords;
+  final int? activeSubscriptions;
+
+  factory MetricsSummary.fromJson(Map<String, dynamic> json) => MetricsSummary(
+        users: json['users'] as int?,
+        posts: json['posts'] as int?,
+        chats: json['chats'] as int?,
+        reports: json['reports'] as int?,
+        activeAnnouncements: json['activeAnnouncements'] as int?,
+        bannedWords: json['bannedWords'] as int?,
+        activeSubscriptions: json['activeSubscriptions'] as int?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (users != null) 'users': users,
+        if (posts != null) 'posts': posts,
+        if (chats != null) 'chats': chats,
+        if (reports != null) 'reports': reports,
+        if (activeAnnouncements != null) 'activeAnnouncements': activeAnnouncements,
+        if (bannedWords != null) 'bannedWords': bannedWords,
+        if (activeSubscriptions != null) 'activeSubscriptions': activeSubscriptions,
+      };
+}
+
+class CommunityReport {
+  const CommunityReport({this.targetUserId, this.postId, required this.reason});
+
+  final String? targetUserId;
+  final String? postId;
+  final String reason;
+
+  factory CommunityReport.fromJson(Map<String, dynamic> json) => CommunityReport(
+        targetUserId: json['targetUserId'] as String?,
+        postId: json['postId'] as String?,
+        reason: json['reason'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (targetUserId != null) 'targetUserId': targetUserId,
+        if (postId != null) 'postId': postId,
+        'reason': reason,
+      };
+}
+
+class CommunityBlock {
+  const CommunityBlock({required this.blockedUserId});
+
+  final String blockedUserId;
+
+  factory CommunityBlock.fromJson(Map<String, dynamic> json) => CommunityBlock(
+        blockedUserId: json['blockedUserId'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'blockedUserId': blockedUserId,
+      };
+}
+
+class TranslateRequest {
+  const TranslateRequest({required this.text, required this.source, required this.target});
+
+  final String text;
+  final String source;
+  final String target;
+
+  factory TranslateRequest.fromJson(Map<String, dynamic> json) => TranslateRequest(
+        text: json['text'] as String,
+        source: json['source'] as String,
+        target: json['target'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'text': text,
+        'source': source,
+        'target': target,
+      };
+}
+
+class TranslateResponse {
+  const TranslateResponse({this.text, this.provider, this.mode, this.error});
+
+  final String? text;
+  final String? provider;
+  final String? mode;
+  final String? error;
+
+  factory TranslateResponse.fromJson(Map<String, dynamic> json) => TranslateResponse(
+        text: json['text'] as String?,
+        provider: json['provider'] as String?,
+        mode: json['mode'] as String?,
+        error: json['error'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (text != null) 'text': text,
+        if (provider != null) 'provider': provider,
+        if (mode != null) 'mode': mode,
+        if (error != null) 'error': error,
+      };
+}
+
+class HealthResponse {
+  const HealthResponse({this.ok, this.timestamp, this.components});
+
+  final bool? ok;
+  final String? timestamp;
+  final List<Map<String, dynamic>>? components;
+
+  factory HealthResponse.fromJson(Map<String, dynamic> json) => HealthResponse(
+        ok: json['ok'] as bool?,
+        timestamp: json['timestamp'] as String?,
+        components: json['components'] == null ? null : (json['components'] as List<dynamic>).map((e) => e as Map<String, dynamic>).toList(),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (timestamp != null) 'timestamp': timestamp,
+        if (components != null) 'components': components,
+      };
+}
+
+class AdminSetRoleRequest {
+  const AdminSetRoleRequest({required this.role});
+
+  final String role;
+
+  factory AdminSetRoleRequest.fromJson(Map<String, dynamic> json) => AdminSetRoleRequest(
+        role: json['role'] as String,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'role': role,
+      };
+}
+
+class RefundRequest {
+  const RefundRequest({required this.userId, required this.platform, required this.productId, required this.receiptId, this.reason});
+
+  final String userId;
+  final String platform;
+  final String productId;
+  final String receiptId;
+  final String? reason;
+
+  factory RefundRequest.fromJson(Map<String, dynamic> json) => RefundRequest(
+        userId: json['userId'] as String,
+        platform: json['platform'] as String,
+        productId: json['productId'] as String,
+        receiptId: json['receiptId'] as String,
+        reason: json['reason'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'userId': userId,
+        'platform': platform,
+        'productId': productId,
+        'receiptId': receiptId,
+        if (reason != null) 'reason': reason,
+      };
+}
+
+class FriendshipEnvelope {
+  const FriendshipEnvelope({this.ok, this.data});
+
+  final bool? ok;
+  final Friendship? data;
+
+  factory FriendshipEnvelope.fromJson(Map<String, dynamic> json) => FriendshipEnvelope(
+        ok: json['ok'] as bool?,
+        data: json['data'] == null ? null : Friendship.fromJson(json['data'] as Map<String, dynamic>),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (data != null) 'data': data?.toJson(),
+      };
+}
+
+class AnnouncementListEnvelope {
+  const AnnouncementListEnvelope({this.ok, this.data});
+
+  final bool? ok;
+  final List<Announcement>? data;
+
+  factory AnnouncementListEnvelope.fromJson(Map<String, dynamic> json) => AnnouncementListEnvelope(
+        ok: json['ok'] as bool?,
+        data: json['data'] == null ? null : (json['data'] as List<dynamic>).map((e) => Announcement.fromJson(e as Map<String, dynamic>)).toList(),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (data != null) 'data': data?.map((e) => e.toJson()).toList(),
+      };
+}
+
+class AnnouncementEnvelope {
+  const AnnouncementEnvelope({this.ok, this.data});
+
+  final bool? ok;
+  final Announcement? data;
+
+  factory AnnouncementEnvelope.fromJson(Map<String, dynamic> json) => AnnouncementEnvelope(
+        ok: json['ok'] as bool?,
+        data: json['data'] == null ? null : Announcement.fromJson(json['data'] as Map<String, dynamic>),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (data != null) 'data': data?.toJson(),
+      };
+}
+
+class ReportItemListEnvelope {
+  const ReportItemListEnvelope({this.ok, this.data});
+
+  final bool? ok;
+  final List<ReportItem>? data;
+
+  factory ReportItemListEnvelope.fromJson(Map<String, dynamic> json) => ReportItemListEnvelope(
+        ok: json['ok'] as bool?,
+        data: json['data'] == null ? null : (json['data'] as List<dynamic>).map((e) => ReportItem.fromJson(e as Map<String, dynamic>)).toList(),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (data != null) 'data': data?.map((e) => e.toJson()).toList(),
+      };
+}
+
+class InlineOkId {
+  const InlineOkId({this.ok, this.id});
+
+  final bool? ok;
+  final String? id;
+
+  factory InlineOkId.fromJson(Map<String, dynamic> json) => InlineOkId(
+        ok: json['ok'] as bool?,
+        id: json['id'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (id != null) 'id': id,
+      };
+}
+
+class PostAuthAppleRequest {
+  const PostAuthAppleRequest({required this.token, this.idToken, this.authorizationCode});
+
+  final String token;
+  final String? idToken;
+  final String? authorizationCode;
+
+  factory PostAuthAppleRequest.fromJson(Map<String, dynamic> json) => PostAuthAppleRequest(
+        token: json['token'] as String,
+        idToken: json['idToken'] as String?,
+        authorizationCode: json['authorizationCode'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        'token': token,
+        if (idToken != null) 'idToken': idToken,
+        if (authorizationCode != null) 'authorizationCode': authorizationCode,
+      };
+}
+
+class GetDiscoverResponse {
+  const GetDiscoverResponse({this.ok, this.data});
+
+  final bool? ok;
+  final List<DiscoverUser>? data;
+
+  factory GetDiscoverResponse.fromJson(Map<String, dynamic> json) => GetDiscoverResponse(
+        ok: json['ok'] as bool?,
+        data: json['data'] == null ? null : (json['data'] as List<dynamic>).map((e) => DiscoverUser.fromJson(e as Map<String, dynamic>)).toList(),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (data != null) 'data': data?.map((e) => e.toJson()).toList(),
+      };
+}
+
+class GetFriendshipsResponse {
+  const GetFriendshipsResponse({this.ok, this.data});
+
+  final bool? ok;
+  final List<Friendship>? data;
+
+  factory GetFriendshipsResponse.fromJson(Map<String, dynamic> json) => GetFriendshipsResponse(
+        ok: json['ok'] as bool?,
+        data: json['data'] == null ? null : (json['data'] as List<dynamic>).map((e) => Friendship.fromJson(e as Map<String, dynamic>)).toList(),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (data != null) 'data': data?.map((e) => e.toJson()).toList(),
+      };
+}
+
+class PostChatsRoomsResponse {
+  const PostChatsRoomsResponse({this.ok, this.id, this.userAId, this.userBId, this.title, this.category});
+
+  final bool? ok;
+  final String? id;
+  final String? userAId;
+  final String? userBId;
+  final String? title;
+  final String? category;
+
+  factory PostChatsRoomsResponse.fromJson(Map<String, dynamic> json) => PostChatsRoomsResponse(
+        ok: json['ok'] as bool?,
+        id: json['id'] as String?,
+        userAId: json['userAId'] as String?,
+        userBId: json['userBId'] as String?,
+        title: json['title'] as String?,
+        category: json['category'] as String?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (id != null) 'id': id,
+        if (userAId != null) 'userAId': userAId,
+        if (userBId != null) 'userBId': userBId,
+        if (title != null) 'title': title,
+        if (category != null) 'category': category,
+      };
+}
+
+class PostChatsDirectResponse {
+  const PostChatsDirectResponse({this.id, this.title, this.participants});
+
+  final String? id;
+  final String? title;
+  final List<Map<String, dynamic>>? participants;
+
+  factory PostChatsDirectResponse.fromJson(Map<String, dynamic> json) => PostChatsDirectResponse(
+        id: json['id'] as String?,
+        title: json['title'] as String?,
+        participants: json['participants'] == null ? null : (json['participants'] as List<dynamic>).map((e) => e as Map<String, dynamic>).toList(),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (id != null) 'id': id,
+        if (title != null) 'title': title,
+        if (participants != null) 'participants': participants,
+      };
+}
+
+class GetStorePointProductsResponse {
+  const GetStorePointProductsResponse({this.items});
+
+  final List<PointProduct>? items;
+
+  factory GetStorePointProductsResponse.fromJson(Map<String, dynamic> json) => GetStorePointProductsResponse(
+        items: json['items'] == null ? null : (json['items'] as List<dynamic>).map((e) => PointProduct.fromJson(e as Map<String, dynamic>)).toList(),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (items != null) 'items': items?.map((e) => e.toJson()).toList(),
+      };
+}
+
+class GetGiftsResponse {
+  const GetGiftsResponse({this.ok, this.data, this.items});
+
+  final bool? ok;
+  final List<GiftItem>? data;
+  final List<GiftItem>? items;
+
+  factory GetGiftsResponse.fromJson(Map<String, dynamic> json) => GetGiftsResponse(
+        ok: json['ok'] as bool?,
+        data: json['data'] == null ? null : (json['data'] as List<dynamic>).map((e) => GiftItem.fromJson(e as Map<String, dynamic>)).toList(),
+        items: json['items'] == null ? null : (json['items'] as List<dynamic>).map((e) => GiftItem.fromJson(e as Map<String, dynamic>)).toList(),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (data != null) 'data': data?.map((e) => e.toJson()).toList(),
+        if (items != null) 'items': items?.map((e) => e.toJson()).toList(),
+      };
+}
+
+class DeleteAdminAnnouncementsByIdResponse {
+  const DeleteAdminAnnouncementsByIdResponse({this.ok});
+
+  final bool? ok;
+
+  factory DeleteAdminAnnouncementsByIdResponse.fromJson(Map<String, dynamic> json) => DeleteAdminAnnouncementsByIdResponse(
+        ok: json['ok'] as bool?,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+      };
+}
+
+class GetMetricsResponse {
+  const GetMetricsResponse({this.ok, this.data});
+
+  final bool? ok;
+  final MetricsSummary? data;
+
+  factory GetMetricsResponse.fromJson(Map<String, dynamic> json) => GetMetricsResponse(
+        ok: json['ok'] as bool?,
+        data: json['data'] == null ? null : MetricsSummary.fromJson(json['data'] as Map<String, dynamic>),
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (data != null) 'data': data?.toJson(),
+      };
+}
+
+class GetMetricsDashboardResponse {
+  const GetMetricsDashboardResponse({this.ok, this.data});
+
+  final bool? ok;
+  final Map<String, dynamic>? data;
+
+  factory GetMetricsDashboardResponse.fromJson(Map<String, dynamic> json) => GetMetricsDashboardResponse(
+        ok: json['ok'] as bool?,
+        data: json['data'] == null ? null : json['data'] as Map<String, dynamic>,
+      );
+
+  Map<String, dynamic> toJson() => {
+        if (ok != null) 'ok': ok,
+        if (data != null) 'data': data,
+      };
+}